@@ -5,12 +5,16 @@ defaults (``env("SECRET_KEY")`` etc.), and the project keeps real values in a
 gitignored ``.env``. Under pytest there is no ``.env``, so we provide safe dummy
 values here -- at import time, before pytest-django loads the settings module.
 
+It also holds the helpers shared by the test modules (``create_event``).
+
 ``DEBUG=True`` puts settings in local/dev mode: sqlite database, django-compressor
 disabled (templates render without an offline manifest), and no ``Secure`` cookie
 flags (which would otherwise be dropped over the test client's plain HTTP).
 """
 
 import os
+import tempfile
+from datetime import date, timedelta
 
 _TEST_ENV_DEFAULTS = {
     "DEBUG": "True",
@@ -25,7 +29,37 @@ _TEST_ENV_DEFAULTS = {
     "SLACK_REGISTRATIONS_WEBHOOK": "",
     "SENTRY_DSN": "",
     "DEFAULT_FROM_EMAIL": "test@example.com",
+    # A cache of its own for each test run
+    "CACHE_PATH": os.path.join(tempfile.mkdtemp(prefix="dds-test-cache-"), "cache.sqlite3"),
 }
 
 for _key, _value in _TEST_ENV_DEFAULTS.items():
     os.environ.setdefault(_key, _value)
+
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Cached summaries and lookups are keyed by ids, which the test database reuses after each rollback."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+
+
+def create_event(code: str, **fields):
+    """An event open for registration from yesterday to tomorrow; ``fields`` override the defaults."""
+    from dds_registration.models import Event
+
+    today = date.today()
+    values = {
+        "title": code,
+        "description": "-",
+        "success_email": "-",
+        "registration_open": today - timedelta(days=1),
+        "registration_close": today + timedelta(days=1),
+    }
+    values.update(fields)
+    return Event.objects.create(code=code, **values)
@@ -341,6 +341,8 @@ class PaymentAdmin(admin.ModelAdmin):
         "created",
         "updated",
     ]
+    # Indexed copies of the data keys
+    list_filter = ["status", "data_kind", "data_method", "data_currency"]
     actions = [
         "mark_invoice_paid",
         "email_invoices",
@@ -10,8 +10,13 @@ class RegConfig(AppConfig):
         from django.conf import settings
         from djf_surveys.app_settings import SURVEY_FIELD_VALIDATORS
 
+        from . import signals  # noqa: F401 (connects the receivers)
+        from . import tasks  # noqa: F401 (registers the periodic tasks)
+
         if settings.STRIPE_SECRET_KEY:
             stripe.api_key = settings.STRIPE_SECRET_KEY
+        if settings.STRIPE_API_BASE:
+            stripe.api_base = settings.STRIPE_API_BASE
 
         SURVEY_FIELD_VALIDATORS["min_length"]["text_area"] = 3
         SURVEY_FIELD_VALIDATORS["max_length"].update(
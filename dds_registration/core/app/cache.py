@@ -0,0 +1,215 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed);
+"""
+
+NOT_EXPIRED = "(expires IS NULL OR expires > ?)"
+
+
+class SQLiteCache(BaseCache):
+    """
+    Cache in a SQLite file, shared by all the worker processes of the host (used in the settings, see `CACHES`).
+
+    Each write is a single statement or an `IMMEDIATE` transaction, so `add` and `incr` are atomic across processes
+    (the waiting room and the invalidation versions rely on it). Past `MAX_ENTRIES`, expired entries and then the
+    least recently used ones (1/`CULL_FREQUENCY` of them) are dropped.
+
+    `get_or_set` protects against stampedes: on a miss one caller computes the value while the others wait for it
+    (up to `STAMPEDE_TIMEOUT` seconds, then they compute it themselves).
+
+    Extra `OPTIONS`:
+    - `BUSY_TIMEOUT`: seconds to wait for a write lock (default 5);
+    - `CULL_INTERVAL`: check the number of entries every that many writes of a process (default 50);
+    - `ACCESS_RESOLUTION`: seconds between two updates of an entry's last access time (default 10);
+    - `STAMPEDE_TIMEOUT`: see above (default 10).
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.path = str(location)
+        self.busy_timeout = options.get("BUSY_TIMEOUT", 5)
+        self.cull_interval = options.get("CULL_INTERVAL", 50)
+        self.access_resolution = options.get("ACCESS_RESOLUTION", 10)
+        self.stampede_timeout = options.get("STAMPEDE_TIMEOUT", 10)
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # One connection per thread, opened again in forked workers
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            local.connection, local.pid, local.writes = connection, os.getpid(), 0
+        return local.connection
+
+    def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
+        # None (never expires) or an absolute time
+        if timeout == DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        return None if timeout is None else time.time() + timeout
+
+    def _write(self, sql: str, params=()) -> int:
+        cursor = self.connection.execute(sql, params)
+        self._wrote()
+        return cursor.rowcount
+
+    def _wrote(self):
+        local = self._local
+        local.writes += 1
+        if local.writes % self.cull_interval == 0:
+            self._cull()
+
+    def _cull(self):
+        now = time.time()
+        connection = self.connection
+        connection.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+        (count,) = connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if count <= self._max_entries:
+            return
+        if not self._cull_frequency:
+            connection.execute("DELETE FROM cache")
+            return
+        connection.execute(
+            "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed LIMIT ?)",
+            (count // self._cull_frequency,),
+        )
+
+    def _fetch(self, keys: list[str]) -> dict:
+        now = time.time()
+        placeholders = ", ".join("?" * len(keys))
+        rows = self.connection.execute(
+            f"SELECT key, value, accessed FROM cache WHERE key IN ({placeholders}) AND {NOT_EXPIRED}", (*keys, now)
+        ).fetchall()
+        touched = [key for key, _value, accessed in rows if now - accessed > self.access_resolution]
+        if touched:
+            placeholders = ", ".join("?" * len(touched))
+            try:
+                self.connection.execute(f"UPDATE cache SET accessed = ? WHERE key IN ({placeholders})", (now, *touched))
+            except sqlite3.OperationalError:
+                # Busy: the access time is only used to pick entries to cull
+                pass
+        return {key: pickle.loads(value) for key, value, _accessed in rows}
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._fetch([key]).get(key, default)
+
+    def get_many(self, keys, version=None):
+        made = {self.make_and_validate_key(key, version=version): key for key in keys}
+        if not made:
+            return {}
+        return {made[key]: value for key, value in self._fetch(list(made)).items()}
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._write(
+            "INSERT INTO cache (key, value, expires, accessed) VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+            "value = excluded.value, expires = excluded.expires, accessed = excluded.accessed",
+            (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), self.get_backend_timeout(timeout), time.time()),
+        )
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        for key, value in data.items():
+            self.set(key, value, timeout, version=version)
+        return []
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        # One statement: only inserts, or replaces an expired entry
+        return bool(
+            self._write(
+                "INSERT INTO cache (key, value, expires, accessed) VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, expires = excluded.expires, accessed = excluded.accessed "
+                "WHERE cache.expires <= ?",
+                (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), self.get_backend_timeout(timeout), now, now),
+            )
+        )
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                f"SELECT value FROM cache WHERE key = ? AND {NOT_EXPIRED}", (key, time.time())
+            ).fetchone()
+            if row is None:
+                raise ValueError("Key '%s' not found" % key)
+            value = pickle.loads(row[0]) + delta
+            connection.execute(
+                "UPDATE cache SET value = ? WHERE key = ?", (pickle.dumps(value, pickle.HIGHEST_PROTOCOL), key)
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return value
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return bool(
+            self._write(
+                f"UPDATE cache SET expires = ? WHERE key = ? AND {NOT_EXPIRED}",
+                (self.get_backend_timeout(timeout), key, time.time()),
+            )
+        )
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self.connection.execute(f"SELECT 1 FROM cache WHERE key = ? AND {NOT_EXPIRED}", (key, time.time()))
+        return bool(row.fetchone())
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return bool(self._write("DELETE FROM cache WHERE key = ?", (key,)))
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if keys:
+            self._write(f"DELETE FROM cache WHERE key IN ({', '.join('?' * len(keys))})", keys)
+
+    def clear(self):
+        self.connection.execute("DELETE FROM cache")
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, version=None):
+        missing = object()
+        value = self.get(key, missing, version=version)
+        if value is not missing:
+            return value
+        lock = f"{key}:computing"
+        deadline = time.monotonic() + self.stampede_timeout
+        locked = self.add(lock, 1, self.stampede_timeout, version=version)
+        while not locked and time.monotonic() < deadline:
+            # Another caller is computing it: wait for the value
+            time.sleep(0.05)
+            value = self.get(key, missing, version=version)
+            if value is not missing:
+                return value
+            locked = self.add(lock, 1, self.stampede_timeout, version=version)
+        try:
+            value = default() if callable(default) else default
+            self.set(key, value, timeout, version=version)
+        finally:
+            if locked:
+                self.delete(lock, version=version)
+        return value
@@ -0,0 +1,157 @@
+# @module cache_invalidation
+# @changed 2026.10.19
+
+# Cache invalidation driven by model signals.
+#
+# A cached value declares which models it depends on, with a function returning its cache keys for a changed
+# instance:
+#
+#     @invalidate_on_change(Event, previous=True)
+#     def event_keys(event):
+#         return [get_event_cache_key(event.code)]
+#
+# The keys are dropped on `post_save`, `post_delete` and `m2m_changed` (for the `m2m` through models), right away
+# and again once the transaction commits: a request reading the old rows in between would otherwise cache them
+# again. With `previous=True` the keys of the stored row are dropped too (an event whose code changes).
+#
+# Values that depend on many rows use a `KeyNamespace`: returning the namespace from a keys function bumps its
+# version, which changes all of its keys at once (the old entries are left to expire).
+#
+# `assert_no_stale_reads` checks, in tests, that a cached read sees a change as soon as it's committed.
+
+import time
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+
+
+class KeyNamespace:
+    """A group of cache keys sharing a version number: `bump()` drops them all"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.version_key = f"version:{name}"
+
+    @property
+    def version(self) -> int:
+        # Seeded with the time: a version lost to eviction never starts over at a number older entries still use
+        return cache.get_or_set(self.version_key, time.time_ns, None)
+
+    def key(self, *parts) -> str:
+        return ":".join(map(str, [self.name, f"v{self.version}", *parts]))
+
+    def bump(self):
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            # Not set (or evicted): a new seed, never used for keys before
+            cache.set(self.version_key, time.time_ns(), None)
+
+    def __repr__(self):
+        return f"KeyNamespace({self.name!r})"
+
+
+def forget_cache_keys(keys):
+    """Drop cache keys (strings) and bump namespaces (`KeyNamespace`)"""
+    keys = list(keys)
+    cache.delete_many({key for key in keys if isinstance(key, str)})
+    for namespace in {key for key in keys if isinstance(key, KeyNamespace)}:
+        namespace.bump()
+
+
+def forget_cache_keys_on_commit(keys):
+    """Now, for the rest of this request, and again once committed"""
+    keys = [key for key in keys if key]
+    if keys:
+        forget_cache_keys(keys)
+        transaction.on_commit(lambda: forget_cache_keys(keys))
+
+
+def invalidate_on_change(*senders: type[models.Model], m2m=(), previous: bool = False):
+    """
+    Decorator: drop the cache keys `keys_for(instance)` returns when an instance of one of `senders` is saved or
+    deleted, or one of its `m2m` relations (through models) changes.
+    """
+
+    def register(keys_for):
+        previous_keys_attribute = f"_cache_keys_before_save_{keys_for.__name__}"
+
+        def forget_saved(sender, instance, raw=False, **kwargs):
+            forget_cache_keys_on_commit([*keys_for(instance), *getattr(instance, previous_keys_attribute, [])])
+
+        def forget_deleted(sender, instance, **kwargs):
+            forget_cache_keys_on_commit(keys_for(instance))
+
+        def remember_previous(sender, instance, raw=False, **kwargs):
+            stored = None
+            if not raw and not instance._state.adding:
+                stored = sender._default_manager.filter(pk=instance.pk).first()
+            setattr(instance, previous_keys_attribute, list(keys_for(stored)) if stored else [])
+
+        def forget_related(sender, instance, action, reverse, model, pk_set, **kwargs):
+            if action not in ("post_add", "post_remove", "post_clear"):
+                return
+            if isinstance(instance, senders):
+                instances = [instance]
+            elif model in senders and pk_set:
+                instances = model._default_manager.filter(pk__in=pk_set)
+            else:
+                return
+            forget_cache_keys_on_commit([key for changed in instances for key in keys_for(changed)])
+
+        uid = f"{keys_for.__module__}.{keys_for.__qualname__}"
+        for sender in senders:
+            post_save.connect(forget_saved, sender=sender, weak=False, dispatch_uid=f"{uid}:save")
+            post_delete.connect(forget_deleted, sender=sender, weak=False, dispatch_uid=f"{uid}:delete")
+            if previous:
+                pre_save.connect(remember_previous, sender=sender, weak=False, dispatch_uid=f"{uid}:previous")
+        for through in m2m:
+            m2m_changed.connect(forget_related, sender=through, weak=False, dispatch_uid=f"{uid}:m2m")
+        return keys_for
+
+    return register
+
+
+def freeze(value, seen=None):
+    """
+    Comparable snapshot of a cached value. Model instances compare by pk alone: they're taken by their field values,
+    with the related objects and prefetched lists loaded along.
+    """
+    seen = seen if seen is not None else set()
+    if isinstance(value, models.Model):
+        if id(value) in seen:
+            return (type(value), value.pk)
+        seen.add(id(value))
+        fields = [(field.attname, field.value_from_object(value)) for field in value._meta.concrete_fields]
+        related = sorted(value._state.fields_cache.items()) + sorted(
+            getattr(value, "_prefetched_objects_cache", {}).items()
+        )
+        return (type(value), freeze(fields, seen), freeze(related, seen))
+    if isinstance(value, dict):
+        return {key: freeze(item, seen) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, models.QuerySet)):
+        return [freeze(item, seen) for item in value]
+    return value
+
+
+def assert_no_stale_reads(testcase, read, load, change):
+    """
+    In a `TestCase`: warm the cache with `read()`, `change()` the data and commit, then check that `read()` gives
+    what `load()` (uncached) gives, and that the change was visible to it.
+    """
+    before = freeze(read())
+    with testcase.captureOnCommitCallbacks(execute=True):
+        change()
+    expected = freeze(load())
+    testcase.assertNotEqual(before, expected, "The change doesn't affect the cached value")
+    testcase.assertEqual(freeze(read()), expected, "Stale cached value")
+
+
+__all__ = [
+    KeyNamespace,
+    invalidate_on_change,
+    forget_cache_keys,
+    forget_cache_keys_on_commit,
+    assert_no_stale_reads,
+]
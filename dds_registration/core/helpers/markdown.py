@@ -0,0 +1,37 @@
+# @module markdown
+# @changed 2026.10.19
+
+# Markdown texts (event descriptions) rendered to sanitized HTML, as the `markdownify` template filter does (with the
+# `MARKDOWNIFY` settings). The HTML is stored with the event when it's saved (`Event.description_html`); texts
+# rendered on the fly are kept in the shared cache by content hash, so each version of a text is rendered once.
+
+import hashlib
+
+from django.core.cache import cache
+from django.utils.safestring import SafeString, mark_safe
+from markdownify.templatetags.markdownify import markdownify
+
+MARKDOWN_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def get_markdown_hash(text: str | None) -> str:
+    return hashlib.sha256((text or "").encode()).hexdigest()
+
+
+def markdown_to_html(text: str | None) -> SafeString:
+    """Render now, uncached"""
+    return markdownify(text or "")
+
+
+def render_markdown(text: str | None) -> SafeString:
+    html = cache.get_or_set(
+        f"markdown:{get_markdown_hash(text)}", lambda: str(markdown_to_html(text)), MARKDOWN_CACHE_TIMEOUT
+    )
+    return mark_safe(html)
+
+
+__all__ = [
+    get_markdown_hash,
+    markdown_to_html,
+    render_markdown,
+]
@@ -0,0 +1,71 @@
+# @module periodic_tasks
+# @changed 2026.10.19
+
+# The app's scheduler for maintenance tasks: `manage.py run_periodic_tasks`, started every few minutes (cron, a
+# systemd timer...), runs the registered tasks whose interval has passed since their last run.
+#
+#     @periodic_task(24 * 60 * 60)
+#     def clear_sessions():
+#         ...
+#
+# A run is claimed in the cache (`cache.add`, for the task's interval), so each task runs once per interval even if
+# runs overlap. The cache is the host's own SQLite file, so that holds per host: start the runner on one host only.
+# A task that fails is released, to be tried again by the next run.
+
+from dataclasses import dataclass
+from typing import Callable
+
+from django.core.cache import cache
+from loguru import logger
+
+
+@dataclass
+class PeriodicTask:
+    name: str
+    interval: int  # seconds
+    run: Callable[[], object]
+
+
+PERIODIC_TASKS: dict[str, PeriodicTask] = {}
+
+
+def periodic_task(interval: int, name: str | None = None):
+    """Decorator: register a function to run every `interval` seconds"""
+
+    def register(run):
+        task = PeriodicTask(name or run.__name__, interval, run)
+        PERIODIC_TASKS[task.name] = task
+        return run
+
+    return register
+
+
+def get_periodic_task_cache_key(name: str) -> str:
+    return f"periodic-task:{name}"
+
+
+def run_due_tasks(force: bool = False) -> list[str]:
+    """Run the due tasks (all of them with `force`), return the names of the ones that ran"""
+    ran = []
+    for task in PERIODIC_TASKS.values():
+        key = get_periodic_task_cache_key(task.name)
+        if force:
+            cache.set(key, True, task.interval)
+        elif not cache.add(key, True, task.interval):
+            continue
+        try:
+            task.run()
+        except Exception:
+            cache.delete(key)
+            logger.exception(f"Periodic task {task.name} failed")
+            continue
+        ran.append(task.name)
+    return ran
+
+
+__all__ = [
+    PeriodicTask,
+    PERIODIC_TASKS,
+    periodic_task,
+    run_due_tasks,
+]
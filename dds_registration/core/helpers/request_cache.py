@@ -0,0 +1,36 @@
+# @module request_cache
+# @changed 2026.10.19
+
+# Per-request memoization of repeated lookups (`User.is_member` from several templates and views...).
+# `RequestCacheMiddleware` opens a fresh scope for each request and drops it at the end; outside a request scope
+# (management commands, shell) nothing is memoized.
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_request_cache: ContextVar[dict | None] = ContextVar("request_cache", default=None)
+
+
+@contextmanager
+def request_cache_scope():
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def request_cached(key, load):
+    """Return the value remembered for `key` in this request, or `load()` it (once)"""
+    values = _request_cache.get()
+    if values is None:
+        return load()
+    if key not in values:
+        values[key] = load()
+    return values[key]
+
+
+def forget_request_cached(key):
+    values = _request_cache.get()
+    if values is not None:
+        values.pop(key, None)
@@ -0,0 +1,85 @@
+# @module single_flight
+# @changed 2026.10.19
+
+# Request coalescing: when several callers need the same expensive result at the same time (a PDF opened from many
+# clients, the event listing on an announcement), one of them computes it and the others wait for it and reuse it.
+#
+# Callers of one process wait on the first one's flight; other workers see a lock in the shared cache and wait for
+# the result it leaves there (for `SINGLE_FLIGHT_KEEP` seconds). Only concurrent callers share a result: a caller
+# that finds no flight in progress computes it again. If the computation fails, or takes longer than `wait`, the
+# waiting callers compute it themselves.
+
+import threading
+import time
+
+from django.core.cache import cache
+
+SINGLE_FLIGHT_WAIT = 30
+SINGLE_FLIGHT_KEEP = 5
+SINGLE_FLIGHT_POLL = 0.05
+
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.failed = True
+        self.result = None
+
+
+_flights: dict[str, Flight] = {}
+_flights_lock = threading.Lock()
+
+
+def single_flight(key: str, compute, wait: float = SINGLE_FLIGHT_WAIT):
+    """Return `compute()`, or the result of a concurrent call with the same `key`"""
+    with _flights_lock:
+        flight = _flights.get(key)
+        leading = flight is None
+        if leading:
+            flight = _flights[key] = Flight()
+    if not leading:
+        if flight.done.wait(wait) and not flight.failed:
+            return flight.result
+        return compute()
+    try:
+        flight.result = coalesce_across_workers(key, compute, wait)
+        flight.failed = False
+        return flight.result
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+
+
+def coalesce_across_workers(key: str, compute, wait: float):
+    lock_key = f"single-flight:{key}:lock"
+    result_key = f"single-flight:{key}:result"
+    missing = object()
+    deadline = time.monotonic() + wait
+    locked = cache.add(lock_key, 1, wait)
+    while not locked and time.monotonic() < deadline:
+        # Computed by another worker: the result is stored before the lock is released
+        time.sleep(SINGLE_FLIGHT_POLL)
+        result = cache.get(result_key, missing)
+        if result is not missing:
+            return result
+        locked = cache.add(lock_key, 1, wait)
+        if locked:
+            # Released between the two calls
+            result = cache.get(result_key, missing)
+            if result is not missing:
+                cache.delete(lock_key)
+                return result
+    try:
+        result = compute()
+        if locked:
+            cache.set(result_key, result, SINGLE_FLIGHT_KEEP)
+        return result
+    finally:
+        if locked:
+            cache.delete(lock_key)
+
+
+__all__ = [
+    single_flight,
+]
@@ -0,0 +1,7 @@
+# @module dds_registration/loadtest
+# Local end-to-end load test for the signup, event registration and payment flows.
+#
+# - `stubs.py`: stand-ins for Gmail, Stripe and Slack (a tiny local HTTP server).
+# - `settings.py`: Django settings pointing the app at those stand-ins.
+# - `dataset.py`: synthetic users, events, options and registrations.
+# - `run.py`: the driver; `python -m dds_registration.loadtest --help`.
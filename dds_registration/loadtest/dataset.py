@@ -0,0 +1,196 @@
+# @module dds_registration/loadtest/dataset.py
+# Synthetic data set for the load test and the view benchmarks.
+
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from ..models import Event, Membership, Payment, Registration, RegistrationOption, User
+
+# Prefix of every object created here, so a data set can be told apart (and removed)
+PREFIX = "loadtest"
+
+# The capped, paid school the load test registers for (a "popular school opening")
+SCHOOL_CODE = f"{PREFIX}-school"
+
+PASSWORD = "loadtest-password-1234"
+
+
+def _event(code: str, title: str, open_in_days: int, close_in_days: int, **kwargs) -> Event:
+    today = date.today()
+    return Event(
+        code=code,
+        title=title,
+        description=(
+            f"## {title}\n\nSynthetic event for the load test. "
+            "Lorem ipsum *dolor* sit amet, consectetur adipiscing elit.\n\n"
+            "- Daily lectures and exercises\n- Evening sessions\n- [Programme](https://www.d-d-s.ch/)\n"
+        ),
+        success_email=f"Thanks for registering for {title}!",
+        registration_open=today + timedelta(days=open_in_days),
+        registration_close=today + timedelta(days=close_in_days),
+        **kwargs,
+    )
+
+
+def remove_dataset():
+    """Remove all the objects created by `build_dataset`"""
+    Payment.objects.filter(registration__event__code__startswith=PREFIX).delete()
+    Payment.objects.filter(data__user__name__startswith=PREFIX).delete()
+    Event.objects.filter(code__startswith=PREFIX).delete()
+    User.objects.filter(email__startswith=PREFIX).delete()
+
+
+@transaction.atomic
+def build_dataset(
+    users: int = 200,
+    events: int = 8,
+    registrations_per_event: int = 25,
+    school_capacity: int = 500,
+    seed: int = 1,
+) -> dict:
+    """Create a reproducible synthetic data set and return a summary of it.
+
+    - `users` active users (`loadtest-user-<n>@example.com`, password `PASSWORD`),
+      about a third of them with a membership;
+    - the capped, paid `SCHOOL_CODE` event with three options (one capped);
+    - `events` more public events: open paid, open free, open with VAT, and
+      some which are closed or not yet open;
+    - up to `registrations_per_event` registrations per event, some of them
+      cancelled/withdrawn, most with an invoice or Stripe payment.
+
+    Any data set created before is removed first.
+    """
+    rnd = random.Random(seed)
+    remove_dataset()
+
+    password = make_password(PASSWORD)
+    user_objs = User.objects.bulk_create(
+        [
+            User(
+                username=f"{PREFIX}-user-{n}@example.com",
+                email=f"{PREFIX}-user-{n}@example.com",
+                first_name="Load",
+                last_name=f"Tester {n}",
+                address=f"Teststrasse {n}\n8000 Zürich\nSwitzerland",
+                password=password,
+            )
+            for n in range(users)
+        ]
+    )
+    Membership.objects.bulk_create(
+        [
+            Membership(user=user, membership_type=rnd.choice(("NORMAL", "ACADEMIC")), mailing_list=True)
+            for user in user_objs
+            if rnd.random() < 0.33
+        ]
+    )
+
+    event_objs = [
+        _event(
+            SCHOOL_CODE,
+            "Load test autumn school",
+            open_in_days=0,
+            close_in_days=30,
+            max_participants=school_capacity,
+        )
+    ]
+    for n in range(events):
+        kind = n % 4
+        if kind == 0:
+            event_objs.append(_event(f"{PREFIX}-paid-{n}", f"Load test paid event {n}", -10, 20))
+        elif kind == 1:
+            event_objs.append(_event(f"{PREFIX}-free-{n}", f"Load test free event {n}", -10, 20, free=True))
+        elif kind == 2:
+            event_objs.append(
+                _event(
+                    f"{PREFIX}-vat-{n}",
+                    f"Load test VAT event {n}",
+                    -10,
+                    20,
+                    credit_cards=False,
+                    vat_rate=0.081,
+                    members_only=bool(n % 8 == 2),
+                )
+            )
+        else:
+            # Closed or not yet open: listed nowhere but still queried by the index page
+            offset = rnd.choice((-60, 40))
+            event_objs.append(_event(f"{PREFIX}-closed-{n}", f"Load test closed event {n}", offset, offset + 10))
+    for event in event_objs:
+        event.save()
+
+    option_objs = []
+    for event in event_objs:
+        if event.free:
+            continue
+        option_objs.extend(
+            [
+                RegistrationOption(event=event, item="Academic", price=450, currency="EUR"),
+                RegistrationOption(event=event, item="Industry", price=900, currency="EUR"),
+                RegistrationOption(
+                    event=event,
+                    item="Shared double room",
+                    price=1224,
+                    currency="CHF",
+                    includes_membership=True,
+                    max_participants=max(1, (event.max_participants or registrations_per_event) // 5),
+                ),
+            ]
+        )
+    RegistrationOption.objects.bulk_create(option_objs)
+    options_by_event = {}
+    for option in option_objs:
+        options_by_event.setdefault(option.event_id, []).append(option)
+
+    registration_count = 0
+    for event in event_objs:
+        attendees = rnd.sample(user_objs, min(len(user_objs), registrations_per_event))
+        options = options_by_event.get(event.id, [])
+        for user in attendees:
+            status = rnd.choices(("REGISTERED", "PAYMENT_PENDING", "WITHDRAWN", "CANCELLED"), weights=(6, 3, 1, 1))[0]
+            registration = Registration(
+                event=event,
+                user=user,
+                status="REGISTERED" if event.free and status == "PAYMENT_PENDING" else status,
+                option=rnd.choice(options) if options else None,
+            )
+            registration.save()
+            registration_count += 1
+            if not registration.option:
+                continue
+            method = rnd.choice(("INVOICE", "STRIPE"))
+            payment = Payment(
+                status="PAID" if status == "REGISTERED" else ("ISSUED" if method == "INVOICE" else "CREATED"),
+                data={
+                    "user": {"id": user.id, "name": f"{PREFIX} {user.get_full_name()}", "address": user.address},
+                    "extra": "",
+                    "kind": "event",
+                    "method": method,
+                    "event": {"id": event.id, "title": event.title, "vat_rate": event.vat_rate},
+                    "registration": {"id": registration.id},
+                    "option": {"id": registration.option.id, "item": registration.option.item},
+                    "price": registration.option.price,
+                    "net_price": registration.option.net_price(),
+                    "currency": registration.option.currency,
+                    "includes_membership": registration.option.includes_membership,
+                    "membership_end_year": registration.option.membership_end_year,
+                },
+            )
+            payment.save()
+            registration.payment = payment
+            registration.save()
+
+    return {
+        "users": len(user_objs),
+        "events": [event.code for event in event_objs],
+        "school": SCHOOL_CODE,
+        "options": len(option_objs),
+        "registrations": registration_count,
+        "password": PASSWORD,
+    }
+
+
+__all__ = ["build_dataset", "remove_dataset", "PREFIX", "SCHOOL_CODE", "PASSWORD"]
@@ -0,0 +1,442 @@
+# @module dds_registration/loadtest/run.py
+# Load test driver: signup -> event registration -> invoice or Stripe -> profile,
+# plus index/profile readers, at a configurable concurrency.
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+
+from .stubs import DEFAULT_LATENCY, StubServer
+
+# NOTE: Keep in sync with `dataset.py` (not imported here, the driver doesn't need Django)
+PREFIX = "loadtest"
+SCHOOL_CODE = f"{PREFIX}-school"
+PASSWORD = "loadtest-password-1234"
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+SETTINGS_MODULE = "dds_registration.loadtest.settings"
+
+re_input = re.compile(r"<input\b[^>]*>")
+re_attribute = re.compile(r'([\w-]+)="([^"]*)"')
+re_activation_path = re.compile(r"https?://[^/\s]+(/accounts/activate/[^\s]+/)")
+re_stripe_path = re.compile(r"/payments/(\d+)/stripe$")
+
+
+class Rejected(Exception):
+    """An expected refusal by the app (registration closed or full), not an error"""
+
+
+class Recorder:
+    """Thread-safe collection of per-step timings and outcomes"""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = {}
+        self.outcomes: dict[str, dict[str, int]] = {}
+        self.errors: list[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float, outcome: str):
+        with self._lock:
+            self.samples.setdefault(name, []).append(seconds)
+            counts = self.outcomes.setdefault(name, {"ok": 0, "rejected": 0, "error": 0})
+            counts[outcome] += 1
+
+    def add_error(self, name: str, err: BaseException):
+        with self._lock:
+            if len(self.errors) < 20:
+                self.errors.append(f"{name}: {type(err).__name__}: {err}")
+
+    def step(self, name: str) -> "Step":
+        return Step(self, name)
+
+
+class Step:
+    def __init__(self, recorder: Recorder, name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        if exc_type is None:
+            outcome = "ok"
+        elif issubclass(exc_type, Rejected):
+            outcome = "rejected"
+        else:
+            outcome = "error"
+            self.recorder.add_error(self.name, exc)
+        self.recorder.add(self.name, elapsed, outcome)
+        # Let the exception end this virtual user's flow
+        return False
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def expect(response: requests.Response, *statuses: int):
+    if response.status_code not in statuses:
+        raise RuntimeError(f"{response.request.method} {response.url} -> {response.status_code}")
+
+
+def find(regex: re.Pattern, text: str, what: str) -> str:
+    match = regex.search(text)
+    if not match:
+        raise RuntimeError(f"No {what} found in the response")
+    return match.group(1)
+
+
+def input_values(html: str, name: str) -> list[str]:
+    """Values of the `<input name=...>` elements, whatever their attribute order"""
+    values = []
+    for tag in re_input.findall(html):
+        attributes = dict(re_attribute.findall(tag))
+        if attributes.get("name") == name:
+            values.append(attributes.get("value", ""))
+    return values
+
+
+def input_value(html: str, name: str) -> str:
+    values = input_values(html, name)
+    if not values:
+        raise RuntimeError(f"No `{name}` input found in the response")
+    return values[0]
+
+
+class LoadTest:
+    def __init__(self, base_url: str, stubs_url: str, options: argparse.Namespace):
+        self.base_url = base_url.rstrip("/")
+        self.stubs_url = stubs_url.rstrip("/")
+        self.options = options
+        self.recorder = Recorder()
+        self.run_id = uuid.uuid4().hex[:8]
+        self.rnd = random.Random(options.seed)
+        self.registrations_done = 0
+        self._lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def login(self, session: requests.Session, email: str):
+        with self.recorder.step("login"):
+            response = session.get(self.url("/accounts/login/"))
+            expect(response, 200)
+            response = session.post(
+                self.url("/accounts/login/"),
+                data={
+                    "csrfmiddlewaretoken": input_value(response.text, "csrfmiddlewaretoken"),
+                    "username": email,
+                    "password": PASSWORD,
+                },
+                allow_redirects=False,
+            )
+            expect(response, 302)
+
+    def read_pages(self, session: requests.Session, count: int):
+        for _ in range(count):
+            with self.recorder.step("index"):
+                expect(session.get(self.url("/")), 200)
+            with self.recorder.step("profile"):
+                expect(session.get(self.url("/profile"), allow_redirects=False), 200)
+
+    def registrant(self, n: int, use_stripe: bool):
+        """Sign up a new user and register it for the event"""
+        session = requests.Session()
+        email = f"{PREFIX}-vu-{self.run_id}-{n}@example.com"
+        recorder = self.recorder
+        try:
+            with recorder.step("signup"):
+                response = session.get(self.url("/accounts/register/"))
+                expect(response, 200)
+                response = session.post(
+                    self.url("/accounts/register/"),
+                    data={
+                        "csrfmiddlewaretoken": input_value(response.text, "csrfmiddlewaretoken"),
+                        "captcha_0": input_value(response.text, "captcha_0"),
+                        "captcha_1": "PASSED",
+                        "email": email,
+                        "password1": PASSWORD,
+                        "password2": PASSWORD,
+                        "first_name": "Load",
+                        "last_name": f"Registrant {n}",
+                        "address": f"Teststrasse {n}\n8000 Zürich",
+                    },
+                    allow_redirects=False,
+                )
+                expect(response, 302)
+            with recorder.step("activate"):
+                messages = requests.get(self.stubs_url + "/outbox", params={"to": email}).json()
+                body = messages[-1]["body"] if messages else ""
+                response = session.get(
+                    self.url(find(re_activation_path, body, "activation link")), allow_redirects=False
+                )
+                expect(response, 302)
+            self.login(session, email)
+            with recorder.step("index"):
+                expect(session.get(self.url("/")), 200)
+            with recorder.step("registration_form"):
+                path = f"/event/{self.options.event}/registration"
+                response = session.get(self.url(path), allow_redirects=False)
+                if response.status_code == 302:
+                    raise Rejected("Registration isn't open")
+                expect(response, 200)
+                options = input_values(response.text, "option")
+                if not options:
+                    raise Rejected("No free registration options")
+            with recorder.step("registration_submit"):
+                response = session.post(
+                    self.url(path),
+                    data={
+                        "csrfmiddlewaretoken": input_value(response.text, "csrfmiddlewaretoken"),
+                        "option": self.rnd.choice(options),
+                        "send_update_emails": "on",
+                        "name": f"Load Registrant {n}",
+                        "address": f"Teststrasse {n}\n8000 Zürich",
+                        "extra": "",
+                        "payment_method": "STRIPE" if use_stripe else "INVOICE",
+                        "additional_email": "",
+                    },
+                    allow_redirects=False,
+                )
+                if response.status_code == 200:
+                    # The form is shown again: the chosen option filled up meanwhile
+                    raise Rejected("Registration form rejected")
+                expect(response, 302)
+                location = urlparse(response.headers["Location"]).path
+            match = re_stripe_path.search(location)
+            if match:
+                payment_id = match.group(1)
+                with recorder.step("stripe_page"):
+                    expect(session.get(self.url(f"/payments/{payment_id}/stripe")), 200)
+                with recorder.step("stripe_success"):
+                    response = session.get(self.url(f"/payments/{payment_id}/stripe/success"), allow_redirects=False)
+                    expect(response, 302)
+            with self._lock:
+                self.registrations_done += 1
+            self.read_pages(session, self.options.reads)
+        except Exception:
+            # Already recorded by the failed step
+            pass
+
+    def reader(self, n: int):
+        """Log in as an existing data set user and browse the index and profile pages"""
+        session = requests.Session()
+        try:
+            self.login(session, f"{PREFIX}-user-{n % self.options.dataset_users}@example.com")
+            self.read_pages(session, self.options.reads)
+        except Exception:
+            pass
+
+    def run(self) -> dict:
+        options = self.options
+        tasks = [("registrant", n) for n in range(options.registrants)] + [
+            ("reader", n) for n in range(options.readers)
+        ]
+        self.rnd.shuffle(tasks)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options.concurrency) as pool:
+            for kind, n in tasks:
+                if kind == "registrant":
+                    pool.submit(self.registrant, n, self.rnd.random() < options.stripe_share)
+                else:
+                    pool.submit(self.reader, n)
+        wall_time = time.perf_counter() - started
+        return self.report(wall_time)
+
+    def report(self, wall_time: float) -> dict:
+        steps = {}
+        for name, samples in self.recorder.samples.items():
+            counts = self.recorder.outcomes[name]
+            steps[name] = {
+                "count": len(samples),
+                **counts,
+                "error_rate": counts["error"] / len(samples),
+                "throughput": len(samples) / wall_time,
+                "p50_ms": percentile(samples, 50) * 1000,
+                "p95_ms": percentile(samples, 95) * 1000,
+                "p99_ms": percentile(samples, 99) * 1000,
+            }
+        total = sum(step["count"] for step in steps.values())
+        return {
+            "concurrency": self.options.concurrency,
+            "wall_time_s": wall_time,
+            "steps": steps,
+            "total_steps": total,
+            "throughput": total / wall_time if wall_time else 0,
+            "registrations_completed": self.registrations_done,
+            "registrations_per_s": self.registrations_done / wall_time if wall_time else 0,
+            "errors": self.recorder.errors,
+        }
+
+
+def print_report(result: dict, out=sys.stdout):
+    header = f"{'step':<20}{'count':>7}{'ok':>7}{'rej':>6}{'err':>6}{'err%':>7}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    out.write(f"\nConcurrency {result['concurrency']}, wall time {result['wall_time_s']:.1f}s\n\n")
+    out.write(header + "\n" + "-" * len(header) + "\n")
+    for name, step in result["steps"].items():
+        out.write(
+            f"{name:<20}{step['count']:>7}{step['ok']:>7}{step['rejected']:>6}{step['error']:>6}"
+            f"{step['error_rate'] * 100:>6.1f}%{step['throughput']:>8.1f}"
+            f"{step['p50_ms']:>9.0f}{step['p95_ms']:>9.0f}{step['p99_ms']:>9.0f}\n"
+        )
+    out.write(
+        f"\nTotal: {result['total_steps']} steps, {result['throughput']:.1f} steps/s; "
+        f"{result['registrations_completed']} registrations completed ({result['registrations_per_s']:.2f}/s)\n"
+    )
+    if result["errors"]:
+        out.write("\nFirst errors:\n" + "".join(f"  {err}\n" for err in result["errors"]))
+
+
+def server_env(stubs_url: str, db_path: str) -> dict:
+    env = dict(os.environ)
+    env.update(
+        DJANGO_SETTINGS_MODULE=SETTINGS_MODULE,
+        LOADTEST_STUBS_URL=stubs_url,
+        LOADTEST_DB=db_path,
+        DEBUG="False",
+        SENTRY_DSN="",
+    )
+    return env
+
+
+def wait_for_server(base_url: str, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(base_url + "/robots.txt", timeout=2).status_code == 200:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} didn't come up in {timeout}s")
+
+
+def parse_latency(value: str) -> dict:
+    """Parse `gmail=0.3,stripe=0.4` into a dict"""
+    latency = {}
+    for item in filter(None, value.split(",")):
+        name, _, seconds = item.partition("=")
+        latency[name.strip()] = float(seconds)
+    return latency
+
+
+def command_stubs(options: argparse.Namespace):
+    stubs = StubServer(port=options.port, latency=parse_latency(options.latency))
+    sys.stdout.write(f"Serving the Gmail, Stripe and Slack stand-ins at {stubs.url}\n")
+    stubs.serve_forever()
+
+
+def command_run(options: argparse.Namespace):
+    stubs = None
+    server = None
+    stubs_url = options.stubs_url
+    base_url = options.base_url
+    try:
+        if not stubs_url:
+            stubs = StubServer(latency=parse_latency(options.latency)).start()
+            stubs_url = stubs.url
+        if not base_url:
+            # Self-contained run: fresh database, synthetic data set, local server
+            db_path = options.db or str(Path(tempfile.mkdtemp(prefix="dds-loadtest-")) / "db.sqlite3")
+            env = server_env(stubs_url, db_path)
+            manage = [sys.executable, str(BASE_DIR / "manage.py")]
+            subprocess.run(manage + ["migrate", "--verbosity", "0"], env=env, check=True, cwd=BASE_DIR)
+            subprocess.run(
+                manage
+                + [
+                    "loadtest_dataset",
+                    f"--users={options.dataset_users}",
+                    f"--school-capacity={options.school_capacity}",
+                ],
+                env=env,
+                check=True,
+                cwd=BASE_DIR,
+                stdout=subprocess.DEVNULL,
+            )
+            base_url = f"http://127.0.0.1:{options.port}"
+            command = options.server_cmd.format(python=sys.executable, manage=manage[1], port=options.port)
+            output = None if options.verbose else subprocess.DEVNULL
+            server = subprocess.Popen(shlex.split(command), env=env, cwd=BASE_DIR, stdout=output, stderr=output)
+            wait_for_server(base_url)
+        result = LoadTest(base_url, stubs_url, options).run()
+        if stubs:
+            result["stub_calls"] = dict(stubs.calls)
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=30)
+        if stubs:
+            stubs.stop()
+    print_report(result)
+    if options.json:
+        Path(options.json).write_text(json.dumps(result, indent=2))
+    return result
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m dds_registration.loadtest",
+        description="Local end-to-end load test for the registration and payment flows",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="Run the load test (default)")
+    run.add_argument("--base-url", help="Test an already running server (started with the loadtest settings)")
+    run.add_argument("--stubs-url", help="Use already running stand-ins (see the `stubs` command)")
+    run.add_argument("--port", type=int, default=8076, help="Port for the server started by the driver")
+    run.add_argument(
+        "--server-cmd",
+        default="{python} {manage} runserver 127.0.0.1:{port} --noreload",
+        help="Command starting the server, eg `uwsgi --http :{port} --processes 4 --module dds_registration.wsgi`",
+    )
+    run.add_argument("--db", help="sqlite file for the self-contained run (default: a temporary one)")
+    run.add_argument("--event", default=SCHOOL_CODE, help="Code of the event to register for")
+    run.add_argument("--registrants", type=int, default=100, help="Number of new users registering")
+    run.add_argument("--readers", type=int, default=50, help="Number of existing users browsing")
+    run.add_argument("--concurrency", type=int, default=20, help="Number of simultaneous virtual users")
+    run.add_argument("--reads", type=int, default=2, help="index+profile page views per virtual user")
+    run.add_argument("--stripe-share", type=float, default=0.5, help="Share of registrants paying with Stripe")
+    run.add_argument("--school-capacity", type=int, default=500, help="max_participants of the school")
+    run.add_argument("--dataset-users", type=int, default=200, help="Users in the synthetic data set")
+    run.add_argument("--latency", default="", help="Stand-in latencies in seconds, eg `gmail=0.3,stripe=0.4`")
+    run.add_argument("--seed", type=int, default=1)
+    run.add_argument("--json", help="Also write the results to this file")
+    run.add_argument("--verbose", action="store_true", help="Show the output of the server started by the driver")
+
+    stubs = commands.add_parser("stubs", help="Only serve the Gmail, Stripe and Slack stand-ins")
+    stubs.add_argument("--port", type=int, default=8025)
+    stubs.add_argument("--latency", default="", help="Latencies in seconds, default: " + json.dumps(DEFAULT_LATENCY))
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in ("run", "stubs", "-h", "--help"):
+        argv = ["run"] + argv
+    options = parser.parse_args(argv)
+    if options.command == "stubs":
+        return command_stubs(options)
+    return command_run(options)
+
+
+__all__ = ["LoadTest", "Recorder", "percentile", "main"]
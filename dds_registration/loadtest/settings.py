@@ -0,0 +1,53 @@
+# @module dds_registration/loadtest/settings.py
+# Production-like settings for the local load test server.
+#
+# Start from the regular settings with `DEBUG=0` (so the middleware stack and
+# templates behave as in production) and point every external service at the
+# local stand-ins from `stubs.py`, whose base url is passed in `LOADTEST_STUBS_URL`.
+
+import os
+from pathlib import Path
+
+from ..settings import *  # noqa: F401,F403
+from ..settings import ALLOWED_HOSTS, BASE_DIR, CACHES, SQLITE_DATABASE
+
+LOADTEST_STUBS_URL = os.environ.get("LOADTEST_STUBS_URL", "http://127.0.0.1:8025").rstrip("/")
+
+# Always a SQLite file of its own, even when `DATABASE_URL` points the regular settings at PostgreSQL
+DATABASES = {
+    "default": {
+        **SQLITE_DATABASE,
+        "NAME": os.environ.get("LOADTEST_DB", str(BASE_DIR / "loadtest.sqlite3")),
+    }
+}
+
+# Next to the database: cached rows from another database would be served by id
+CACHES = {
+    "default": {
+        **CACHES["default"],
+        "LOCATION": str(Path(DATABASES["default"]["NAME"]).with_suffix(".cache.sqlite3")),
+    }
+}
+
+ALLOWED_HOSTS = ALLOWED_HOSTS + ["localhost", "127.0.0.1"]
+
+# Served over plain http on localhost: drop the production cookie domain and `Secure` flags
+SESSION_COOKIE_DOMAIN = None
+CSRF_COOKIE_DOMAIN = None
+SESSION_COOKIE_SECURE = False
+CSRF_COOKIE_SECURE = False
+
+# Don't write compressed assets into the source tree (css/js aren't requested by the driver anyway)
+COMPRESS_ENABLED = False
+
+# Accept "PASSED" as the signup captcha answer (never enable this on a real deployment)
+CAPTCHA_TEST_MODE = True
+
+GMAIL_API_ENDPOINT = LOADTEST_STUBS_URL + "/gmail/"
+STRIPE_API_BASE = LOADTEST_STUBS_URL + "/stripe"
+STRIPE_SECRET_KEY = "sk_test_loadtest"
+STRIPE_PUBLISHABLE_KEY = "pk_test_loadtest"
+SLACK_PAYMENTS_WEBHOOK = LOADTEST_STUBS_URL + "/slack/payments"
+SLACK_REGISTRATIONS_WEBHOOK = LOADTEST_STUBS_URL + "/slack/registrations"
+
+SENTRY_DSN = ""
@@ -0,0 +1,159 @@
+# @module dds_registration/loadtest/stubs.py
+# Local stand-ins for the external services the registration flow talks to.
+
+import base64
+import email
+import json
+import threading
+import time
+import uuid
+from email import policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Rough latencies of the real services, in seconds (see `StubServer`)
+DEFAULT_LATENCY = {
+    "gmail": 0.3,
+    "stripe": 0.4,
+    "slack": 0.15,
+}
+
+
+class StubServer:
+    """Fake Gmail, Stripe and Slack endpoints on a single local port.
+
+    - Gmail: `POST /gmail/gmail/v1/users/me/messages/send` (use `gmail_endpoint`
+      as `GMAIL_API_ENDPOINT`); the decoded messages are kept in an outbox which
+      can be read back with `GET /outbox?to=<address>`.
+    - Stripe: `POST /stripe/v1/payment_intents` (use `stripe_api_base` as
+      `STRIPE_API_BASE`).
+    - Slack: any `POST /slack/...` (use `slack_webhook` for the webhooks).
+
+    Every call sleeps for the configured per-service latency so the app server
+    holds its workers for about as long as it would with the real services.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: dict | None = None):
+        self.latency = dict(DEFAULT_LATENCY, **(latency or {}))
+        self.outbox: dict[str, list[dict]] = {}
+        self.calls = {"gmail": 0, "stripe": 0, "slack": 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def gmail_endpoint(self) -> str:
+        return self.url + "/gmail/"
+
+    @property
+    def stripe_api_base(self) -> str:
+        return self.url + "/stripe"
+
+    @property
+    def slack_webhook(self) -> str:
+        return self.url + "/slack/webhook"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="loadtest-stubs", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def messages_for(self, address: str) -> list[dict]:
+        with self._lock:
+            return list(self.outbox.get(address.lower(), []))
+
+    def _record_call(self, service: str):
+        with self._lock:
+            self.calls[service] += 1
+        time.sleep(self.latency.get(service, 0))
+
+    def _store_message(self, raw: str):
+        message = email.message_from_bytes(base64.urlsafe_b64decode(raw), policy=policy.default)
+        body = message.get_body(preferencelist=("plain",))
+        item = {
+            "to": message["To"],
+            "subject": message["Subject"],
+            "body": body.get_content() if body else "",
+        }
+        with self._lock:
+            self.outbox.setdefault(str(message["To"]).lower(), []).append(item)
+
+    def _make_handler(self):
+        stubs = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, data, status: int = 200):
+                content = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def _read_body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/outbox":
+                    address = parse_qs(url.query).get("to", [""])[0]
+                    return self._send_json(stubs.messages_for(address))
+                if url.path == "/stats":
+                    return self._send_json(stubs.calls)
+                self._send_json({"error": "not found"}, status=404)
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                body = self._read_body()
+                if url.path.startswith("/gmail/") and url.path.endswith("/messages/send"):
+                    stubs._record_call("gmail")
+                    stubs._store_message(json.loads(body)["raw"])
+                    return self._send_json({"id": uuid.uuid4().hex, "labelIds": ["SENT"]})
+                if url.path == "/stripe/v1/payment_intents":
+                    stubs._record_call("stripe")
+                    params = parse_qs(body.decode("utf-8"))
+                    intent_id = "pi_" + uuid.uuid4().hex[:24]
+                    return self._send_json(
+                        {
+                            "id": intent_id,
+                            "object": "payment_intent",
+                            "amount": int(params.get("amount", ["0"])[0]),
+                            "currency": params.get("currency", [""])[0],
+                            "client_secret": f"{intent_id}_secret_{uuid.uuid4().hex[:16]}",
+                            "status": "requires_payment_method",
+                        }
+                    )
+                if url.path.startswith("/slack/"):
+                    stubs._record_call("slack")
+                    content = b"ok"
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain")
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                    return
+                self._send_json({"error": "not found"}, status=404)
+
+        return Handler
+
+
+__all__ = ["StubServer", "DEFAULT_LATENCY"]
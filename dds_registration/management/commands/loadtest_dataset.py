@@ -0,0 +1,31 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from ...loadtest.dataset import build_dataset, remove_dataset
+
+
+class Command(BaseCommand):
+    help = "Create (or remove) the synthetic load test data set"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--events", type=int, default=8)
+        parser.add_argument("--registrations-per-event", type=int, default=25)
+        parser.add_argument("--school-capacity", type=int, default=500)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--remove", action="store_true", help="Only remove a previously created data set")
+
+    def handle(self, *args, **options):
+        if options["remove"]:
+            remove_dataset()
+            self.stdout.write("Load test data set removed\n")
+            return
+        summary = build_dataset(
+            users=options["users"],
+            events=options["events"],
+            registrations_per_event=options["registrations_per_event"],
+            school_capacity=options["school_capacity"],
+            seed=options["seed"],
+        )
+        self.stdout.write(json.dumps(summary, indent=2) + "\n")
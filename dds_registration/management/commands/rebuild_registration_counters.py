@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Registration
+
+
+class Command(BaseCommand):
+    help = "Recount the active registration counters of all events and registration options"
+
+    def handle(self, *args, **kwargs):
+        Registration.rebuild_counters()
+        self.stdout.write("Registration counters are rebuilt\n")
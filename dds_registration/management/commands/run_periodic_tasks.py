@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...core.helpers.periodic_tasks import run_due_tasks
+
+
+class Command(BaseCommand):
+    help = "Run the periodic maintenance tasks that are due (start it every few minutes)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Run all the tasks now")
+
+    def handle(self, *args, force=False, **kwargs):
+        ran = run_due_tasks(force=force)
+        self.stdout.write("Ran: {}\n".format(", ".join(ran)) if ran else "No task is due\n")
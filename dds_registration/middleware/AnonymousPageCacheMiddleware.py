@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import Resolver404, resolve
+from django.utils.cache import patch_vary_headers
+
+from ..views.helpers.page_cache import (
+    get_anonymous_page_cache_key,
+    get_anonymous_page_cache_timeout,
+)
+
+
+def is_anonymous_request(request) -> bool:
+    # Decided from the cookies alone, before any session lookup: with a session (logged in, or with pending
+    # messages) the page may differ
+    return not any(name in request.COOKIES for name in (settings.SESSION_COOKIE_NAME, "messages"))
+
+
+def is_cached_page(request) -> bool:
+    # Cheap checks first: only anonymous reads are worth resolving the url for
+    if request.method not in ("GET", "HEAD") or not is_anonymous_request(request):
+        return False
+    try:
+        view_name = resolve(request.path_info).view_name
+    except Resolver404:
+        return False
+    return view_name in getattr(settings, "ANONYMOUS_PAGE_CACHE_URL_NAMES", ["index", "robots"])
+
+
+def is_cacheable_response(response) -> bool:
+    # Not a page that starts a session (sets cookies) or is marked as private
+    cache_control = response.get("Cache-Control", "")
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not any(directive in cache_control for directive in ("private", "no-cache", "no-store"))
+    )
+
+
+def AnonymousPageCacheMiddleware(get_response):
+    """
+    Serve the public pages (`ANONYMOUS_PAGE_CACHE_URL_NAMES`) to anonymous visitors from the cache, as produced by
+    the whole middleware stack (prettified by `BeautifulMiddleware`...). See `views.helpers.page_cache`.
+    """
+
+    def middleware(request):
+        if not getattr(settings, "ANONYMOUS_PAGE_CACHE_TIMEOUT", 15 * 60) or not is_cached_page(request):
+            return get_response(request)
+        key = get_anonymous_page_cache_key(request)
+        response = cache.get(key)
+        if response is None:
+            response = get_response(request)
+            patch_vary_headers(response, ["Cookie"])
+            if is_cacheable_response(response):
+                timeout = get_anonymous_page_cache_timeout()
+                if timeout:
+                    cache.set(key, response, timeout)
+        return response
+
+    return middleware
@@ -15,7 +15,14 @@ def BeautifulMiddleware(get_response):
     def middleware(request):
         response = get_response(request)
         # TODO: Do this conversion only in prod mode
-        if not settings.DEV and response.status_code == 200 and response["content-type"].startswith("text/html"):
+        # Not compressed responses, nor the ones with an ETag (it was computed for the content as it is)
+        if (
+            not settings.DEV
+            and response.status_code == 200
+            and response["content-type"].startswith("text/html")
+            and not response.has_header("Content-Encoding")
+            and not response.has_header("ETag")
+        ):
             content = response.content.decode("utf-8")
             # Remove comments
             content = re_comments.sub("", content)
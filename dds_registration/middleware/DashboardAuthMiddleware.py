@@ -0,0 +1,84 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+from django.utils.crypto import constant_time_compare
+
+from ..views.helpers.dashboard_access import (
+    DASHBOARD_TOKEN_COOKIE_NAME,
+    get_dashboard_access_by_id,
+    is_dashboard_allowed,
+    is_dashboard_allowed_by_token,
+    read_dashboard_token,
+)
+
+# Both checks live under this path (`urls.accounts_urls`): other requests aren't resolved here
+DASHBOARD_CHECK_PATH_PREFIX = "/dashboards/"
+
+
+def resolve_dashboard_check(request) -> tuple[str, str] | tuple[None, None]:
+    """The url name (`dashboard_auth` or `dashboard_verify`) and the dashboard key"""
+    if not request.path_info.startswith(DASHBOARD_CHECK_PATH_PREFIX):
+        return None, None
+    try:
+        match = resolve(request.path_info)
+    except Resolver404:
+        return None, None
+    if match.url_name not in ("dashboard_auth", "dashboard_verify"):
+        return None, None
+    return match.url_name, match.kwargs["key"]
+
+
+def check_token(request, key: str) -> HttpResponse | None:
+    token = read_dashboard_token(request.COOKIES.get(DASHBOARD_TOKEN_COOKIE_NAME))
+    if token is None:
+        return None
+    return HttpResponse(status=200 if is_dashboard_allowed_by_token(token, key) else 403)
+
+
+def check_session(request, key: str, engine) -> HttpResponse | None:
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not session_key:
+        return HttpResponse(status=401)
+    session = engine.SessionStore(session_key)
+    user_id = session.get(SESSION_KEY)
+    if user_id is None:
+        return HttpResponse(status=401)
+    access = None
+    if session.get(BACKEND_SESSION_KEY) in settings.AUTHENTICATION_BACKENDS:
+        access = get_dashboard_access_by_id(user_id)
+    if (
+        access is None
+        or not access["active"]
+        or not constant_time_compare(session.get(HASH_SESSION_KEY, ""), access["session_hash"])
+    ):
+        return None
+    return HttpResponse(status=200 if is_dashboard_allowed(access, key) else 403)
+
+
+def DashboardAuthMiddleware(get_response):
+    """
+    Fast paths for the nginx `auth_request` targets (called for each dashboard asset), skipping the rest of the
+    middleware stack:
+
+    - `dashboard_verify`: decided from the dashboard token cookie alone (no database, no session);
+    - `dashboard_auth`: decided from the session and the cached dashboard access (`views.helpers.dashboard_access`).
+
+    What they can't decide (no valid token; unknown session backend, inactive user, stale auth hash) goes through
+    the full stack and view.
+    """
+    engine = import_module(settings.SESSION_ENGINE)
+
+    def middleware(request):
+        url_name, key = resolve_dashboard_check(request)
+        if url_name == "dashboard_verify":
+            response = check_token(request, key)
+        elif url_name == "dashboard_auth":
+            response = check_session(request, key, engine)
+        else:
+            response = None
+        return get_response(request) if response is None else response
+
+    return middleware
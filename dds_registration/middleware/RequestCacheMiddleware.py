@@ -0,0 +1,13 @@
+from ..core.helpers.request_cache import request_cache_scope
+
+
+def RequestCacheMiddleware(get_response):
+    """
+    Scope the request memoization (`core.helpers.request_cache`) to each request.
+    """
+
+    def middleware(request):
+        with request_cache_scope():
+            return get_response(request)
+
+    return middleware
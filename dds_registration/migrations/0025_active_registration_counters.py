@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:15
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_active_registrations(apps, schema_editor):
+    Registration = apps.get_model("dds_registration", "Registration")
+    active = ~Q(status__in=("CANCELLED", "WITHDRAWN", "DECLINED"))
+    for model_name, field in (("Event", "event"), ("RegistrationOption", "option")):
+        count = (
+            Registration.objects.filter(active, **{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        apps.get_model("dds_registration", model_name).objects.update(
+            active_registration_count=Coalesce(Subquery(count), 0)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dds_registration', '0024_event_has_invitation_event_invitation_text_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='active_registration_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Registration Count'),
+        ),
+        migrations.AddField(
+            model_name='registrationoption',
+            name='active_registration_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Registration Count'),
+        ),
+        migrations.RunPython(count_active_registrations, migrations.RunPython.noop),
+    ]
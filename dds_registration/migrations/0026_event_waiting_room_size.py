@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dds_registration', '0025_active_registration_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='waiting_room_size',
+            field=models.PositiveIntegerField(default=0, help_text='Number of people let into the registration form at the same time, the others wait in a queue (0 = no waiting room)'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:54
+
+import hashlib
+
+from django.db import migrations, models
+from markdownify.templatetags.markdownify import markdownify
+
+
+def render_descriptions(apps, schema_editor):
+    # The rendering and hash of `core.helpers.markdown` at the time, inlined so that later changes to the helper
+    # don't change what this migration does
+    Event = apps.get_model("dds_registration", "Event")
+    for event in Event.objects.only("pk", "description"):
+        description = event.description or ""
+        Event.objects.filter(pk=event.pk).update(
+            description_html=markdownify(description),
+            description_hash=hashlib.sha256(description.encode()).hexdigest(),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dds_registration', '0026_event_waiting_room_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='description_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='description_html',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(render_descriptions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Only on PostgreSQL: a GIN index on the payment data, for containment lookups (`data__contains`), which SQLite
+# can't index (its JSON is text)
+
+from django.db import migrations
+
+PAYMENT_DATA_INDEX = "dds_registration_payment_data_gin"
+
+
+def create_payment_data_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {PAYMENT_DATA_INDEX} ON dds_registration_payment USING gin (data jsonb_path_ops)"
+        )
+
+
+def drop_payment_data_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {PAYMENT_DATA_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dds_registration', '0027_event_description_html'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_payment_data_index, drop_payment_data_index, elidable=False),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:12
+
+import django.db.models.fields.json
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dds_registration', '0028_payment_data_gin_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='data_currency',
+            field=models.GeneratedField(choices=[('USD', 'US Dollar'), ('CHF', 'Swiss Franc'), ('EUR', 'Euro'), ('CAD', 'Canadian Dollar'), ('SGD', 'Singaporean Dollar')], db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.fields.json.KeyTextTransform('currency', 'data'), models.TextField()), output_field=models.TextField(), verbose_name='currency'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='data_event_id',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.fields.json.KeyTextTransform('id', django.db.models.fields.json.KeyTextTransform('event', 'data')), models.IntegerField()), output_field=models.IntegerField(), verbose_name='event id'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='data_kind',
+            field=models.GeneratedField(choices=[('event', 'Event'), ('membership', 'Membership')], db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.fields.json.KeyTextTransform('kind', 'data'), models.TextField()), output_field=models.TextField(), verbose_name='kind'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='data_method',
+            field=models.GeneratedField(choices=[('STRIPE', 'Credit Card (Stripe - costs 2-4% more due to credit card fees)'), ('INVOICE', 'Bank Transfer (Invoice)')], db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.fields.json.KeyTextTransform('method', 'data'), models.TextField()), output_field=models.TextField(), verbose_name='method'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='data_registration_id',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.fields.json.KeyTextTransform('id', django.db.models.fields.json.KeyTextTransform('registration', 'data')), models.IntegerField()), output_field=models.IntegerField(), verbose_name='registration id'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='data_user_id',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.fields.json.KeyTextTransform('id', django.db.models.fields.json.KeyTextTransform('user', 'data')), models.IntegerField()), output_field=models.IntegerField(), verbose_name='user id'),
+        ),
+    ]
@@ -8,13 +8,16 @@ from datetime import date
 
 import requests
 from django.conf import settings
-from django.contrib import admin
 from django.contrib.auth.models import AbstractUser
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
-from django.db.models import Count, F, Model, Q, QuerySet
+from django.db import models, transaction
+from django.db.models import Count, F, Model, OuterRef, Q, QuerySet, Subquery
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast, Coalesce
 from django.urls import reverse
+from django.utils.safestring import mark_safe
 from fpdf import FPDF
 from loguru import logger
 
@@ -25,21 +28,44 @@ from .core.constants.payments import (
     site_default_currency,
     site_supported_currencies,
 )
+from .core.helpers.cache_invalidation import KeyNamespace
+from .core.helpers.create_certificate import create_certificate_pdf
+from .core.helpers.create_invitation import create_invitation_pdf
 from .core.helpers.create_pdf import (
     create_invoice_pdf_from_payment,
     create_receipt_pdf_from_payment,
 )
-from .core.helpers.create_certificate import create_certificate_pdf
-from .core.helpers.create_invitation import create_invitation_pdf
 from .core.helpers.dates import this_year
 from .core.helpers.email import send_email
+from .core.helpers.markdown import get_markdown_hash, markdown_to_html, render_markdown
+from .core.helpers.request_cache import request_cached
 
 alphabet = string.ascii_lowercase + string.digits
 random_code_length = 8
 
 
 # NOTE: A single reusable QuerySet to check if the registration active
-REGISTRATION_ACTIVE_QUERY = ~Q(status__in=("CANCELLED", "WITHDRAWN", "DECLINED"))
+REGISTRATION_INACTIVE_STATUSES = ("CANCELLED", "WITHDRAWN", "DECLINED")
+REGISTRATION_ACTIVE_QUERY = ~Q(status__in=REGISTRATION_INACTIVE_STATUSES)
+
+
+class CapacityExceeded(Exception):
+    """No seat left for a registration saved with `enforce_capacity` (see `signals`)"""
+
+    def __init__(self, target):
+        super().__init__(f"No places left for {target}")
+        self.target = target
+
+
+def save_without_counters(instance: Model, kwargs: dict):
+    """Leave the `active_registration_count` column out of updates: only `signals` write it, with F() expressions"""
+    if not instance._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+        kwargs["update_fields"] = [
+            field.name
+            for field in instance._meta.concrete_fields
+            if not field.primary_key and field.name != "active_registration_count"
+        ]
+    return kwargs
 
 
 def random_code(length=random_code_length):
@@ -119,10 +145,8 @@ class User(AbstractUser):
 
     @property
     def is_member(self) -> bool:
-        try:
-            return Membership.objects.get(user=self).active
-        except ObjectDoesNotExist:
-            return False
+        # Asked from several templates and views in the same request: from the cached user summary, once per request
+        return request_cached(("is_member", self.pk), lambda: get_user_is_member(self))
 
     def __init__(self, *args, **kwargs):
         super(User, self).__init__(*args, **kwargs)
@@ -147,6 +171,34 @@ class User(AbstractUser):
         )
 
 
+def data_key_column(path: str, output_field: models.Field, **options) -> models.GeneratedField:
+    """A stored copy of a `Payment.data` key (`__` separated path), indexed: None when the key is missing"""
+    return models.GeneratedField(
+        expression=Cast(KT(f"data__{path}"), output_field),
+        output_field=output_field,
+        db_persist=True,
+        db_index=True,
+        **options,
+    )
+
+
+class PaymentQuerySet(QuerySet):
+    """Payments by the keys of their data, through the indexed `data_*` columns"""
+
+    def for_user(self, user: "User | int") -> QuerySet:
+        return self.filter(data_user_id=getattr(user, "pk", user))
+
+    def for_event(self, event: "Event | int") -> QuerySet:
+        return self.filter(data_event_id=getattr(event, "pk", event))
+
+    def for_registration(self, registration: "Registration | int") -> QuerySet:
+        return self.filter(data_registration_id=getattr(registration, "pk", registration))
+
+    def of_kind(self, kind: str) -> QuerySet:
+        """`event` or `membership` payments"""
+        return self.filter(data_kind=kind)
+
+
 class Payment(Model):
     STATUS = [
         ("CREATED", "Created"),
@@ -165,6 +217,8 @@ class Payment(Model):
     METHOD_LABELS = {"STRIPE": "Credit Card via Stripe", "INVOICE": "Bank Transfer"}
     DEFAULT_METHOD = "INVOICE"
 
+    KINDS = [("event", "Event"), ("membership", "Membership")]
+
     created = models.DateField(auto_now_add=True)
     updated = models.DateField(auto_now=True)
     status = models.TextField(choices=STATUS, default=DEFAULT_STATUS)
@@ -213,6 +267,19 @@ class Payment(Model):
     # }
     data = models.JSONField(help_text="JSON object", default=dict)
 
+    # Kept by the database from `data`, to find payments without reading it (see `PaymentQuerySet`); the choices
+    # let the admin filter by kind, method and currency without listing the values first
+    data_user_id = data_key_column("user__id", models.IntegerField(), verbose_name="user id")
+    data_event_id = data_key_column("event__id", models.IntegerField(), verbose_name="event id")
+    data_registration_id = data_key_column("registration__id", models.IntegerField(), verbose_name="registration id")
+    data_kind = data_key_column("kind", models.TextField(), verbose_name="kind", choices=KINDS)
+    data_method = data_key_column("method", models.TextField(), verbose_name="method", choices=METHODS)
+    data_currency = data_key_column(
+        "currency", models.TextField(), verbose_name="currency", choices=site_supported_currencies
+    )
+
+    objects = PaymentQuerySet.as_manager()
+
     def __str__(self):
         return "Payment {} | {} {:.2f} | {} | {}".format(
             self.id,
@@ -447,6 +514,9 @@ class Event(Model):
     code = models.TextField(unique=True, default=random_code)  # Show as an input
     title = models.TextField(unique=True, null=False, blank=False)  # Show as an input
     description = models.TextField(blank=False, null=False, help_text="You can use Markdown here")
+    # Rendered when saved, see `description_rendered`
+    description_html = models.TextField(blank=True, default="", editable=False)
+    description_hash = models.CharField(max_length=64, blank=True, default="", editable=False)
     success_email = models.TextField(
         blank=False, null=False, help_text="The email sent when registration is complete and paid for"
     )
@@ -491,6 +561,13 @@ class Event(Model):
     credit_cards = models.BooleanField(default=True)
     vat_rate = models.FloatField(null=True, blank=True)
     members_only = models.BooleanField(default=False)
+    waiting_room_size = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of people let into the registration form at the same time, the others wait in a queue (0 = no waiting room)",
+    )
+
+    # Denormalized, maintained by `signals`; rebuild with `manage.py rebuild_registration_counters`
+    active_registration_count = models.IntegerField(default=0, editable=False, verbose_name="Registration Count")
 
     class Meta:
         constraints = [
@@ -533,6 +610,22 @@ class Event(Model):
             reverse("admin:%s_%s_change" % (self._meta.app_label, self._meta.model_name), args=(self.id,)),
         )
 
+    def save(self, *args, **kwargs):
+        description_hash = get_markdown_hash(self.description)
+        if description_hash != self.description_hash:
+            self.description_html = markdown_to_html(self.description)
+            self.description_hash = description_hash
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "description_html", "description_hash"}
+        return super().save(*args, **save_without_counters(self, kwargs))
+
+    @property
+    def description_rendered(self):
+        """The description as sanitized HTML: the stored one, unless the description was changed without a save"""
+        if self.description_hash == get_markdown_hash(self.description):
+            return mark_safe(self.description_html)
+        return render_markdown(self.description)
+
     def today_within_registration_band(self):
         today = date.today()
         return today >= self.registration_open and today <= self.registration_close
@@ -553,11 +646,6 @@ class Event(Model):
             return self.today_within_application_band()
         return self.today_within_registration_band()
 
-    @property
-    @admin.display(description="Registration Count")
-    def active_registration_count(self):
-        return self.registrations.filter(REGISTRATION_ACTIVE_QUERY).count()
-
     def get_active_event_registration_for_user(self, user: User):
         if user.is_authenticated:
             active_user_registrations = list(self.registrations.all().filter(REGISTRATION_ACTIVE_QUERY, user=user))
@@ -595,11 +683,16 @@ class RegistrationOption(Model):
         default=0,
         help_text="Maximum number of participants (0 = no limit)",
     )
+    # Denormalized, maintained by `signals`; rebuild with `manage.py rebuild_registration_counters`
+    active_registration_count = models.IntegerField(default=0, editable=False, verbose_name="Registration Count")
 
     SUPPORTED_CURRENCIES = site_supported_currencies
     DEFAULT_CURRENCY = site_default_currency
     currency = models.TextField(choices=SUPPORTED_CURRENCIES, null=False, default=DEFAULT_CURRENCY)
 
+    def save(self, *args, **kwargs):
+        return super().save(*args, **save_without_counters(self, kwargs))
+
     def net_price(self):
         if not self.has_vat:
             return self.price
@@ -614,6 +707,10 @@ class RegistrationOption(Model):
     def vat_percentage(self):
         return round(self.event.vat_rate * 100, 0)
 
+    @property
+    def has_free_spots(self):
+        return not self.max_participants or self.active_registration_count < self.max_participants
+
     @property
     def form_label(self):
         if self.includes_membership:
@@ -639,11 +736,6 @@ class RegistrationOption(Model):
         info = " ".join(filter(None, map(str, items)))
         return info
 
-    @classmethod
-    def free_spots(cls, event):
-        qs = cls.objects.annotate(Count("registrations"))
-        return qs.filter(event=event).filter(Q(max_participants=0) | Q(max_participants__gt=F("registrations__count")))
-
 
 class Message(Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, blank=True, null=True)
@@ -760,10 +852,39 @@ class Registration(Model):
             )
         ]
 
+    # Set to True before save() to only take a seat if the event and option have room left, or raise
+    # `CapacityExceeded` (and roll back the save). Admin edits leave it off and can overbook.
+    enforce_capacity = False
+
+    @staticmethod
+    def counted_in(event_id, option_id, status):
+        """The (event id, option id) whose active registration counters include such a registration, if any"""
+        if status in REGISTRATION_INACTIVE_STATUSES:
+            return None
+        return (event_id, option_id)
+
+    def save(self, *args, **kwargs):
+        # Keep the counter updates (`signals`) in the same transaction as the row
+        with transaction.atomic():
+            return super().save(*args, **kwargs)
+
     @classmethod
     def active_for_user(cls, user: User) -> QuerySet:
         return cls.objects.filter(REGISTRATION_ACTIVE_QUERY, user=user)
 
+    @classmethod
+    def rebuild_counters(cls):
+        """Recount `active_registration_count` of all events and options from the registrations"""
+        for model, field in ((Event, "event"), (RegistrationOption, "option")):
+            count = (
+                cls.objects.filter(REGISTRATION_ACTIVE_QUERY, **{field: OuterRef("pk")})
+                .order_by()
+                .values(field)
+                .annotate(count=Count("pk"))
+                .values("count")
+            )
+            model.objects.update(active_registration_count=Coalesce(Subquery(count), 0))
+
     def accept_application(self):
         """Change status from SUBMITTED to SELECTED"""
         self.status = "SELECTED"
@@ -826,6 +947,47 @@ class Registration(Model):
         return info
 
 
+# The user's active registrations (with their event, payment and option) and membership (with its payment), in the
+# shared cache. `signals` drop it when one of the user's registrations, payments or membership changes, and all of
+# them when an event or option changes.
+USER_SUMMARY_CACHE_TIMEOUT = 60 * 60
+USER_SUMMARIES = KeyNamespace("user-summary")
+
+
+def get_user_summary_cache_key(user_id: int) -> str:
+    return USER_SUMMARIES.key(user_id)
+
+
+def load_user_summary(user: User) -> dict:
+    return {
+        "registrations": list(Registration.active_for_user(user).select_related("event", "payment", "option")),
+        "membership": Membership.objects.select_related("payment").filter(user=user).first(),
+    }
+
+
+def get_cached_user_summary(user: User) -> dict | None:
+    return cache.get(get_user_summary_cache_key(user.pk))
+
+
+def store_user_summary(user: User) -> dict:
+    summary = load_user_summary(user)
+    cache.set(get_user_summary_cache_key(user.pk), summary, USER_SUMMARY_CACHE_TIMEOUT)
+    return summary
+
+
+def get_user_summary(user: User) -> dict:
+    summary = get_cached_user_summary(user)
+    if summary is None:
+        summary = store_user_summary(user)
+    return summary
+
+
+def get_user_is_member(user: User) -> bool:
+    membership = get_user_summary(user)["membership"]
+    # Computed on read: membership validity depends on the current year
+    return bool(membership and membership.active)
+
+
 class Certificate(Model):
     registration = models.OneToOneField(
         Registration,
@@ -0,0 +1,170 @@
+# @module signals.py
+# @changed 2026.10.19
+
+from django.contrib.auth.models import Group
+from django.db.models import F, Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .core.helpers.cache_invalidation import (
+    forget_cache_keys_on_commit,
+    invalidate_on_change,
+)
+from .core.helpers.request_cache import forget_request_cached
+from .models import (
+    USER_SUMMARIES,
+    CapacityExceeded,
+    Event,
+    Membership,
+    Payment,
+    Registration,
+    RegistrationOption,
+    User,
+    get_user_summary_cache_key,
+)
+from .views.helpers.availability import get_availability_cache_key
+from .views.helpers.dashboard_access import (
+    DASHBOARD_ACCESS,
+    DASHBOARD_GROUP_PREFIX,
+    get_dashboard_access_cache_key,
+)
+from .views.helpers.event_lookup import get_event_cache_key
+from .views.helpers.fragment_cache import EVENT_FRAGMENTS
+from .views.helpers.page_cache import ANONYMOUS_PAGES
+from .views.waiting_room import (
+    get_waiting_room_event_cache_key,
+    get_waiting_room_page_cache_key,
+)
+
+# Active registration counters (`Event.active_registration_count`, `RegistrationOption.active_registration_count`).
+# Registration.save() is atomic, so the counters change in the same transaction as the registration. Bulk
+# operations (`QuerySet.update`, `bulk_create`) bypass signals: run `manage.py rebuild_registration_counters` after.
+#
+# With `Registration.enforce_capacity`, taking a seat is a conditional UPDATE that only matches while the counter is
+# below `max_participants`: the database serializes concurrent reservations, so the last seat goes to one of them and
+# the others raise `CapacityExceeded`, rolling back their save.
+#
+# Cached values (see `core.helpers.cache_invalidation`) are declared at the end, with the models they depend on.
+
+HAS_ROOM_QUERY = Q(max_participants=0) | Q(active_registration_count__lt=F("max_participants"))
+
+
+def update_counter(model, pk, delta: int, enforce_capacity: bool = False):
+    objects = model.objects.filter(pk=pk)
+    reserve = enforce_capacity and delta > 0
+    if reserve:
+        objects = objects.filter(HAS_ROOM_QUERY)
+    if not objects.update(active_registration_count=F("active_registration_count") + delta) and reserve:
+        raise CapacityExceeded(model.objects.get(pk=pk))
+
+
+def update_counters(before, after, enforce_capacity: bool = False):
+    """Move a registration from the `before` to the `after` counters (`Registration.counted_in` values or None)"""
+    deltas = {}
+    for counted_in, delta in ((before, -1), (after, +1)):
+        if counted_in:
+            event_id, option_id = counted_in
+            deltas[(Event, event_id)] = deltas.get((Event, event_id), 0) + delta
+            if option_id:
+                deltas[(RegistrationOption, option_id)] = deltas.get((RegistrationOption, option_id), 0) + delta
+    # Release before reserving: a seat given up can go to the same request
+    for (model, pk), delta in sorted(deltas.items(), key=lambda item: item[1]):
+        if delta:
+            update_counter(model, pk, delta, enforce_capacity)
+    event_deltas = {pk: delta for (model, pk), delta in deltas.items() if model is Event}
+    if event_deltas:
+        # A counter update doesn't send `post_save`
+        events = Event.objects.filter(pk__in=event_deltas).values_list(
+            "pk", "code", "max_participants", "active_registration_count"
+        )
+        keys = []
+        for pk, code, max_participants, count in events:
+            keys.append(get_availability_cache_key(code))
+            # The public listing only changes when an event gets full or has room again
+            if max_participants and (count - event_deltas[pk] < max_participants) != (count < max_participants):
+                keys.append(ANONYMOUS_PAGES)
+        forget_cache_keys_on_commit(keys)
+
+
+@receiver(pre_save, sender=Registration)
+def remember_counted_registration(sender, instance: Registration, raw=False, **kwargs):
+    instance._counted_in_before_save = None
+    if raw or instance._state.adding:
+        return
+    stored = Registration.objects.filter(pk=instance.pk).values_list("event_id", "option_id", "status").first()
+    if stored:
+        instance._counted_in_before_save = Registration.counted_in(*stored)
+
+
+@receiver(post_save, sender=Registration)
+def count_saved_registration(sender, instance: Registration, raw=False, **kwargs):
+    if raw:
+        return
+    before = getattr(instance, "_counted_in_before_save", None)
+    after = Registration.counted_in(instance.event_id, instance.option_id, instance.status)
+    if before != after:
+        update_counters(before, after, instance.enforce_capacity)
+
+
+@receiver(post_delete, sender=Registration)
+def count_deleted_registration(sender, instance: Registration, **kwargs):
+    update_counters(Registration.counted_in(instance.event_id, instance.option_id, instance.status), None)
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def forget_request_cached_membership(sender, instance: Membership, **kwargs):
+    forget_request_cached(("is_member", instance.user_id))
+
+
+# Cached values
+
+
+def get_event_keys(event_code: str) -> list[str]:
+    return [
+        get_event_cache_key(event_code),
+        get_availability_cache_key(event_code),
+        get_waiting_room_event_cache_key(event_code),
+        get_waiting_room_page_cache_key(event_code),
+    ]
+
+
+@invalidate_on_change(Event, previous=True)
+def event_keys(event: Event):
+    # User summaries include the events (and options) registered for
+    return [*get_event_keys(event.code), USER_SUMMARIES, ANONYMOUS_PAGES, EVENT_FRAGMENTS]
+
+
+@invalidate_on_change(RegistrationOption)
+def option_keys(option: RegistrationOption):
+    event_code = Event.objects.filter(pk=option.event_id).values_list("code", flat=True).first()
+    keys = [USER_SUMMARIES, EVENT_FRAGMENTS]
+    return [*get_event_keys(event_code), ANONYMOUS_PAGES, *keys] if event_code else keys
+
+
+@invalidate_on_change(Registration)
+def registration_keys(registration: Registration):
+    return [get_user_summary_cache_key(registration.user_id)]
+
+
+@invalidate_on_change(Payment)
+def payment_keys(payment: Payment):
+    user_id = (payment.data or {}).get("user", {}).get("id")
+    return [get_user_summary_cache_key(user_id)] if user_id else []
+
+
+@invalidate_on_change(Membership)
+def membership_keys(membership: Membership):
+    return [get_user_summary_cache_key(membership.user_id)]
+
+
+@invalidate_on_change(User, m2m=[User.groups.through])
+def dashboard_access_keys(user: User):
+    # Saved on each login too (`last_login`)
+    return [get_dashboard_access_cache_key(user.pk)]
+
+
+@invalidate_on_change(Group, previous=True)
+def dashboard_group_keys(group: Group):
+    # A group's deletion drops its members without `m2m_changed`
+    return [DASHBOARD_ACCESS] if group.name.startswith(DASHBOARD_GROUP_PREFIX) else []
@@ -0,0 +1,15 @@
+# @module tasks.py
+# @changed 2026.10.19
+
+# Periodic maintenance tasks (see `core.helpers.periodic_tasks`), run by `manage.py run_periodic_tasks`.
+
+from django.conf import settings
+from django.core.management import call_command
+
+from .core.helpers.periodic_tasks import periodic_task
+
+
+@periodic_task(getattr(settings, "CLEAR_SESSIONS_INTERVAL", 24 * 60 * 60))
+def clear_sessions():
+    # Expired sessions stay in the database (cached ones expire from the cache by themselves)
+    call_command("clearsessions")
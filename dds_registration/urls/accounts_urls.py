@@ -25,9 +25,13 @@ urlpatterns = [
     # SSO gateway for the gated static dashboards on dashboard.d-d-s.ch.
     # `login/` overrides the stock auth view so the dashboard host is honoured
     # as a `?next=` target; must precede the auth.urls include below to win.
-    # `dashboards/<key>/auth/` is the per-route nginx `auth_request` target.
+    # `dashboards/<key>/auth/` is the per-route nginx `auth_request` target;
+    # `dashboards/<key>/verify/` the same, checked from the dashboard token
+    # cookie (set at login, dropped at logout).
     path("accounts/login/", views.SubdomainLoginView.as_view(), name="login"),
+    path("accounts/logout/", views.SubdomainLogoutView.as_view(), name="logout"),
     path("dashboards/<slug:key>/auth/", views.dashboard_auth, name="dashboard_auth"),
+    path("dashboards/<slug:key>/verify/", views.dashboard_verify, name="dashboard_verify"),
     # Stock accounts...
     path(
         "accounts/",
@@ -3,7 +3,9 @@
 
 from django.urls import path
 
+from ..views import availability as availability_views
 from ..views import event_registration as event_registration_views
+from ..views import waiting_room as waiting_room_views
 
 urlpatterns = [
     path(
@@ -11,6 +13,21 @@ urlpatterns = [
         event_registration_views.event_registration,
         name="event_registration",
     ),
+    path(
+        "event/<str:event_code>/availability",
+        availability_views.event_availability,
+        name="event_availability",
+    ),
+    path(
+        "event/<str:event_code>/waiting-room",
+        waiting_room_views.event_waiting_room,
+        name="event_waiting_room",
+    ),
+    path(
+        "event/<str:event_code>/waiting-room/status",
+        waiting_room_views.event_waiting_room_status,
+        name="event_waiting_room_status",
+    ),
     path(
         "event/<str:event_code>/certificate",
         event_registration_views.event_certificate,
@@ -3,7 +3,12 @@
 
 
 from .root import components_demo, index, profile
-from .sso_gateway import SubdomainLoginView, dashboard_auth
+from .sso_gateway import (
+    SubdomainLoginView,
+    SubdomainLogoutView,
+    dashboard_auth,
+    dashboard_verify,
+)
 from .system import RobotsView, page403, page404, page500
 from .team_calendar import team_calendar
 from .user import edit_user_profile  # SignUpView,
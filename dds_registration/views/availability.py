@@ -0,0 +1,24 @@
+# @module dds_registration/views/availability.py
+# @changed 2026.10.19
+
+from django.http import Http404, HttpRequest, JsonResponse
+from django.utils.cache import patch_cache_control
+
+from .helpers.availability import AVAILABILITY_CACHE_TIMEOUT, get_event_availability
+
+
+def event_availability(request: HttpRequest, event_code: str):
+    """Remaining seats (null for no limit) of the event and each of its options; non-public events need a login"""
+    availability = get_event_availability(event_code, request.user)
+    if not availability:
+        raise Http404
+    response = JsonResponse({key: value for key, value in availability.items() if key != "public"})
+    # Non-public events only to their (logged in) visitors: out of shared caches
+    visibility = "public" if availability["public"] else "private"
+    patch_cache_control(response, **{visibility: True}, max_age=AVAILABILITY_CACHE_TIMEOUT)
+    return response
+
+
+__all__ = [
+    event_availability,
+]
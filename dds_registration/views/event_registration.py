@@ -3,18 +3,30 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 from loguru import logger
 
+from ..core.helpers.single_flight import single_flight
 from ..forms import FreeRegistrationForm, RegistrationForm
-from ..models import Event, Payment, Registration, RegistrationOption, Certificate, InvitationLetter
+from ..models import (
+    CapacityExceeded,
+    Certificate,
+    InvitationLetter,
+    Payment,
+    Registration,
+    RegistrationOption,
+)
+from .helpers.event_lookup import get_event_by_code
+from .helpers.option_choices import get_event_options, get_option_choices
+from .helpers.waiting_room import with_waiting_room
 
 
 @login_required
 def event_certificate(request: HttpRequest, event_code: str) -> HttpResponse:
     try:
-        event = Event.objects.get(code=event_code)
+        event = get_event_by_code(event_code)
     except ObjectDoesNotExist:
         raise Http404
 
@@ -23,8 +35,11 @@ def event_certificate(request: HttpRequest, event_code: str) -> HttpResponse:
     if not event.has_certificate or not registration:
         raise Http404
 
+    # Also keeps simultaneous first downloads from creating the certificate twice
     response = HttpResponse(
-        content=bytes(registration.get_certificate().output()),
+        content=single_flight(
+            f"certificate-pdf:registration:{registration.id}", lambda: bytes(registration.get_certificate().output())
+        ),
         content_type="application/pdf"
     )
     response["Content-Disposition"] = f'attachment; filename="DdS event certificate {registration.certificate.uuid}.pdf"'
@@ -38,7 +53,7 @@ def event_certificate_validation(request: HttpRequest, certificate_code: str) ->
         raise Http404
 
     response = HttpResponse(
-        content=bytes(certificate.pdf().output()),
+        content=single_flight(f"certificate-pdf:{certificate.uuid}", lambda: bytes(certificate.pdf().output())),
         content_type="application/pdf"
     )
     response["Content-Disposition"] = f'attachment; filename="DdS event certificate {certificate.uuid}.pdf"'
@@ -48,7 +63,7 @@ def event_certificate_validation(request: HttpRequest, certificate_code: str) ->
 @login_required
 def event_invitation(request: HttpRequest, event_code: str) -> HttpResponse:
     try:
-        event = Event.objects.get(code=event_code)
+        event = get_event_by_code(event_code)
     except ObjectDoesNotExist:
         raise Http404
 
@@ -58,7 +73,9 @@ def event_invitation(request: HttpRequest, event_code: str) -> HttpResponse:
         raise Http404
 
     response = HttpResponse(
-        content=bytes(registration.get_invitation().output()),
+        content=single_flight(
+            f"invitation-pdf:registration:{registration.id}", lambda: bytes(registration.get_invitation().output())
+        ),
         content_type="application/pdf"
     )
     response["Content-Disposition"] = f'attachment; filename="DdS Letter of Invitation {registration.invitation.uuid}.pdf"'
@@ -72,7 +89,7 @@ def event_invitation_validation(request: HttpRequest, invitation_code: str) -> H
         raise Http404
 
     response = HttpResponse(
-        content=bytes(letter.pdf().output()),
+        content=single_flight(f"invitation-pdf:{letter.uuid}", lambda: bytes(letter.pdf().output())),
         content_type="application/pdf"
     )
     response["Content-Disposition"] = f'attachment; filename="DdS Letter of Invitation {letter.uuid}.pdf"'
@@ -80,9 +97,10 @@ def event_invitation_validation(request: HttpRequest, invitation_code: str) -> H
 
 
 @login_required
+@with_waiting_room
 def event_registration(request: HttpRequest, event_code: str):
     try:
-        event = Event.objects.get(code=event_code)
+        event = get_event_by_code(event_code)
     except ObjectDoesNotExist:
         raise Http404
 
@@ -127,7 +145,12 @@ def event_registration(request: HttpRequest, event_code: str):
                         user=request.user,
                         send_update_emails=form.cleaned_data["send_update_emails"],
                     )
-                registration.save()
+                registration.enforce_capacity = True
+                try:
+                    registration.save()
+                except CapacityExceeded:
+                    messages.error(request, f"Sorry, there are no places left for {event.title}.")
+                    return redirect("index")
                 registration.complete_registration()
 
                 if settings.SLACK_REGISTRATIONS_WEBHOOK:
@@ -143,30 +166,39 @@ def event_registration(request: HttpRequest, event_code: str):
                 messages.success(request, f"You have successfully registered for {event.title}.")
                 return redirect("profile")
         else:
+            options = get_event_options(event, free_only=True)
             form = RegistrationForm(
                 data=request.POST,
-                option_choices=[(obj.id, obj.form_label) for obj in RegistrationOption.free_spots(event)],
+                option_choices=get_option_choices(options),
                 credit_cards=event.credit_cards,
             )
 
             if form.is_valid():
-                option = RegistrationOption.objects.get(id=form.cleaned_data["option"])
-                if registration:
-                    # Set up new payment
-                    if registration.payment:
-                        registration.payment.mark_obsolete()
-                    registration.option = option
-                    registration.send_update_emails = form.cleaned_data["send_update_emails"]
-                    registration.status = "PAYMENT_PENDING"
-                else:
-                    registration = Registration(
-                        event=event,
-                        status="PAYMENT_PENDING",
-                        user=request.user,
-                        send_update_emails=form.cleaned_data["send_update_emails"],
-                        option=option,
-                    )
-                registration.save()
+                option = next(option for option in options if str(option.id) == form.cleaned_data["option"])
+                try:
+                    with transaction.atomic():
+                        if registration:
+                            # Set up new payment
+                            if registration.payment:
+                                registration.payment.mark_obsolete()
+                            registration.option = option
+                            registration.send_update_emails = form.cleaned_data["send_update_emails"]
+                            registration.status = "PAYMENT_PENDING"
+                        else:
+                            registration = Registration(
+                                event=event,
+                                status="PAYMENT_PENDING",
+                                user=request.user,
+                                send_update_emails=form.cleaned_data["send_update_emails"],
+                                option=option,
+                            )
+                        registration.enforce_capacity = True
+                        registration.save()
+                except CapacityExceeded as err:
+                    messages.error(request, f"Sorry, there are no places left for {err.target}.")
+                    if isinstance(err.target, RegistrationOption):
+                        return redirect("event_registration", event_code=event.code)
+                    return redirect("index")
 
                 if settings.SLACK_REGISTRATIONS_WEBHOOK:
                     requests.post(
@@ -262,7 +294,7 @@ def event_registration(request: HttpRequest, event_code: str):
             option = registration.option.id if registration.option else None
 
             form = RegistrationForm(
-                option_choices=[(obj.id, obj.form_label) for obj in RegistrationOption.free_spots(event)],
+                option_choices=get_option_choices(get_event_options(event, free_only=True)),
                 credit_cards=event.credit_cards,
                 initial={
                     "name": name,
@@ -274,7 +306,7 @@ def event_registration(request: HttpRequest, event_code: str):
             )
         else:
             form = RegistrationForm(
-                option_choices=[(obj.id, obj.form_label) for obj in event.options.all()],
+                option_choices=get_option_choices(get_event_options(event)),
                 credit_cards=event.credit_cards,
                 initial={
                     "name": request.user.get_full_name(),
@@ -0,0 +1,62 @@
+# @module dds_registration/views/helpers/availability.py
+# @changed 2026.10.19
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+
+from ...models import Event, RegistrationOption, User
+
+# Remaining seats of an event and its options, for the registration form to poll. Cached for a few seconds and
+# dropped by `signals` whenever a registration, the event or one of its options changes.
+AVAILABILITY_CACHE_TIMEOUT = 10
+
+
+def get_availability_cache_key(event_code: str) -> str:
+    return f"availability:{event_code}"
+
+
+def seats_left(max_participants: int, active_registration_count: int) -> int | None:
+    """None for no limit"""
+    if not max_participants:
+        return None
+    return max(max_participants - active_registration_count, 0)
+
+
+def load_event_availability(event_code: str) -> dict | None:
+    options = list(RegistrationOption.objects.filter(event__code=event_code).select_related("event").order_by("pk"))
+    event = options[0].event if options else Event.objects.filter(code=event_code).first()
+    if not event:
+        return None
+    return {
+        "event": event.code,
+        "public": event.public,
+        "seats_left": seats_left(event.max_participants, event.active_registration_count),
+        "options": [
+            {
+                "id": option.id,
+                "item": option.item,
+                "seats_left": seats_left(option.max_participants, option.active_registration_count),
+            }
+            for option in options
+        ],
+    }
+
+
+def get_event_availability(event_code: str, user: User | AnonymousUser) -> dict | None:
+    """None for an unknown event, or an event that isn't public for an anonymous user"""
+    key = get_availability_cache_key(event_code)
+    availability = cache.get(key)
+    if availability is None:
+        # Unknown events are cached too (as {}), not to hit the database for each poll
+        availability = load_event_availability(event_code) or {}
+        cache.set(key, availability, AVAILABILITY_CACHE_TIMEOUT)
+    if not availability or not (availability["public"] or user.is_authenticated):
+        return None
+    return availability
+
+
+__all__ = [
+    get_event_availability,
+    get_availability_cache_key,
+    AVAILABILITY_CACHE_TIMEOUT,
+]
@@ -0,0 +1,121 @@
+# @module dds_registration/views/helpers/dashboard_access.py
+# @changed 2026.10.19
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from ...core.helpers.cache_invalidation import KeyNamespace
+from ...models import User
+
+# Which dashboards (`dashboard_auth` keys) each user may open, in the shared cache for a short time: nginx asks for
+# every asset of a dashboard page. `signals` drop a user's entry when the user or their groups change, and all of
+# them when a dashboard group changes.
+DASHBOARD_ACCESS_CACHE_TIMEOUT = 60
+DASHBOARD_ACCESS = KeyNamespace("dashboard-access")
+DASHBOARD_GROUP_PREFIX = "dashboard:"
+
+
+def get_dashboard_access_cache_key(user_id: int) -> str:
+    return DASHBOARD_ACCESS.key(user_id)
+
+
+def load_dashboard_access(user: User) -> dict:
+    """
+    - `active`, `superuser`: the user's flags;
+    - `session_hash`: the user's session auth hash, to check a session without loading the user;
+    - `keys`: the dashboards the user's groups (`dashboard:<key>`) give access to.
+    """
+    names = user.groups.filter(name__startswith=DASHBOARD_GROUP_PREFIX).values_list("name", flat=True)
+    return {
+        "active": user.is_active,
+        "superuser": user.is_superuser,
+        "session_hash": user.get_session_auth_hash(),
+        "keys": {name.removeprefix(DASHBOARD_GROUP_PREFIX) for name in names},
+    }
+
+
+def store_dashboard_access(user: User) -> dict:
+    access = load_dashboard_access(user)
+    cache.set(get_dashboard_access_cache_key(user.pk), access, DASHBOARD_ACCESS_CACHE_TIMEOUT)
+    return access
+
+
+def get_dashboard_access(user: User) -> dict:
+    access = cache.get(get_dashboard_access_cache_key(user.pk))
+    return store_dashboard_access(user) if access is None else access
+
+
+def get_dashboard_access_by_id(user_id) -> dict | None:
+    """The same, for a session's user id: None for an unknown user"""
+    access = cache.get(get_dashboard_access_cache_key(user_id))
+    if access is None:
+        user = get_user_model()._default_manager.filter(pk=user_id).first()
+        access = store_dashboard_access(user) if user else None
+    return access
+
+
+def is_dashboard_allowed(access: dict, key: str) -> bool:
+    return access["superuser"] or key in access["keys"]
+
+
+# Dashboard token: a short-lived cookie signed with the secret key (HMAC, `django.core.signing`), listing the
+# dashboards the user may open, so `dashboard_verify` can be answered without the database or the session
+# (`DashboardAuthMiddleware`). Issued at login and by the full checks; an expired one falls back to them.
+DASHBOARD_TOKEN_COOKIE_NAME = getattr(settings, "DASHBOARD_TOKEN_COOKIE_NAME", "dds_dashboard_token")
+DASHBOARD_TOKEN_MAX_AGE = getattr(settings, "DASHBOARD_TOKEN_MAX_AGE", 5 * 60)
+DASHBOARD_TOKEN_SALT = "dds_registration.dashboard-token"
+
+
+def get_dashboard_token(user_id, access: dict) -> str:
+    # Superusers may open any dashboard: no list
+    keys = None if access["superuser"] else sorted(access["keys"])
+    return signing.dumps({"user": user_id, "keys": keys}, salt=DASHBOARD_TOKEN_SALT, compress=True)
+
+
+def read_dashboard_token(token: str | None) -> dict | None:
+    """The token's data, or None when it's missing, tampered with or expired"""
+    if not token:
+        return None
+    try:
+        return signing.loads(token, salt=DASHBOARD_TOKEN_SALT, max_age=DASHBOARD_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return None
+
+
+def is_dashboard_allowed_by_token(token: dict, key: str) -> bool:
+    return token["keys"] is None or key in token["keys"]
+
+
+def set_dashboard_token_cookie(response: HttpResponse, user_id, access: dict):
+    # With the session cookie's domain: in production, shared with the dashboard host
+    response.set_cookie(
+        DASHBOARD_TOKEN_COOKIE_NAME,
+        get_dashboard_token(user_id, access),
+        max_age=DASHBOARD_TOKEN_MAX_AGE,
+        domain=settings.SESSION_COOKIE_DOMAIN,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite="Lax",
+    )
+
+
+def delete_dashboard_token_cookie(response: HttpResponse):
+    response.delete_cookie(DASHBOARD_TOKEN_COOKIE_NAME, domain=settings.SESSION_COOKIE_DOMAIN, samesite="Lax")
+
+
+__all__ = [
+    DASHBOARD_ACCESS,
+    DASHBOARD_GROUP_PREFIX,
+    get_dashboard_access_cache_key,
+    get_dashboard_access,
+    get_dashboard_access_by_id,
+    is_dashboard_allowed,
+    DASHBOARD_TOKEN_COOKIE_NAME,
+    read_dashboard_token,
+    is_dashboard_allowed_by_token,
+    set_dashboard_token_cookie,
+    delete_dashboard_token_cookie,
+]
@@ -0,0 +1,75 @@
+# @module dds_registration/views/helpers/event_listing.py
+# @changed 2026.10.19
+
+from datetime import date, timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import Exists, F, Min, OuterRef, Prefetch, Q
+
+from ...models import REGISTRATION_ACTIVE_QUERY, Event, Registration, User
+
+
+def get_open_events(user: User | AnonymousUser) -> list[Event]:
+    """
+    Public events the user can register for, as `Event.can_register` would decide, with `event.registration` set
+    to the user's active registration (or None).
+
+    The registration/application date bands and the capacity check are done in SQL, so this is a single query for
+    the events plus one for the user's registrations (none for anonymous users).
+    """
+    today = date.today()
+    registration_band = Q(registration_open__lte=today, registration_close__gte=today)
+    application_band = Q(application_open__lte=today, application_close__gte=today)
+
+    events = Event.objects.filter(public=True)
+    if user.is_authenticated:
+        # Only users who were selected can register after application deadline
+        events = events.alias(
+            selected=Exists(Registration.objects.filter(event=OuterRef("pk"), user=user, status="SELECTED"))
+        )
+        application_bands = ~Q(selected=True) & application_band | Q(selected=True) & registration_band
+        events = events.prefetch_related(
+            Prefetch(
+                "registrations",
+                queryset=Registration.objects.filter(REGISTRATION_ACTIVE_QUERY, user=user),
+                to_attr="user_registrations",
+            )
+        )
+    else:
+        application_bands = application_band
+    events = events.filter(
+        Q(application_form__isnull=True) & registration_band | Q(application_form__isnull=False) & application_bands,
+        Q(max_participants=0) | Q(max_participants__gt=F("active_registration_count")),
+    ).order_by("pk")
+
+    events = list(events)
+    for event in events:
+        registrations = getattr(event, "user_registrations", None)
+        event.registration = registrations[0] if registrations else None
+    return events
+
+
+def get_next_listing_change(today: date | None = None) -> date | None:
+    """
+    The next day a public event enters or leaves its registration or application band (so the listing changes on
+    that day at midnight), or None.
+    """
+    today = today or date.today()
+    events = Event.objects.filter(public=True)
+    days = events.aggregate(
+        registration_open=Min("registration_open", filter=Q(registration_open__gt=today)),
+        registration_close=Min("registration_close", filter=Q(registration_close__gte=today)),
+        application_open=Min("application_open", filter=Q(application_open__gt=today)),
+        application_close=Min("application_close", filter=Q(application_close__gte=today)),
+    )
+    # The bands include their last day: they end on the next one
+    for end in ("registration_close", "application_close"):
+        if days[end]:
+            days[end] += timedelta(days=1)
+    return min(filter(None, days.values()), default=None)
+
+
+__all__ = [
+    get_open_events,
+    get_next_listing_change,
+]
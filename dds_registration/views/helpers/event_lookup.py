@@ -0,0 +1,68 @@
+# @module dds_registration/views/helpers/event_lookup.py
+# @changed 2026.10.19
+
+from django.core.cache import cache
+from django.db.models import IntegerField, Value
+
+from ...models import Event, RegistrationOption
+
+# Events by code, with their application form and options, in the shared cache. `signals` drop an entry when the
+# event or one of its options is edited, not on registrations: the registration counters, which change with each of
+# them, are read fresh instead. Unknown codes are cached too, for a shorter time.
+EVENT_CACHE_TIMEOUT = 5 * 60
+UNKNOWN_EVENT_CACHE_TIMEOUT = 10
+
+
+def get_event_cache_key(event_code: str) -> str:
+    return f"event:{event_code}"
+
+
+def load_event(event_code: str) -> Event | None:
+    return Event.objects.select_related("application_form").prefetch_related("options").filter(code=event_code).first()
+
+
+def load_registration_counts(event: Event) -> dict:
+    """The current `active_registration_count` of the event (under None) and of its options (by id), in one query"""
+    counts = Event.objects.filter(pk=event.pk).values_list(
+        Value(None, output_field=IntegerField()), "active_registration_count"
+    )
+    options = RegistrationOption.objects.filter(event_id=event.pk).values_list("pk", "active_registration_count")
+    return dict(counts.union(options, all=True))
+
+
+def set_registration_counts(event: Event):
+    counts = load_registration_counts(event)
+    event.active_registration_count = counts.get(None, event.active_registration_count)
+    for option in event.options.all():
+        option.active_registration_count = counts.get(option.pk, option.active_registration_count)
+
+
+def get_event_by_code(event_code: str, counters: bool = True) -> Event:
+    """
+    The event with `application_form` and `options` loaded (a fresh copy on each call: it may be changed freely).
+    Raises `Event.DoesNotExist` for unknown codes.
+
+    The registration counters of the event and its options are read from the database (one query for a cached event)
+    unless `counters` is False, for callers that don't look at them.
+    """
+    key = get_event_cache_key(event_code)
+    event = cache.get(key)
+    if event is None:
+        # With current counters
+        event = load_event(event_code)
+        if event:
+            cache.set(key, event, EVENT_CACHE_TIMEOUT)
+        else:
+            cache.set(key, False, UNKNOWN_EVENT_CACHE_TIMEOUT)
+    elif event and counters:
+        set_registration_counts(event)
+    if not event:
+        raise Event.DoesNotExist(f'Not found event code "{event_code}"')
+    return event
+
+
+__all__ = [
+    get_event_by_code,
+    get_event_cache_key,
+    EVENT_CACHE_TIMEOUT,
+]
@@ -17,6 +17,7 @@ from loguru import logger
 
 from ...core.helpers.errors import errorToString
 from ...models import REGISTRATION_ACTIVE_QUERY, Event, Registration, RegistrationOption
+from .event_lookup import get_event_by_code
 
 # For django_registration related stuff, see:
 # .venv/Lib/site-packages/django_registration/backends/activation/views.py
@@ -135,7 +136,7 @@ def get_event_registration_form_context(request: HttpRequest, event_code: str, c
 
     # Try to get event object by code...
     try:
-        event = Event.objects.get(code=event_code)
+        event = get_event_by_code(event_code)
     except Exception as err:
         error_text = 'Not found event code "{}"'.format(event_code)
         messages.error(request, error_text)
@@ -199,7 +200,7 @@ def get_event_registration_form_context(request: HttpRequest, event_code: str, c
 
     # Try to get all available for this event options...
     try:
-        reg_options = RegistrationOption.objects.filter(event=event)
+        reg_options = event.options.all()
         context["reg_options"] = reg_options
     except Exception as err:
         error_text = 'Got error while finding registration options for event "{}"'.format(event_code)
@@ -325,7 +326,7 @@ def show_registration_form_success(request: HttpRequest, event_code: str, templa
 
     # Try to get event object by code...
     try:
-        event = Event.objects.get(code=event_code)
+        event = get_event_by_code(event_code)
     except Exception as err:
         error_text = 'Not found event "{}"'.format(event_code)
         messages.error(request, error_text)
@@ -368,7 +369,7 @@ def get_event_registration_context(request: HttpRequest, event_code: str):
     registration = None
     # Try to get event object by code...
     try:
-        event = Event.objects.get(code=event_code)
+        event = get_event_by_code(event_code)
         registration = event.registrations.get(REGISTRATION_ACTIVE_QUERY, user=user, event=event)
         if not registration:
             raise Exception("Not found active registrations")
@@ -0,0 +1,43 @@
+# @module dds_registration/views/helpers/fragment_cache.py
+# @changed 2026.10.19
+
+from django.contrib.auth.models import AnonymousUser
+
+from ...core.helpers.cache_invalidation import KeyNamespace
+from ...models import Event, User
+
+# Template fragments cached with the `{% cache %}` tag for `settings.FRAGMENT_CACHE_TIMEOUT` seconds, keyed on the
+# stamps below (put in the page context by the views). Both include the events' version (`EVENT_FRAGMENTS`, bumped
+# by `signals` when an event or option changes), plus what the fragment shows of the user's own data:
+#
+# - `events-list-block` (index): which events are listed with which of the user's registrations;
+# - `events-list-table` (profile): the registrations' status, option and payment, and the participant counts.
+#
+# The membership splash and choice list only depend on the code: they're cached under their name.
+EVENT_FRAGMENTS = KeyNamespace("event-fragment")
+
+
+def get_events_list_stamp(events: list[Event], user: User | AnonymousUser) -> list:
+    registrations = [(event.pk, event.registration.pk if event.registration else None) for event in events]
+    return [EVENT_FRAGMENTS.version, user.is_authenticated, registrations]
+
+
+def get_registrations_table_stamp(active_regs: list[dict]) -> list:
+    rows = [
+        (
+            row["registration"].pk,
+            row["registration"].status,
+            row["registration"].option_id,
+            row["payment"] and (row["payment"].pk, row["payment"].status, row["payment"].data.get("method")),
+            row["participants"],
+        )
+        for row in active_regs
+    ]
+    return [EVENT_FRAGMENTS.version, rows]
+
+
+__all__ = [
+    EVENT_FRAGMENTS,
+    get_events_list_stamp,
+    get_registrations_table_stamp,
+]
@@ -0,0 +1,25 @@
+# @module dds_registration/views/helpers/option_choices.py
+# @changed 2026.10.19
+
+from ...models import Event, RegistrationOption
+
+
+def get_event_options(event: Event, free_only: bool = False) -> list[RegistrationOption]:
+    """
+    The event's options, from one query at most (none for events from `get_event_by_code`, which come with their
+    options). Each option refers back to `event`, so labels and prices don't load it again.
+    """
+    options = list(event.options.all())
+    if free_only:
+        options = [option for option in options if option.has_free_spots]
+    return options
+
+
+def get_option_choices(options: list[RegistrationOption]) -> list[tuple[int, str]]:
+    return [(option.id, option.form_label) for option in options]
+
+
+__all__ = [
+    get_event_options,
+    get_option_choices,
+]
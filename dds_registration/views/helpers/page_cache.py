@@ -0,0 +1,37 @@
+# @module dds_registration/views/helpers/page_cache.py
+# @changed 2026.10.19
+
+import hashlib
+from datetime import datetime, time
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from ...core.helpers.cache_invalidation import KeyNamespace
+from .event_listing import get_next_listing_change
+
+# Whole pages served to anonymous visitors (see `AnonymousPageCacheMiddleware`). `signals` drop them all when an
+# event or option changes, or an event gets full or has places again; otherwise they expire at the next midnight
+# the event listing changes on, or after `ANONYMOUS_PAGE_CACHE_TIMEOUT` seconds.
+ANONYMOUS_PAGES = KeyNamespace("anonymous-page")
+
+
+def get_anonymous_page_cache_timeout() -> int:
+    timeout = getattr(settings, "ANONYMOUS_PAGE_CACHE_TIMEOUT", 15 * 60)
+    next_change = get_next_listing_change()
+    if next_change:
+        until_change = datetime.combine(next_change, time.min) - datetime.now()
+        timeout = min(timeout, int(until_change.total_seconds()))
+    return max(timeout, 0)
+
+
+def get_anonymous_page_cache_key(request: HttpRequest) -> str:
+    url = hashlib.md5(f"{request.get_host()}{request.get_full_path()}".encode()).hexdigest()
+    return ANONYMOUS_PAGES.key(url)
+
+
+__all__ = [
+    ANONYMOUS_PAGES,
+    get_anonymous_page_cache_key,
+    get_anonymous_page_cache_timeout,
+]
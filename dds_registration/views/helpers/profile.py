@@ -0,0 +1,50 @@
+# @module dds_registration/views/helpers/profile.py
+# @changed 2026.10.19
+
+from ...models import Event, User, get_cached_user_summary, store_user_summary
+from .fragment_cache import get_registrations_table_stamp
+
+
+def get_profile_context(user: User) -> dict:
+    """
+    Everything the profile page shows: the cached user summary (`models.get_user_summary`), plus one query for the
+    current participant counts (none when the summary has just been loaded).
+
+    - `active_regs`: one dict per active registration, with its `event`, `payment`, `option` and the event's
+      active `participants` count;
+    - `membership` (or None) with its payment, and `is_member`;
+    - `registrations_stamp`: the key of the cached registrations table (see `views.helpers.fragment_cache`).
+    """
+    summary = get_cached_user_summary(user)
+    participants = {}
+    if summary is None:
+        summary = store_user_summary(user)
+    elif summary["registrations"]:
+        # Other people's registrations don't invalidate the summary: read the counters fresh
+        participants = dict(
+            Event.objects.filter(
+                pk__in={registration.event_id for registration in summary["registrations"]}
+            ).values_list("pk", "active_registration_count")
+        )
+    registrations = summary["registrations"]
+    active_regs = [
+        {
+            "registration": registration,
+            "event": registration.event,
+            "payment": registration.payment,
+            "option": registration.option,
+            "participants": participants.get(registration.event_id, registration.event.active_registration_count),
+        }
+        for registration in registrations
+    ]
+    return {
+        "active_regs": active_regs,
+        "registrations_stamp": get_registrations_table_stamp(active_regs),
+        "membership": summary["membership"],
+        "is_member": user.is_member,
+    }
+
+
+__all__ = [
+    get_profile_context,
+]
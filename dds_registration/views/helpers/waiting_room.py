@@ -0,0 +1,190 @@
+# @module dds_registration/views/helpers/waiting_room.py
+# @changed 2026.10.19
+
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import redirect
+
+from ...models import REGISTRATION_ACTIVE_QUERY, Event, Registration
+from .event_lookup import get_event_by_code
+
+# Opt-in admission queue for the registration form of busy events (`Event.waiting_room_size` > 0).
+#
+# Each new registrant draws an ordered ticket (`cache.incr`), kept in a signed cookie. At most `waiting_room_size`
+# tickets hold a lease on the form at the same time; the others wait on a cached polling page. Leases end when the
+# registration is saved, or expire; tickets whose page stopped polling are skipped when the head of the queue moves.
+#
+# All state lives in the Django cache: it must be shared by all worker processes (see `CACHES`).
+
+WAITING_ROOM_SALT = getattr(settings, "WAITING_ROOM_SALT", "waiting-room")
+# Seconds between two polls of the waiting page
+WAITING_ROOM_POLL = getattr(settings, "WAITING_ROOM_POLL", 5)
+# A waiting ticket that has not polled for that long is skipped
+WAITING_ROOM_ABANDONED = getattr(settings, "WAITING_ROOM_ABANDONED", 30)
+# Time for an admitted registrant to reach the form, then to fill it (renewed on each form request)
+WAITING_ROOM_ARRIVAL = getattr(settings, "WAITING_ROOM_ARRIVAL", 60)
+WAITING_ROOM_LEASE = getattr(settings, "WAITING_ROOM_LEASE", 15 * 60)
+# How long a ticket stays valid
+WAITING_ROOM_TICKET_MAX_AGE = 24 * 60 * 60
+
+
+class WaitingRoomBusy(Exception):
+    """The queue lock could not be taken in time"""
+
+
+class WaitingRoom:
+    def __init__(self, event: Event):
+        self.event = event
+        self.size = event.waiting_room_size
+        prefix = f"waiting-room:{event.id}"
+        self.tickets_key = f"{prefix}:tickets"
+        self.state_key = f"{prefix}:state"
+        self.lock_key = f"{prefix}:lock"
+        self.seen_prefix = f"{prefix}:seen:"
+
+    @contextmanager
+    def lock(self, wait: float = 2):
+        deadline = time.monotonic() + wait
+        while not cache.add(self.lock_key, 1, timeout=5):
+            if time.monotonic() > deadline:
+                raise WaitingRoomBusy(self.event.code)
+            time.sleep(0.01)
+        try:
+            yield
+        finally:
+            cache.delete(self.lock_key)
+
+    def join(self) -> int:
+        cache.add(self.tickets_key, 0, timeout=None)
+        ticket = cache.incr(self.tickets_key)
+        cache.set(f"{self.seen_prefix}{ticket}", 1, WAITING_ROOM_ABANDONED)
+        return ticket
+
+    def poll(self, ticket: int, entering: bool = False) -> tuple[bool, int]:
+        """
+        Return (admitted, number of tickets ahead) for the ticket, letting in the next tickets if there is room.
+        `entering` is for requests to the form itself: it extends the lease of an admitted ticket.
+        """
+        cache.set(f"{self.seen_prefix}{ticket}", 1, WAITING_ROOM_ABANDONED)
+        now = time.time()
+        with self.lock():
+            head, leases = cache.get(self.state_key, (0, {}))
+            leases = {leased: expires for leased, expires in leases.items() if expires > now}
+            if ticket <= head and ticket not in leases and len(leases) < self.size:
+                # Its turn came and went (skipped or lease expired): back in as soon as there is room
+                leases[ticket] = now + WAITING_ROOM_ARRIVAL
+            last = cache.get(self.tickets_key, 0)
+            while len(leases) < self.size and head < last:
+                candidates = range(head + 1, min(last, head + 100) + 1)
+                seen = cache.get_many([f"{self.seen_prefix}{candidate}" for candidate in candidates])
+                for candidate in candidates:
+                    head = candidate
+                    if candidate == ticket or f"{self.seen_prefix}{candidate}" in seen:
+                        leases[candidate] = now + WAITING_ROOM_ARRIVAL
+                        if len(leases) >= self.size:
+                            break
+            admitted = ticket in leases
+            if admitted and entering:
+                leases[ticket] = now + WAITING_ROOM_LEASE
+            cache.set(self.state_key, (head, leases), timeout=WAITING_ROOM_TICKET_MAX_AGE)
+        return admitted, 0 if admitted else max(ticket - head - 1, 0)
+
+    def leave(self, ticket: int):
+        with self.lock():
+            head, leases = cache.get(self.state_key, (0, {}))
+            leases.pop(ticket, None)
+            cache.set(self.state_key, (head, leases), timeout=WAITING_ROOM_TICKET_MAX_AGE)
+
+
+def get_waiting_room_cookie_name(event_code: str) -> str:
+    return f"waiting_room_{event_code}"
+
+
+def get_waiting_room_ticket(request: HttpRequest, event: Event) -> int | None:
+    token = request.COOKIES.get(get_waiting_room_cookie_name(event.code))
+    if not token:
+        return None
+    try:
+        event_id, ticket = signing.loads(token, salt=WAITING_ROOM_SALT, max_age=WAITING_ROOM_TICKET_MAX_AGE)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    return ticket if event_id == event.id else None
+
+
+def set_waiting_room_ticket(response: HttpResponse, event: Event, ticket: int):
+    response.set_cookie(
+        get_waiting_room_cookie_name(event.code),
+        signing.dumps([event.id, ticket], salt=WAITING_ROOM_SALT),
+        max_age=WAITING_ROOM_TICKET_MAX_AGE,
+        path=f"/event/{event.code}/",
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite="Lax",
+    )
+
+
+def delete_waiting_room_ticket(response: HttpResponse, event: Event):
+    response.delete_cookie(get_waiting_room_cookie_name(event.code), path=f"/event/{event.code}/")
+
+
+def with_waiting_room(view):
+    """
+    Send new registrants of events with a waiting room to the queue (`event_waiting_room`) until their ticket is
+    admitted; release the ticket once they have an active registration.
+    """
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, event_code: str):
+        try:
+            event = get_event_by_code(event_code, counters=False)
+        except Event.DoesNotExist:
+            event = None
+        if not event or not event.waiting_room_size:
+            return view(request, event_code)
+
+        def is_registered():
+            return Registration.objects.filter(REGISTRATION_ACTIVE_QUERY, event=event, user=request.user).exists()
+
+        ticket = get_waiting_room_ticket(request, event)
+        if not ticket and is_registered():
+            # Editing an existing registration doesn't need a place in the queue
+            return view(request, event_code)
+
+        room = WaitingRoom(event)
+        new_ticket = not ticket
+        if new_ticket:
+            ticket = room.join()
+        try:
+            admitted, _ahead = room.poll(ticket, entering=True)
+        except WaitingRoomBusy:
+            admitted = False
+
+        if not admitted:
+            response = redirect("event_waiting_room", event_code=event.code)
+        else:
+            response = view(request, event_code)
+            if is_registered():
+                room.leave(ticket)
+                delete_waiting_room_ticket(response, event)
+                return response
+        if new_ticket:
+            set_waiting_room_ticket(response, event, ticket)
+        return response
+
+    return wrapper
+
+
+__all__ = [
+    WaitingRoom,
+    WaitingRoomBusy,
+    get_waiting_room_ticket,
+    set_waiting_room_ticket,
+    delete_waiting_room_ticket,
+    with_waiting_room,
+]
@@ -2,6 +2,7 @@ from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
 from django.http import Http404, HttpRequest, HttpResponse
 
+from ..core.helpers.single_flight import single_flight
 from ..models import Payment
 
 
@@ -15,7 +16,8 @@ def invoice_download(request: HttpRequest, payment_id: int) -> HttpResponse:
     if payment.data["user"]["id"] != request.user.id:
         raise PermissionDenied()
 
-    response = HttpResponse(content=bytes(payment.invoice_pdf().output()), content_type="application/pdf")
+    content = single_flight(f"invoice-pdf:{payment.id}", lambda: bytes(payment.invoice_pdf().output()))
+    response = HttpResponse(content=content, content_type="application/pdf")
     response["Content-Disposition"] = f'attachment; filename="DdS invoice {payment.invoice_no}.pdf"'
     return response
 
@@ -30,6 +32,7 @@ def receipt_download(request: HttpRequest, payment_id: int) -> HttpResponse:
     if payment.data["user"]["id"] != request.user.id:
         raise PermissionDenied()
 
-    response = HttpResponse(content=bytes(payment.receipt_pdf().output()), content_type="application/pdf")
+    content = single_flight(f"receipt-pdf:{payment.id}", lambda: bytes(payment.receipt_pdf().output()))
+    response = HttpResponse(content=content, content_type="application/pdf")
     response["Content-Disposition"] = f'attachment; filename="DdS receipt {payment.invoice_no}.pdf"'
     return response
@@ -5,19 +5,23 @@ from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest
 from django.shortcuts import redirect, render
 
-from ..models import Event, Registration
+from ..core.helpers.single_flight import single_flight
+from .helpers.event_listing import get_open_events
+from .helpers.fragment_cache import get_events_list_stamp
+from .helpers.profile import get_profile_context
 
 
 def index(request: HttpRequest):
-    events = [obj for obj in Event.objects.filter(public=True) if obj.can_register(request.user)]
-    if request.user:
-        for event in events:
-            event.registration = event.get_active_event_registration_for_user(request.user)
+    if request.user.is_authenticated:
+        events = get_open_events(request.user)
+    else:
+        # The same for all anonymous visitors: computed once for simultaneous ones
+        events = single_flight("open-events:anonymous", lambda: get_open_events(request.user))
 
     return render(
         request=request,
         template_name="dds_registration/index.html.django",
-        context={"user": request.user, "events": events},
+        context={"user": request.user, "events": events, "events_stamp": get_events_list_stamp(events, request.user)},
     )
 
 
@@ -28,7 +32,7 @@ def profile(request: HttpRequest):
     return render(
         request=request,
         template_name="dds_registration/profile.html.django",
-        context={"active_regs": Registration.active_for_user(request.user), "user": request.user},
+        context={"user": request.user, **get_profile_context(request.user)},
     )
 
 
@@ -3,9 +3,16 @@
 # dashboard.d-d-s.ch behind this app's SSO, authorised per user and per route.
 
 from django.conf import settings
-from django.contrib.auth.views import LoginView
+from django.contrib.auth.views import LoginView, LogoutView
 from django.http import HttpRequest, HttpResponse
 
+from .helpers.dashboard_access import (
+    delete_dashboard_token_cookie,
+    get_dashboard_access,
+    is_dashboard_allowed,
+    set_dashboard_token_cookie,
+)
+
 
 def dashboard_auth(request: HttpRequest, key: str) -> HttpResponse:
     """Target for nginx ``auth_request`` -- one route (``key``) per dashboard.
@@ -19,11 +26,29 @@ def dashboard_auth(request: HttpRequest, key: str) -> HttpResponse:
     The route ``key`` arrives from the URL and authorisation is checked against
     group membership, so the private dashboard names live only in nginx config
     and the database -- never in this (public) repo.
+
+    The user's dashboards are cached (``views.helpers.dashboard_access``), and
+    most calls are answered before the middleware stack by
+    ``DashboardAuthMiddleware``. Responses to logged in users renew their
+    dashboard token.
     """
     if not request.user.is_authenticated:
         return HttpResponse(status=401)
-    authorised = request.user.is_superuser or request.user.groups.filter(name=f"dashboard:{key}").exists()
-    return HttpResponse(status=200 if authorised else 403)
+    access = get_dashboard_access(request.user)
+    response = HttpResponse(status=200 if is_dashboard_allowed(access, key) else 403)
+    set_dashboard_token_cookie(response, request.user.pk, access)
+    return response
+
+
+def dashboard_verify(request: HttpRequest, key: str) -> HttpResponse:
+    """Token-based ``auth_request`` target, with the same answers.
+
+    A valid dashboard token cookie is checked by ``DashboardAuthMiddleware``
+    alone, without the database or the session. This view only runs without
+    one (missing or expired): it makes the full check and issues a new token,
+    which nginx forwards to the browser (see ``deployment.md``).
+    """
+    return dashboard_auth(request, key)
 
 
 class SubdomainLoginView(LoginView):
@@ -37,5 +62,20 @@ class SubdomainLoginView(LoginView):
     def get_success_url_allowed_hosts(self) -> set[str]:
         return {self.request.get_host(), settings.DASHBOARD_HOST}
 
+    def form_valid(self, form):
+        # Give the dashboard token along with the session
+        response = super().form_valid(form)
+        set_dashboard_token_cookie(response, self.request.user.pk, get_dashboard_access(self.request.user))
+        return response
+
+
+class SubdomainLogoutView(LogoutView):
+    """Logout view that also drops the dashboard token."""
+
+    def post(self, request, *args, **kwargs):
+        response = super().post(request, *args, **kwargs)
+        delete_dashboard_token_cookie(response)
+        return response
+
 
-__all__ = ["dashboard_auth", "SubdomainLoginView"]
+__all__ = ["dashboard_auth", "dashboard_verify", "SubdomainLoginView", "SubdomainLogoutView"]
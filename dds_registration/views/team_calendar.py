@@ -1,26 +1,112 @@
 # @module dds_registration/views/team_calendar.py
 # Serve the private DdS team calendar behind login.
 
+import gzip
+import hashlib
+import re
+import threading
 from pathlib import Path
 
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_safe
+
+try:
+    import brotli  # Optional: `pip install dds_registration[brotli]`
+except ImportError:
+    brotli = None
 
 # The calendar is a self-contained HTML document shipped in the repo, outside
 # `static/` so it is never served publicly -- the only way in is this gated view.
 CALENDAR_HTML_PATH = Path(__file__).resolve().parent.parent / "team_calendar" / "index.html"
 
+# Preferred first
+CALENDAR_ENCODINGS = ["br", "gzip"] if brotli else ["gzip"]
+
+re_accept_encoding = re.compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*$")
+
+
+class CalendarDocument:
+    """The calendar file as loaded at `mtime`, with its compressed variants and their ETags"""
+
+    def __init__(self, path: Path):
+        self.mtime = path.stat().st_mtime_ns
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()[:32]
+        self.variants = {"identity": content, "gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli:
+            self.variants["br"] = brotli.compress(content, quality=11)
+        # Strong ETags: one per encoded representation
+        self.etags = {
+            encoding: f'"{digest}"' if encoding == "identity" else f'"{digest}-{encoding}"'
+            for encoding in self.variants
+        }
+
+
+_document: CalendarDocument | None = None
+_document_lock = threading.Lock()
+
+
+def get_calendar_document() -> CalendarDocument:
+    """Loaded once per process, and again when the file changes"""
+    global _document
+    document = _document
+    if document is None or document.mtime != CALENDAR_HTML_PATH.stat().st_mtime_ns:
+        with _document_lock:
+            document = _document
+            if document is None or document.mtime != CALENDAR_HTML_PATH.stat().st_mtime_ns:
+                document = _document = CalendarDocument(CALENDAR_HTML_PATH)
+    return document
+
+
+def get_calendar_encoding(request: HttpRequest) -> str:
+    accepted = {}
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        match = re_accept_encoding.match(item)
+        if match:
+            try:
+                accepted[match[1].lower()] = float(match[2] or 1)
+            except ValueError:
+                pass
+    for encoding in CALENDAR_ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+def is_not_modified(request: HttpRequest, etag: str) -> bool:
+    # Weak comparison, as for any `If-None-Match`
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    return "*" in etags or etag in (tag.removeprefix("W/") for tag in etags)
+
 
 @login_required
+@require_safe
 def team_calendar(request: HttpRequest) -> HttpResponse:
     """Return the team calendar page to authenticated users only.
 
     Unauthenticated requests are redirected to ``/accounts/login/?next=`` by
     ``login_required``. The page is standalone HTML, so it is served verbatim
-    rather than through the template engine.
+    rather than through the template engine: compressed when the client
+    accepts it, and as a 304 when the client's copy (``If-None-Match``) is
+    current.
     """
-    html = CALENDAR_HTML_PATH.read_text(encoding="utf-8")
-    return HttpResponse(html)
+    document = get_calendar_document()
+    encoding = get_calendar_encoding(request)
+    etag = document.etags[encoding]
+    if is_not_modified(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(document.variants[encoding])
+        if encoding != "identity":
+            response["Content-Encoding"] = encoding
+    response["ETag"] = etag
+    patch_vary_headers(response, ["Accept-Encoding"])
+    # The page auto-refreshes: revalidate each time, kept out of shared caches
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 __all__ = [team_calendar]
@@ -0,0 +1,80 @@
+# @module dds_registration/views/waiting_room.py
+# @changed 2026.10.19
+
+from django.core.cache import cache
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.views.decorators.cache import never_cache
+
+from ..models import Event
+from .helpers.waiting_room import (
+    WAITING_ROOM_POLL,
+    WaitingRoom,
+    WaitingRoomBusy,
+    get_waiting_room_ticket,
+)
+
+# The waiting page and its status endpoint get the whole queue while registration is busy: no session or user
+# lookups, the event comes from the cache and the page is rendered once per event.
+WAITING_ROOM_CACHE_TIMEOUT = 60
+
+
+def get_waiting_room_event_cache_key(event_code: str) -> str:
+    return f"waiting-room:event:{event_code}"
+
+
+def get_waiting_room_page_cache_key(event_code: str) -> str:
+    return f"waiting-room:page:{event_code}"
+
+
+def get_waiting_room_event(event_code: str) -> Event:
+    def load():
+        values = Event.objects.filter(code=event_code, waiting_room_size__gt=0).values(
+            "id", "code", "title", "waiting_room_size"
+        )
+        return values.first() or {}
+
+    values = cache.get_or_set(get_waiting_room_event_cache_key(event_code), load, WAITING_ROOM_CACHE_TIMEOUT)
+    if not values:
+        raise Http404
+    return Event(**values)
+
+
+def event_waiting_room(request: HttpRequest, event_code: str):
+    event = get_waiting_room_event(event_code)
+    content = cache.get_or_set(
+        get_waiting_room_page_cache_key(event_code),
+        lambda: render_to_string(
+            "dds_registration/event/event_waiting_room.html.django",
+            context={
+                "event": event,
+                "poll_seconds": WAITING_ROOM_POLL,
+                "status_url": reverse("event_waiting_room_status", args=(event_code,)),
+                "registration_url": reverse("event_registration", args=(event_code,)),
+            },
+            request=request,
+        ),
+        WAITING_ROOM_CACHE_TIMEOUT,
+    )
+    return HttpResponse(content)
+
+
+@never_cache
+def event_waiting_room_status(request: HttpRequest, event_code: str):
+    event = get_waiting_room_event(event_code)
+    ticket = get_waiting_room_ticket(request, event)
+    if not ticket:
+        # No place in the queue yet: the registration page hands one out
+        return JsonResponse({"admitted": True, "ahead": 0, "poll": WAITING_ROOM_POLL})
+    try:
+        admitted, ahead = WaitingRoom(event).poll(ticket)
+    except WaitingRoomBusy:
+        admitted, ahead = False, None
+    return JsonResponse({"admitted": admitted, "ahead": ahead, "poll": WAITING_ROOM_POLL})
+
+
+__all__ = [
+    event_waiting_room,
+    event_waiting_room_status,
+]
@@ -0,0 +1,182 @@
+"""View benchmarks: fixtures and the baseline comparison.
+
+Not part of the default test run (``testpaths`` only collects ``tests/*.py``);
+run them explicitly with::
+
+    pytest tests/benchmarks --no-cov
+
+Each benchmark times a view with the Django test client against the synthetic
+data set (``dds_registration.loadtest.dataset``), or a plain callable (the
+cache backends), and compares the number of queries and the median time with
+``baselines.json``:
+
+- more queries than the baseline always fails (benchmarks that don't count
+  queries on the default connection leave them out);
+- with ``BENCHMARK_TOLERANCE`` set (eg 0.5, ie +50%), a median time more than
+  that over the baseline fails. The recorded times come from one machine, so
+  they are only compared on request, on the machine that recorded them.
+
+``BENCHMARK_UPDATE=1`` writes the measured values to ``baselines.json`` instead
+of comparing; commit the file with the change that moved the numbers.
+``BENCHMARK_ROUNDS`` sets the number of timed requests per view (default 15).
+"""
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import Group
+from django.db import connection
+
+from dds_registration.loadtest.dataset import PASSWORD, SCHOOL_CODE, build_dataset
+from dds_registration.models import Event, Payment, Registration, User
+
+BASELINES_PATH = Path(__file__).resolve().parent / "baselines.json"
+
+BENCH_USER_EMAIL = "bench-user@example.com"
+BENCH_ADMIN_EMAIL = "bench-admin@example.com"
+DASHBOARD_KEY = "bench"
+
+
+def _load_baselines() -> dict:
+    if BASELINES_PATH.exists():
+        return json.loads(BASELINES_PATH.read_text())
+    return {}
+
+
+def _save_baseline(name: str, result: dict):
+    baselines = _load_baselines()
+    baselines[name] = result
+    BASELINES_PATH.write_text(json.dumps(dict(sorted(baselines.items())), indent=2) + "\n")
+
+
+def _register(user: User, event: Event):
+    option = event.options.first()
+    registration = Registration.objects.create(event=event, user=user, option=option, status="REGISTERED")
+    if option:
+        payment = Payment.objects.create(
+            status="ISSUED",
+            data={
+                "user": {"id": user.id, "name": user.get_full_name(), "address": user.address},
+                "extra": "",
+                "kind": "event",
+                "method": "INVOICE",
+                "event": {"id": event.id, "title": event.title, "vat_rate": event.vat_rate},
+                "registration": {"id": registration.id},
+                "option": {"id": option.id, "item": option.item},
+                "price": option.price,
+                "currency": option.currency,
+            },
+        )
+        registration.payment = payment
+        registration.save()
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Create the synthetic data set once for the whole benchmark session"""
+    with django_db_blocker.unblock():
+        build_dataset(users=200, events=8, registrations_per_event=25, school_capacity=500, seed=1)
+        user = User.objects.create_user(
+            username=BENCH_USER_EMAIL, email=BENCH_USER_EMAIL, password=PASSWORD, first_name="Bench", last_name="User"
+        )
+        user.groups.add(Group.objects.create(name=f"dashboard:{DASHBOARD_KEY}"))
+        for event in Event.objects.filter(public=True).exclude(code=SCHOOL_CODE):
+            if event.today_within_registration_band():
+                _register(user, event)
+        User.objects.create_superuser(username=BENCH_ADMIN_EMAIL, email=BENCH_ADMIN_EMAIL, password=PASSWORD)
+
+
+@pytest.fixture
+def bench_user(db):
+    return User.objects.get(email=BENCH_USER_EMAIL)
+
+
+@pytest.fixture
+def user_client(bench_user, client):
+    client.force_login(bench_user)
+    return client
+
+
+@pytest.fixture
+def admin_client(db, client):
+    client.force_login(User.objects.get(email=BENCH_ADMIN_EMAIL))
+    return client
+
+
+def _compare_with_baseline(name: str, result: dict) -> dict:
+    tolerance = os.environ.get("BENCHMARK_TOLERANCE", "")
+    if os.environ.get("BENCHMARK_UPDATE", "") not in ("", "0"):
+        _save_baseline(name, result)
+        return result
+
+    baseline = _load_baselines().get(name)
+    assert baseline, f"{name}: no baseline in {BASELINES_PATH.name}; run with BENCHMARK_UPDATE=1 to record it"
+    failures = []
+    if "queries" in result and result["queries"] > baseline["queries"]:
+        failures.append(
+            "{} queries, baseline {} ({:+d})".format(
+                result["queries"], baseline["queries"], result["queries"] - baseline["queries"]
+            )
+        )
+    tolerance = float(tolerance) if tolerance else None
+    if tolerance is not None and result["median_ms"] > baseline["median_ms"] * (1 + tolerance):
+        failures.append(
+            "median {:.2f} ms, baseline {:.2f} ms ({:+.1f}%, tolerance {:.0f}%)".format(
+                result["median_ms"],
+                baseline["median_ms"],
+                (result["median_ms"] / baseline["median_ms"] - 1) * 100,
+                tolerance * 100,
+            )
+        )
+    assert not failures, f"{name} got slower: " + "; ".join(failures)
+    return result
+
+
+def _time(action) -> dict:
+    """Warm up, count the queries of one call, then take the median time of `BENCHMARK_ROUNDS` calls"""
+    rounds = int(os.environ.get("BENCHMARK_ROUNDS", 15))
+    action()
+    # Count with an execute wrapper: the query log is reset on every request_started
+    queries = []
+    with connection.execute_wrapper(lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+        action()
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - started)
+    return {"queries": len(queries), "median_ms": round(statistics.median(timings) * 1000, 2)}
+
+
+@pytest.fixture
+def benchmark_view():
+    """Return `run(name, client, url, status=200)`: time the view and compare with its baseline"""
+
+    def run(name: str, client, url: str, status: int = 200):
+        def request():
+            response = client.get(url)
+            assert response.status_code == status, f"{name}: {url} returned {response.status_code}"
+
+        return _compare_with_baseline(name, _time(request))
+
+    return run
+
+
+@pytest.fixture
+def benchmark():
+    """Return `run(name, action)`: time a callable and compare with its baseline"""
+
+    def run(name: str, action):
+        return _compare_with_baseline(name, _time(action))
+
+    return run
+
+
+@pytest.fixture
+def benchmark_result():
+    """Return `record(name, result)`: compare a result measured by the benchmark itself with its baseline"""
+    return _compare_with_baseline
@@ -0,0 +1,50 @@
+"""Shared SQLite cache backend against the per-process locmem cache."""
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from dds_registration.core.app.cache import SQLiteCache
+
+# Roughly what the views cache: an event summary sized value
+VALUE = {
+    "event": "bench",
+    "seats_left": 12,
+    "options": [{"id": n, "item": f"Option {n}", "seats_left": n} for n in range(5)],
+}
+KEYS = [f"bench:{n}" for n in range(100)]
+
+
+@pytest.fixture(params=["locmem", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "locmem":
+        cache = LocMemCache("bench", {"OPTIONS": {"MAX_ENTRIES": 10000}})
+    else:
+        cache = SQLiteCache(tmp_path / "cache.sqlite3", {"OPTIONS": {"MAX_ENTRIES": 10000}})
+    cache.set_many({key: VALUE for key in KEYS})
+    return request.param, cache
+
+
+def test_get(backend, benchmark):
+    name, cache = backend
+    benchmark(f"cache_{name}_get_100", lambda: [cache.get(key) for key in KEYS])
+
+
+def test_get_many(backend, benchmark):
+    name, cache = backend
+    benchmark(f"cache_{name}_get_many_100", lambda: cache.get_many(KEYS))
+
+
+def test_set(backend, benchmark):
+    name, cache = backend
+    benchmark(f"cache_{name}_set_100", lambda: [cache.set(key, VALUE) for key in KEYS])
+
+
+def test_get_or_set_miss(backend, benchmark):
+    name, cache = backend
+
+    def miss():
+        cache.delete_many(KEYS)
+        for key in KEYS:
+            cache.get_or_set(key, VALUE)
+
+    benchmark(f"cache_{name}_get_or_set_miss_100", miss)
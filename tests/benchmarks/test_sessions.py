@@ -0,0 +1,32 @@
+"""Session overhead per request: database sessions against cached ones (`SESSION_ENGINE`)."""
+
+from importlib import import_module
+
+import pytest
+from django.contrib.auth import SESSION_KEY
+
+
+@pytest.fixture(params=["db", "cached_db"])
+def session(request, db):
+    engine = import_module(f"django.contrib.sessions.backends.{request.param}")
+    session = engine.SessionStore()
+    session[SESSION_KEY] = "1"
+    session.save()
+    return request.param, engine, session.session_key
+
+
+def test_load(session, benchmark):
+    # What each authenticated request does
+    name, engine, session_key = session
+    benchmark(f"session_{name}_load", lambda: engine.SessionStore(session_key)[SESSION_KEY])
+
+
+def test_modify(session, benchmark):
+    name, engine, session_key = session
+
+    def modify():
+        store = engine.SessionStore(session_key)
+        store["visited"] = store.get("visited", 0) + 1
+        store.save()
+
+    benchmark(f"session_{name}_modify", modify)
@@ -0,0 +1,93 @@
+"""Parallel registration-like writes on a SQLite file: bare settings against the tuned ones (`SQLITE_OPTIONS`).
+
+Each of the `ROUNDS` rounds is one batch of `WORKERS` threads, each writing `WRITES_PER_WORKER` registrations. The
+result records the successful writes, the lock errors and the median time per successful write, compared with the
+baseline like the other benchmarks. The bare settings lose writes to lock errors, the tuned ones must not lose any.
+"""
+
+import statistics
+import threading
+import time
+
+import pytest
+from django.conf import settings
+from django.db import OperationalError, connections, transaction
+
+WORKERS = 8
+WRITES_PER_WORKER = 50
+ROUNDS = 3
+
+PROFILES = {
+    "bare": {},
+    "tuned": settings.SQLITE_OPTIONS,
+}
+
+
+@pytest.fixture(params=list(PROFILES))
+def database(request, tmp_path, django_db_blocker):
+    alias = f"concurrency_{request.param}"
+    database = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": str(tmp_path / f"{alias}.sqlite3"),
+        "OPTIONS": PROFILES[request.param],
+    }
+    connections.settings[alias] = connections.configure_settings({"default": database})["default"]
+    with django_db_blocker.unblock():
+        with connections[alias].cursor() as cursor:
+            cursor.execute("CREATE TABLE event (id INTEGER PRIMARY KEY, registrations INTEGER NOT NULL)")
+            cursor.execute("CREATE TABLE registration (id INTEGER PRIMARY KEY, event_id INTEGER NOT NULL)")
+            cursor.execute("INSERT INTO event VALUES (1, 0)")
+        connections[alias].close()
+        yield request.param, alias
+    del connections.settings[alias]
+
+
+def register(alias: str):
+    # As a registration: check the seats, add the registration, move the counter
+    with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+        cursor.execute("SELECT registrations FROM event WHERE id = 1")
+        cursor.fetchone()
+        cursor.execute("INSERT INTO registration (event_id) VALUES (1)")
+        cursor.execute("UPDATE event SET registrations = registrations + 1 WHERE id = 1")
+
+
+def test_parallel_registrations(database, django_db_blocker, benchmark_result):
+    name, alias = database
+    lock_errors = []
+
+    def worker():
+        with django_db_blocker.unblock():
+            for _ in range(WRITES_PER_WORKER):
+                try:
+                    register(alias)
+                except OperationalError as error:
+                    lock_errors.append(error)
+            connections[alias].close()
+
+    writes = 0
+    timings = []
+    for _ in range(ROUNDS):
+        failed = len(lock_errors)
+        threads = [threading.Thread(target=worker) for _ in range(WORKERS)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        round_writes = WORKERS * WRITES_PER_WORKER - (len(lock_errors) - failed)
+        writes += round_writes
+        timings.append(elapsed / round_writes)
+
+    benchmark_result(
+        f"sqlite_parallel_registrations_{name}",
+        {
+            "writes": writes,
+            "lock_errors": len(lock_errors),
+            "median_ms": round(statistics.median(timings) * 1000, 2),
+        },
+    )
+    if name == "bare":
+        assert lock_errors, "no lock errors without the tuned settings"
+    else:
+        assert not lock_errors, f"{len(lock_errors)} lock errors: {lock_errors[0]}"
@@ -0,0 +1,48 @@
+"""View benchmarks against the synthetic data set (see ``conftest.py``)."""
+
+import pytest
+from django.urls import reverse
+
+from dds_registration.loadtest.dataset import SCHOOL_CODE
+from dds_registration.models import Registration
+
+
+def test_index_anonymous(client, db, benchmark_view):
+    benchmark_view("index_anonymous", client, reverse("index"))
+
+
+def test_index(user_client, benchmark_view):
+    benchmark_view("index", user_client, reverse("index"))
+
+
+def test_profile(user_client, benchmark_view):
+    benchmark_view("profile", user_client, reverse("profile"))
+
+
+def test_event_registration_new(user_client, benchmark_view):
+    benchmark_view("event_registration_new", user_client, reverse("event_registration", args=(SCHOOL_CODE,)))
+
+
+def test_event_registration_edit(user_client, bench_user, benchmark_view):
+    registration = Registration.objects.filter(user=bench_user, event__free=False).order_by("event__code").first()
+    benchmark_view(
+        "event_registration_edit", user_client, reverse("event_registration", args=(registration.event.code,))
+    )
+
+
+def test_dashboard_auth(user_client, benchmark_view):
+    benchmark_view("dashboard_auth", user_client, reverse("dashboard_auth", args=("bench",)))
+
+
+def test_dashboard_verify(user_client, benchmark_view):
+    # The first (warm-up) request sets the dashboard token
+    benchmark_view("dashboard_verify", user_client, reverse("dashboard_verify", args=("bench",)))
+
+
+def test_team_calendar(user_client, benchmark_view):
+    benchmark_view("team_calendar", user_client, reverse("team_calendar"))
+
+
+@pytest.mark.parametrize("model", ["event", "registration", "registrationoption", "payment", "membership", "user"])
+def test_admin_changelist(admin_client, benchmark_view, model):
+    benchmark_view(f"admin_{model}_changelist", admin_client, reverse(f"admin:dds_registration_{model}_changelist"))
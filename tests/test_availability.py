@@ -0,0 +1,65 @@
+"""Cached availability endpoint of the registration form."""
+
+from django.test import TestCase
+from django.urls import reverse
+
+from conftest import create_event
+from dds_registration.models import Event, Registration, RegistrationOption, User
+
+
+class AvailabilityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.event = create_event("available", title="Available", max_participants=3)
+        cls.capped = RegistrationOption.objects.create(event=cls.event, item="Capped", max_participants=1)
+        cls.open = RegistrationOption.objects.create(event=cls.event, item="Open")
+        cls.user = User.objects.create_user(username="available", email="available@example.com")
+        cls.url = reverse("event_availability", args=(cls.event.code,))
+
+    def test_seats_left(self):
+        Registration.objects.create(event=self.event, user=self.user, option=self.capped, status="REGISTERED")
+        self.assertEqual(
+            self.client.get(self.url).json(),
+            {
+                "event": "available",
+                "seats_left": 2,
+                "options": [
+                    {"id": self.capped.id, "item": "Capped", "seats_left": 0},
+                    {"id": self.open.id, "item": "Open", "seats_left": None},
+                ],
+            },
+        )
+
+    def test_cached_until_registrations_change(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).json()["seats_left"], 3)
+        with self.captureOnCommitCallbacks(execute=True):
+            registration = Registration.objects.create(event=self.event, user=self.user, status="REGISTERED")
+        self.assertEqual(self.client.get(self.url).json()["seats_left"], 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            registration.status = "WITHDRAWN"
+            registration.save()
+        self.assertEqual(self.client.get(self.url).json()["seats_left"], 3)
+
+    def test_cached_until_capacity_changes(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.capped.max_participants = 5
+            self.capped.save()
+        self.assertEqual(self.client.get(self.url).json()["options"][0]["seats_left"], 5)
+
+    def test_unknown_event(self):
+        self.assertEqual(self.client.get(reverse("event_availability", args=("missing",))).status_code, 404)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(reverse("event_availability", args=("missing",))).status_code, 404)
+
+    def test_non_public_event(self):
+        Event.objects.filter(pk=self.event.pk).update(public=False)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()["seats_left"], 3)
+        self.assertNotIn("public", response.json())
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotIn("public", response["Cache-Control"])
@@ -0,0 +1,152 @@
+"""Signal-driven invalidation of the cached values."""
+
+from django.contrib.auth.models import AnonymousUser, Group
+from django.core.cache import cache
+from django.test import TestCase
+
+from conftest import create_event
+from dds_registration.core.helpers.cache_invalidation import (
+    KeyNamespace,
+    assert_no_stale_reads,
+    invalidate_on_change,
+)
+from dds_registration.models import (
+    Event,
+    Membership,
+    Payment,
+    Registration,
+    RegistrationOption,
+    User,
+    get_user_summary,
+    load_user_summary,
+)
+from dds_registration.views.helpers.availability import (
+    get_event_availability,
+    load_event_availability,
+)
+from dds_registration.views.helpers.event_lookup import get_event_by_code, load_event
+
+
+@invalidate_on_change(User, m2m=[User.groups.through])
+def user_group_keys(user: User):
+    return [f"test-groups:{user.pk}"]
+
+
+def cached_group_names(user: User):
+    return cache.get_or_set(f"test-groups:{user.pk}", lambda: sorted(user.groups.values_list("name", flat=True)))
+
+
+class KeyNamespaceTests(TestCase):
+    def test_bump_changes_keys(self):
+        namespace = KeyNamespace("test")
+        key = namespace.key(1)
+        cache.set(key, "value")
+        namespace.bump()
+        self.assertNotEqual(namespace.key(1), key)
+        bumped = namespace.key(1)
+        cache.delete(namespace.version_key)
+        namespace.bump()
+        self.assertNotIn(namespace.key(1), (key, bumped))
+
+    def test_evicted_version_does_not_come_back(self):
+        namespace = KeyNamespace("test")
+        key = namespace.key(1)
+        cache.set(key, "value")
+        # Evicted, then read again: the old entries must not be served
+        cache.delete(namespace.version_key)
+        self.assertNotEqual(namespace.key(1), key)
+        self.assertIsNone(cache.get(namespace.key(1)))
+
+
+class NoStaleReadsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.event = create_event("fresh", title="Fresh", max_participants=5)
+        cls.option = RegistrationOption.objects.create(event=cls.event, item="Standard", max_participants=2)
+        cls.user = User.objects.create_user(username="fresh", email="fresh@example.com")
+
+    def register(self):
+        return Registration.objects.create(event=self.event, user=self.user, option=self.option, status="REGISTERED")
+
+    def test_event_lookup(self):
+        def rename_option():
+            self.option.item = "Renamed"
+            self.option.save()
+
+        def retitle():
+            self.event.title = "Retitled"
+            self.event.save()
+
+        for change in (rename_option, retitle, self.register):
+            with self.subTest(change.__name__):
+                assert_no_stale_reads(self, lambda: get_event_by_code("fresh"), lambda: load_event("fresh"), change)
+
+    def test_event_code_change(self):
+        get_event_by_code("fresh")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.code = "renamed"
+            self.event.save()
+        with self.assertRaises(Event.DoesNotExist):
+            get_event_by_code("fresh")
+
+    def test_availability(self):
+        def cap():
+            self.option.max_participants = 3
+            self.option.save()
+
+        for change in (self.register, cap):
+            with self.subTest(change.__name__):
+                assert_no_stale_reads(
+                    self,
+                    lambda: get_event_availability("fresh", AnonymousUser()),
+                    lambda: load_event_availability("fresh"),
+                    change,
+                )
+
+    def test_user_summary(self):
+        registration = self.register()
+        payment = Payment.objects.create(status="ISSUED", data={"user": {"id": self.user.id}})
+
+        def pay():
+            registration.payment = payment
+            registration.save()
+
+        def mark_paid():
+            payment.status = "PAID"
+            payment.save()
+
+        def join():
+            Membership.objects.create(user=self.user)
+
+        def retitle():
+            self.event.title = "Retitled"
+            self.event.save()
+
+        def rename_option():
+            self.option.item = "Renamed"
+            self.option.save()
+
+        for change in (pay, mark_paid, join, retitle, rename_option):
+            with self.subTest(change.__name__):
+                assert_no_stale_reads(
+                    self, lambda: get_user_summary(self.user), lambda: load_user_summary(self.user), change
+                )
+
+    def test_m2m(self):
+        group = Group.objects.create(name="testers")
+        for change in (lambda: self.user.groups.add(group), lambda: group.user_set.remove(self.user)):
+            assert_no_stale_reads(
+                self,
+                lambda: cached_group_names(self.user),
+                lambda: sorted(self.user.groups.values_list("name", flat=True)),
+                change,
+            )
+
+    def test_detects_stale_reads(self):
+        def uncached_change():
+            Event.objects.filter(pk=self.event.pk).update(title="Updated")
+
+        with self.assertRaisesMessage(AssertionError, "Stale cached value"):
+            assert_no_stale_reads(
+                self, lambda: get_event_by_code("fresh"), lambda: load_event("fresh"), uncached_change
+            )
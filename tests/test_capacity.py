@@ -0,0 +1,136 @@
+"""Seat reservation for registrations saved with `enforce_capacity`."""
+
+import threading
+import time
+
+from django.db import OperationalError, connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from conftest import create_event
+from dds_registration.models import (
+    CapacityExceeded,
+    Event,
+    Registration,
+    RegistrationOption,
+    User,
+)
+
+
+def create_users(count, prefix="seated"):
+    return [User.objects.create_user(username=f"{prefix}{n}", email=f"{prefix}{n}@example.com") for n in range(count)]
+
+
+def reserve(user, event, option=None):
+    registration = Registration(event=event, user=user, option=option, status="PAYMENT_PENDING")
+    registration.enforce_capacity = True
+    registration.save()
+    return registration
+
+
+class CapacityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.event = create_event("seats", max_participants=2)
+        cls.small = RegistrationOption.objects.create(event=cls.event, item="Small", max_participants=1)
+        cls.large = RegistrationOption.objects.create(event=cls.event, item="Large")
+        cls.users = create_users(4)
+
+    def test_event_capacity(self):
+        reserve(self.users[0], self.event)
+        reserve(self.users[1], self.event)
+        with self.assertRaises(CapacityExceeded) as raised:
+            reserve(self.users[2], self.event)
+        self.assertEqual(raised.exception.target, self.event)
+        self.assertFalse(Registration.objects.filter(user=self.users[2]).exists())
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.active_registration_count, 2)
+
+    def test_option_capacity(self):
+        reserve(self.users[0], self.event, self.small)
+        with self.assertRaises(CapacityExceeded) as raised:
+            reserve(self.users[1], self.event, self.small)
+        self.assertEqual(raised.exception.target, self.small)
+        # The event seat taken before the option check is rolled back too
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.active_registration_count, 1)
+
+    def test_cancellation_releases_the_seat(self):
+        first = reserve(self.users[0], self.event)
+        reserve(self.users[1], self.event)
+        first.status = "WITHDRAWN"
+        first.save()
+        reserve(self.users[2], self.event)
+
+    def test_changing_option_of_a_full_event(self):
+        registration = reserve(self.users[0], self.event, self.large)
+        reserve(self.users[1], self.event, self.large)
+        registration.option = self.small
+        registration.enforce_capacity = True
+        registration.save()
+        self.small.refresh_from_db()
+        self.assertEqual(self.small.active_registration_count, 1)
+
+    def test_admin_can_overbook(self):
+        for user in self.users:
+            Registration.objects.create(event=self.event, user=user, status="REGISTERED")
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.active_registration_count, 4)
+
+    def test_full_event_registration_view(self):
+        free = create_event("free-seats", max_participants=1, free=True)
+        reserve(self.users[0], free)
+        self.client.force_login(self.users[1])
+        # Full as of the page load or only at the time of the POST: no registration either way
+        free.max_participants = 2
+        free.save()
+        page = self.client.get(reverse("event_registration", args=(free.code,)))
+        self.assertEqual(page.status_code, 200)
+        Event.objects.filter(pk=free.pk).update(max_participants=1)
+        response = self.client.post(reverse("event_registration", args=(free.code,)), {"send_update_emails": "on"})
+        self.assertRedirects(response, reverse("index"), fetch_redirect_response=False)
+        self.assertFalse(Registration.objects.filter(user=self.users[1]).exists())
+
+
+class ConcurrentCapacityTests(TransactionTestCase):
+    THREADS = 24
+    SEATS = 5
+
+    def test_no_overbooking_under_concurrency(self):
+        event = create_event("rush", max_participants=self.SEATS)
+        option = RegistrationOption.objects.create(event=event, item="Only", max_participants=self.SEATS + 2)
+        users = create_users(self.THREADS, prefix="rush")
+        start = threading.Barrier(self.THREADS)
+        outcomes = []
+
+        def register(user):
+            start.wait()
+            try:
+                while True:
+                    try:
+                        with transaction.atomic():
+                            reserve(user, event, option)
+                        outcomes.append("seated")
+                        return
+                    except CapacityExceeded:
+                        outcomes.append("full")
+                        return
+                    except OperationalError:
+                        # sqlite: another writer holds the lock, try again
+                        time.sleep(0.005)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=register, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(outcomes.count("seated"), self.SEATS)
+        self.assertEqual(outcomes.count("full"), self.THREADS - self.SEATS)
+        self.assertEqual(Registration.objects.filter(event=event).count(), self.SEATS)
+        event.refresh_from_db()
+        option.refresh_from_db()
+        self.assertEqual(event.active_registration_count, self.SEATS)
+        self.assertEqual(option.active_registration_count, self.SEATS)
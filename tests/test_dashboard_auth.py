@@ -0,0 +1,142 @@
+"""Cached authorisation decisions of the nginx `dashboard_auth` endpoint."""
+
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core import signing
+from django.test import TestCase
+from django.urls import resolve, reverse
+
+from dds_registration.middleware.DashboardAuthMiddleware import (
+    DASHBOARD_CHECK_PATH_PREFIX,
+)
+from dds_registration.models import User
+from dds_registration.views import sso_gateway
+from dds_registration.views.helpers.dashboard_access import (
+    DASHBOARD_TOKEN_COOKIE_NAME,
+    DASHBOARD_TOKEN_MAX_AGE,
+)
+
+
+class DashboardAuthTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="viewer", email="viewer@example.com", password="pw-test-12345")
+        cls.group = Group.objects.create(name="dashboard:lca")
+        cls.user.groups.add(cls.group)
+
+    def auth(self, key="lca"):
+        return self.client.get(reverse("dashboard_auth", args=(key,))).status_code
+
+    def login(self, user=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.force_login(user or self.user)
+
+    def test_decisions(self):
+        self.assertEqual(self.auth(), 401)
+        self.login()
+        self.assertEqual(self.auth(), 200)
+        self.assertEqual(self.auth("other"), 403)
+        self.login(User.objects.create_superuser(username="admin", email="admin@example.com", password="-"))
+        self.assertEqual(self.auth("other"), 200)
+
+    def test_fast_path(self):
+        self.login()
+        self.auth()
+        # The session from the cache: no query, no view
+        with self.assertNumQueries(0), mock.patch.object(sso_gateway, "get_dashboard_access") as view_lookup:
+            self.assertEqual(self.auth(), 200)
+            self.assertEqual(self.auth("other"), 403)
+        view_lookup.assert_not_called()
+
+    def test_other_paths_are_not_resolved(self):
+        for name in ("dashboard_auth", "dashboard_verify"):
+            self.assertTrue(reverse(name, args=("lca",)).startswith(DASHBOARD_CHECK_PATH_PREFIX))
+        with mock.patch("dds_registration.middleware.DashboardAuthMiddleware.resolve", wraps=resolve) as patched:
+            self.client.get(reverse("index"))
+        patched.assert_not_called()
+
+    def test_group_membership_changes(self):
+        self.login()
+        self.assertEqual(self.auth(), 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.groups.remove(self.group)
+        self.assertEqual(self.auth(), 403)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.user_set.add(self.user)
+        self.assertEqual(self.auth(), 200)
+
+    def test_group_changes(self):
+        self.login()
+        self.assertEqual(self.auth(), 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.name = "dashboard:renamed"
+            self.group.save()
+        self.assertEqual(self.auth(), 403)
+        self.assertEqual(self.auth("renamed"), 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.delete()
+        self.assertEqual(self.auth("renamed"), 403)
+
+    def test_stale_sessions_take_the_full_path(self):
+        self.login()
+        self.assertEqual(self.auth(), 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password("pw-changed-12345")
+            self.user.save()
+        self.assertEqual(self.auth(), 401)
+        self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.auth(), 401)
+
+
+class DashboardTokenTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="token", email="token@example.com", password="pw-test-12345")
+        cls.user.groups.add(Group.objects.create(name="dashboard:lca"))
+
+    def verify(self, key="lca"):
+        return self.client.get(reverse("dashboard_verify", args=(key,)))
+
+    def login(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("login"), {"username": "token@example.com", "password": "pw-test-12345"}
+            )
+        self.assertEqual(response.status_code, 302)
+        return response
+
+    def test_set_at_login(self):
+        self.assertIn(DASHBOARD_TOKEN_COOKIE_NAME, self.login().cookies)
+        # The token alone: no session, no database
+        del self.client.cookies[settings.SESSION_COOKIE_NAME]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.verify().status_code, 200)
+            self.assertEqual(self.verify("other").status_code, 403)
+
+    def test_tampered(self):
+        self.login()
+        token = self.client.cookies[DASHBOARD_TOKEN_COOKIE_NAME].value
+        self.client.cookies[DASHBOARD_TOKEN_COOKIE_NAME] = token[:-2] + ("AA" if token[-2:] != "AA" else "BB")
+        self.client.logout()
+        self.assertEqual(self.verify().status_code, 401)
+
+    def test_expired_falls_back_to_the_full_check(self):
+        self.login()
+        expired = time.time() + DASHBOARD_TOKEN_MAX_AGE + 1
+        with mock.patch.object(signing.time, "time", return_value=expired):
+            response = self.verify()
+        self.assertEqual(response.status_code, 200)
+        # Renewed
+        self.assertIn(DASHBOARD_TOKEN_COOKIE_NAME, response.cookies)
+
+    def test_dropped_at_logout(self):
+        self.login()
+        response = self.client.post(reverse("logout"))
+        self.assertEqual(response.cookies[DASHBOARD_TOKEN_COOKIE_NAME].value, "")
+        self.assertEqual(self.verify().status_code, 401)
@@ -0,0 +1,49 @@
+"""Event descriptions rendered from Markdown when the event is saved."""
+
+from datetime import date
+from unittest import mock
+
+from django.test import TestCase
+
+from conftest import create_event
+from dds_registration.core.helpers import markdown
+from dds_registration.models import Event
+
+
+class EventDescriptionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        today = date.today()
+        cls.event = create_event(
+            "described",
+            title="Described",
+            description="Some **bold** text <script>alert(1)</script>",
+            registration_open=today,
+        )
+
+    def test_rendered_on_save(self):
+        event = Event.objects.get(pk=self.event.pk)
+        self.assertIn("<strong>bold</strong>", event.description_html)
+        self.assertNotIn("<script>", event.description_html)
+        with mock.patch("dds_registration.models.render_markdown") as render:
+            self.assertEqual(event.description_rendered, event.description_html)
+        render.assert_not_called()
+
+    def test_rendered_again_when_changed_only(self):
+        with mock.patch("dds_registration.models.markdown_to_html", wraps=markdown.markdown_to_html) as render:
+            self.event.title = "Renamed"
+            self.event.save()
+            render.assert_not_called()
+            self.event.description = "Other *text*"
+            self.event.save(update_fields=["description"])
+            render.assert_called_once()
+        self.event.refresh_from_db()
+        self.assertIn("<em>text</em>", self.event.description_html)
+
+    def test_changed_without_save(self):
+        Event.objects.filter(pk=self.event.pk).update(description="Updated *text*")
+        event = Event.objects.get(pk=self.event.pk)
+        self.assertIn("<em>text</em>", event.description_rendered)
+        with mock.patch.object(markdown, "markdownify") as markdownify:
+            self.assertIn("<em>text</em>", event.description_rendered)
+        markdownify.assert_not_called()
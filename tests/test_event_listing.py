@@ -0,0 +1,83 @@
+"""The index page event listing must match `Event.can_register`, in a fixed number of queries."""
+
+from datetime import date, timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+from djf_surveys.models import Survey
+
+from conftest import create_event
+from dds_registration.models import Event, Registration, User
+from dds_registration.views.helpers.event_listing import get_open_events
+
+
+class EventListingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        today = date.today()
+        day = timedelta(days=1)
+        cls.user = User.objects.create_user(username="lister", email="lister@example.com", password="pw-test-12345")
+        cls.other = User.objects.create_user(username="other", email="other@example.com", password="pw-test-12345")
+
+        def application_form(code):
+            return Survey.objects.create(name=code, slug=code)
+
+        create_event("open")
+        create_event("hidden", public=False)
+        create_event("past", registration_open=today - 3 * day, registration_close=today - day)
+        create_event("future", registration_open=today + day, registration_close=today + 3 * day)
+        create_event("last-day", registration_open=today - day, registration_close=today)
+        full = create_event("full", max_participants=1)
+        Registration.objects.create(event=full, user=cls.other, status="REGISTERED")
+        room = create_event("room", max_participants=2)
+        Registration.objects.create(event=room, user=cls.other, status="CANCELLED")
+        Registration.objects.create(event=room, user=cls.user, status="REGISTERED")
+        create_event(
+            "applications",
+            application_form=application_form("applications"),
+            application_open=today - day,
+            application_close=today + day,
+        )
+        create_event(
+            "applications-closed",
+            application_form=application_form("applications-closed"),
+            application_open=today - 3 * day,
+            application_close=today - day,
+        )
+        selected = create_event(
+            "selected",
+            application_form=application_form("selected"),
+            application_open=today - 3 * day,
+            application_close=today - day,
+        )
+        Registration.objects.create(event=selected, user=cls.user, status="SELECTED")
+        # Selected while the applications are still open: only the registration band counts for them
+        selected_early = create_event(
+            "selected-early",
+            application_form=application_form("selected-early"),
+            application_open=today - day,
+            application_close=today + day,
+            registration_open=today + 2 * day,
+            registration_close=today + 3 * day,
+        )
+        Registration.objects.create(event=selected_early, user=cls.user, status="SELECTED")
+
+    def expected(self, user):
+        return [event.code for event in Event.objects.filter(public=True).order_by("pk") if event.can_register(user)]
+
+    def test_matches_can_register(self):
+        for user in (self.user, self.other, AnonymousUser()):
+            with self.subTest(user=user):
+                self.assertEqual([event.code for event in get_open_events(user)], self.expected(user))
+
+    def test_sets_the_active_registration(self):
+        events = {event.code: event for event in get_open_events(self.user)}
+        self.assertEqual(events["room"].registration.user, self.user)
+        self.assertEqual(events["selected"].registration.status, "SELECTED")
+        self.assertIsNone(events["open"].registration)
+
+    def test_query_count(self):
+        with self.assertNumQueries(2):
+            get_open_events(self.user)
+        with self.assertNumQueries(1):
+            get_open_events(AnonymousUser())
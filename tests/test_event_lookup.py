@@ -0,0 +1,54 @@
+"""Cached event lookup by code."""
+
+from django.test import TestCase
+
+from conftest import create_event
+from dds_registration.models import Event, Registration, RegistrationOption, User
+from dds_registration.views.helpers.event_lookup import get_event_by_code
+
+
+class EventLookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.event = create_event("looked-up", title="Looked up")
+        cls.option = RegistrationOption.objects.create(event=cls.event, item="Standard")
+
+    def test_cached_with_options_and_application_form(self):
+        get_event_by_code(self.event.code)
+        # The registration counters only
+        with self.assertNumQueries(1):
+            event = get_event_by_code(self.event.code)
+            self.assertIsNone(event.application_form)
+            self.assertEqual([option.item for option in event.options.all()], ["Standard"])
+        with self.assertNumQueries(0):
+            get_event_by_code(self.event.code, counters=False)
+
+    def test_unknown_code(self):
+        with self.assertRaises(Event.DoesNotExist):
+            get_event_by_code("missing")
+        with self.assertNumQueries(0), self.assertRaises(Event.DoesNotExist):
+            get_event_by_code("missing")
+
+    def test_forgotten_on_event_and_option_changes(self):
+        get_event_by_code(self.event.code)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.option.item = "Changed"
+            self.option.save()
+        self.assertEqual([option.item for option in get_event_by_code(self.event.code).options.all()], ["Changed"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.code = "renamed"
+            self.event.save()
+        with self.assertRaises(Event.DoesNotExist):
+            get_event_by_code("looked-up")
+        self.assertEqual(get_event_by_code("renamed").title, "Looked up")
+
+    def test_kept_on_counter_changes(self):
+        get_event_by_code(self.event.code)
+        user = User.objects.create_user(username="looking", email="looking@example.com")
+        with self.captureOnCommitCallbacks(execute=True):
+            Registration.objects.create(event=self.event, user=user, option=self.option, status="REGISTERED")
+        with self.assertNumQueries(1):
+            event = get_event_by_code(self.event.code)
+            self.assertEqual(event.active_registration_count, 1)
+            self.assertEqual([option.active_registration_count for option in event.options.all()], [1])
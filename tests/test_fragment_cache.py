@@ -0,0 +1,69 @@
+"""Cached template fragments of the index and profile pages."""
+
+from django.test import TestCase
+from django.urls import reverse
+
+from conftest import create_event
+from dds_registration.models import (
+    Event,
+    Payment,
+    Registration,
+    RegistrationOption,
+    User,
+)
+
+
+class FragmentCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="fragmented", email="fragmented@example.com")
+        cls.event = create_event("fragment", title="Fragment", description="Original", public=True, max_participants=10)
+        cls.option = RegistrationOption.objects.create(event=cls.event, item="Standard", price=100)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def register(self):
+        payment = Payment.objects.create(
+            status="ISSUED", data={"method": "INVOICE", "currency": "EUR", "user": {"id": self.user.pk}}
+        )
+        return Registration.objects.create(
+            event=self.event, user=self.user, option=self.option, payment=payment, status="REGISTERED"
+        )
+
+    def test_events_list_block(self):
+        self.assertContains(self.client.get(reverse("index")), "Original")
+        # Not seen: a bulk update sends no signal
+        Event.objects.filter(pk=self.event.pk).update(description="Updated")
+        self.assertContains(self.client.get(reverse("index")), "Original")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.description = "Saved"
+            self.event.save()
+        self.assertContains(self.client.get(reverse("index")), "Saved")
+
+    def test_events_list_block_per_registration(self):
+        self.assertContains(self.client.get(reverse("index")), 'class="btn btn-primary" href="/event/fragment/')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.register()
+        self.assertContains(self.client.get(reverse("index")), "Show your registration")
+
+    def test_events_list_table(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            registration = self.register()
+        self.assertContains(self.client.get(reverse("profile")), "Download Invoice")
+        with self.captureOnCommitCallbacks(execute=True):
+            registration.payment.status = "PAID"
+            registration.payment.save()
+        response = self.client.get(reverse("profile"))
+        self.assertNotContains(response, "Download Invoice")
+        self.assertContains(response, "Download Receipt")
+
+        other = User.objects.create_user(username="other", email="other@example.com")
+        with self.captureOnCommitCallbacks(execute=True):
+            Registration.objects.create(event=self.event, user=other, option=self.option, status="REGISTERED")
+        self.assertContains(self.client.get(reverse("profile")), "2/10")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.option.item = "Renamed option"
+            self.option.save()
+        self.assertContains(self.client.get(reverse("profile")), "Renamed option")
@@ -0,0 +1,52 @@
+"""Tests for the load test stand-ins and report helpers.
+
+The full load test drives a real server (``python -m dds_registration.loadtest``);
+here we only check that the app really talks to the Gmail and Stripe stand-ins
+when pointed at them, and the percentile maths of the report.
+"""
+
+import pytest
+import stripe
+
+from dds_registration.core.helpers.email import send_email
+from dds_registration.loadtest.run import percentile
+from dds_registration.loadtest.stubs import StubServer
+from dds_registration.views.helpers.stripe_payments import get_stripe_client_secret
+
+
+@pytest.fixture
+def stubs():
+    server = StubServer(latency={"gmail": 0, "stripe": 0, "slack": 0}).start()
+    yield server
+    server.stop()
+
+
+def test_send_email_goes_to_the_gmail_stand_in(stubs, settings):
+    settings.GMAIL_API_ENDPOINT = stubs.gmail_endpoint
+
+    send_email(recipient_address="someone@example.com", subject="Hello", message="Activate me")
+
+    messages = stubs.messages_for("someone@example.com")
+    assert len(messages) == 1
+    assert messages[0]["subject"] == "Hello"
+    assert "Activate me" in messages[0]["body"]
+
+
+def test_stripe_intent_comes_from_the_stripe_stand_in(stubs, settings, monkeypatch):
+    settings.STRIPE_SECRET_KEY = "sk_test_loadtest"
+    monkeypatch.setattr(stripe, "api_key", "sk_test_loadtest")
+    monkeypatch.setattr(stripe, "api_base", stubs.stripe_api_base)
+
+    intent = get_stripe_client_secret("eur", 12345, "someone@example.com", {"payment_id": 1})
+
+    assert intent.client_secret.startswith(intent.id + "_secret_")
+    assert stubs.calls["stripe"] == 1
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([3.0], 99) == 3
+    assert percentile([], 50) == 0
@@ -0,0 +1,85 @@
+"""Registration option choices are built without a query per option."""
+
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from conftest import create_event
+from dds_registration.models import (
+    Event,
+    Payment,
+    Registration,
+    RegistrationOption,
+    User,
+)
+from dds_registration.views.helpers.option_choices import (
+    get_event_options,
+    get_option_choices,
+)
+
+
+class OptionChoicesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.events = []
+        for count in (1, 4):
+            event = create_event(f"options{count}", title=f"Options {count}", credit_cards=False, vat_rate=0.077)
+            for n in range(count):
+                RegistrationOption.objects.create(event=event, item=f"Option {n}", price=100, max_participants=1)
+            cls.events.append(event)
+        cls.user = User.objects.create_user(username="chooser", email="chooser@example.com")
+        # A full option is left out of the edit choices
+        other = User.objects.create_user(username="other", email="other@example.com")
+        Registration.objects.create(
+            event=cls.events[1], user=other, option=cls.events[1].options.last(), status="REGISTERED"
+        )
+
+    def count_queries(self, url):
+        queries = []
+
+        def count(execute, sql, *args):
+            queries.append(sql)
+            return execute(sql, *args)
+
+        # Nothing cached: the event and its options are loaded too
+        cache.clear()
+        Site.objects.clear_cache()
+        with connection.execute_wrapper(count):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_labels(self):
+        event = Event.objects.get(pk=self.events[0].pk)
+        options = get_event_options(event)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_option_choices(options), [(options[0].id, "Option 0: 100.0 plus 8.0% VAT: 107.7 Euro")]
+            )
+
+    def test_free_only(self):
+        options = get_event_options(self.events[1], free_only=True)
+        self.assertEqual([option.item for option in options], ["Option 0", "Option 1", "Option 2"])
+
+    def test_constant_queries(self):
+        self.client.force_login(self.user)
+        for name in ("new", "edit"):
+            with self.subTest(name):
+                counts = []
+                for event in self.events:
+                    if name == "edit":
+                        payment = Payment.objects.create(
+                            status="ISSUED",
+                            data={"user": {"name": "Chooser", "address": "-"}, "extra": ""},
+                        )
+                        Registration.objects.create(
+                            event=event,
+                            user=self.user,
+                            option=event.options.first(),
+                            payment=payment,
+                            status="PAYMENT_PENDING",
+                        )
+                    counts.append(self.count_queries(reverse("event_registration", args=(event.code,))))
+                self.assertEqual(counts[0], counts[1])
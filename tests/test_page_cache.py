@@ -0,0 +1,94 @@
+"""Whole public pages cached for anonymous visitors."""
+
+from datetime import date, timedelta
+from unittest import mock
+
+from django.test import Client, TestCase, override_settings
+from django.urls import resolve, reverse
+
+from conftest import create_event
+from dds_registration.models import Registration, User
+from dds_registration.views.helpers import page_cache
+from dds_registration.views.helpers.event_listing import get_next_listing_change
+
+
+@override_settings(ANONYMOUS_PAGE_CACHE_TIMEOUT=15 * 60)
+class AnonymousPageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        today = date.today()
+        cls.event = create_event(
+            "cached-page",
+            title="Cached page event",
+            public=True,
+            max_participants=1,
+            registration_close=today + timedelta(days=3),
+        )
+        cls.user = User.objects.create_user(username="visitor", email="visitor@example.com")
+
+    def test_served_from_cache(self):
+        first = self.client.get(reverse("index"))
+        self.assertContains(first, "Cached page event")
+        self.assertIn("Cookie", first["Vary"])
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse("index"))
+        self.assertEqual(second.content, first.content)
+        self.client.get(reverse("robots"))
+        with self.assertNumQueries(0):
+            self.client.get(reverse("robots"))
+
+    def test_security_middleware_applies(self):
+        self.client.get(reverse("index"))
+        # `SecurityMiddleware` reads its settings when the client builds the middleware chain
+        with self.settings(SECURE_HSTS_SECONDS=3600):
+            response = Client().get(reverse("index"), secure=True)
+        self.assertEqual(response["X-Content-Type-Options"], "nosniff")
+        self.assertIn("Referrer-Policy", response)
+        self.assertEqual(response["Strict-Transport-Security"], "max-age=3600")
+        with self.settings(SECURE_SSL_REDIRECT=True):
+            self.assertEqual(Client().get(reverse("index")).status_code, 301)
+
+    def test_not_for_sessions(self):
+        self.client.get(reverse("index"))
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("index"))
+        self.assertContains(response, "visitor")
+        self.assertIn("Cookie", response["Vary"])
+
+    def test_resolves_only_anonymous_reads(self):
+        with mock.patch("dds_registration.middleware.AnonymousPageCacheMiddleware.resolve", wraps=resolve) as patched:
+            self.client.post(reverse("index"))
+            self.client.force_login(self.user)
+            self.client.get(reverse("index"))
+        patched.assert_not_called()
+
+    @override_settings(ANONYMOUS_PAGE_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.client.get(reverse("index"))
+        with self.assertNumQueries(1):
+            self.client.get(reverse("index"))
+
+    def test_forgotten_on_event_changes(self):
+        self.client.get(reverse("index"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.title = "Renamed event"
+            self.event.save()
+        self.assertContains(self.client.get(reverse("index")), "Renamed event")
+
+    def test_forgotten_when_an_event_gets_full(self):
+        self.client.get(reverse("index"))
+        with self.captureOnCommitCallbacks(execute=True):
+            Registration.objects.create(event=self.event, user=self.user, status="REGISTERED")
+        self.assertNotContains(self.client.get(reverse("index")), "Cached page event")
+
+    def test_expires_at_the_next_listing_change(self):
+        today = date.today()
+        self.assertEqual(get_next_listing_change(today), today + timedelta(days=4))
+        create_event(
+            "opening-tomorrow",
+            public=True,
+            registration_open=today + timedelta(days=1),
+            registration_close=today + timedelta(days=2),
+        )
+        self.assertEqual(get_next_listing_change(today), today + timedelta(days=1))
+        self.assertLessEqual(page_cache.get_anonymous_page_cache_timeout(), 24 * 60 * 60)
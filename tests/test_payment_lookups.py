@@ -0,0 +1,96 @@
+"""Payments found by the keys of their data, through the indexed generated columns (`PaymentQuerySet`)."""
+
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from conftest import create_event
+from dds_registration.models import Payment, Registration, User
+
+
+class PaymentLookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.events = [create_event(f"paid{n}", title=f"Paid {n}") for n in range(2)]
+        cls.users = [
+            User.objects.create_user(username=f"payer{n}", email=f"payer{n}@example.com", password="pw-test-12345")
+            for n in range(2)
+        ]
+        cls.registration = Registration.objects.create(event=cls.events[0], user=cls.users[0], status="REGISTERED")
+        cls.event_payment = Payment.objects.create(
+            data={
+                "user": {"id": cls.users[0].pk, "name": "Payer 0"},
+                "kind": "event",
+                "method": "INVOICE",
+                "event": {"id": cls.events[0].pk, "title": "Paid 0"},
+                "registration": {"id": cls.registration.pk},
+                "price": 100,
+                "currency": "EUR",
+            }
+        )
+        cls.membership_payment = Payment.objects.create(
+            data={
+                "user": {"id": cls.users[0].pk, "name": "Payer 0"},
+                "kind": "membership",
+                "method": "STRIPE",
+                "price": 50,
+                "currency": "CHF",
+            }
+        )
+        cls.other_payment = Payment.objects.create(
+            data={
+                "user": {"id": cls.users[1].pk, "name": "Payer 1"},
+                "kind": "event",
+                "method": "STRIPE",
+                "event": {"id": cls.events[1].pk, "title": "Paid 1"},
+                "price": 100,
+                "currency": "EUR",
+            }
+        )
+
+    def assertPayments(self, queryset, payments):
+        self.assertEqual(set(queryset), set(payments))
+
+    def test_lookups(self):
+        self.assertPayments(Payment.objects.for_user(self.users[0]), [self.event_payment, self.membership_payment])
+        self.assertPayments(Payment.objects.for_user(self.users[1].pk), [self.other_payment])
+        self.assertPayments(Payment.objects.for_event(self.events[0]), [self.event_payment])
+        self.assertPayments(Payment.objects.for_registration(self.registration), [self.event_payment])
+        self.assertPayments(Payment.objects.of_kind("membership"), [self.membership_payment])
+        self.assertPayments(Payment.objects.for_user(self.users[0]).of_kind("event"), [self.event_payment])
+        self.assertPayments(Payment.objects.filter(data_method="STRIPE", data_currency="EUR"), [self.other_payment])
+
+    def test_missing_keys(self):
+        payment = Payment.objects.get(pk=self.membership_payment.pk)
+        self.assertIsNone(payment.data_event_id)
+        self.assertIsNone(payment.data_registration_id)
+        self.assertEqual(payment.data_kind, "membership")
+
+    def test_data_changes(self):
+        payment = self.other_payment
+        payment.data["user"]["id"] = self.users[0].pk
+        payment.save()
+        self.assertPayments(Payment.objects.for_user(self.users[1]), [])
+        self.assertEqual(Payment.objects.for_user(self.users[0]).count(), 3)
+
+    def test_index_seeks(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite query plans")
+        queries = {
+            "data_user_id": Payment.objects.for_user(self.users[0]),
+            "data_event_id": Payment.objects.for_event(self.events[0]),
+            "data_registration_id": Payment.objects.for_registration(self.registration),
+            "data_kind": Payment.objects.of_kind("event"),
+        }
+        for column, queryset in queries.items():
+            with self.subTest(column):
+                plan = queryset.explain()
+                self.assertIn("USING INDEX", plan)
+                self.assertIn(column, plan)
+
+    def test_admin_filters(self):
+        admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="pw-test-12345")
+        self.client.force_login(admin)
+        response = self.client.get(reverse("admin:dds_registration_payment_changelist"), {"data_kind": "membership"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["cl"].queryset), [self.membership_payment])
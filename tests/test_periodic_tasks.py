@@ -0,0 +1,38 @@
+"""The periodic maintenance tasks scheduler."""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from dds_registration.core.helpers import periodic_tasks
+from dds_registration.core.helpers.periodic_tasks import PeriodicTask, run_due_tasks
+
+
+class PeriodicTasksTests(TestCase):
+    def test_once_per_interval(self):
+        runs = []
+        task = PeriodicTask("counted", 60, lambda: runs.append(1))
+        with mock.patch.dict(periodic_tasks.PERIODIC_TASKS, {task.name: task}, clear=True):
+            self.assertEqual(run_due_tasks(), ["counted"])
+            self.assertEqual(run_due_tasks(), [])
+            self.assertEqual(run_due_tasks(force=True), ["counted"])
+        self.assertEqual(len(runs), 2)
+
+    def test_failed_tasks_are_tried_again(self):
+        task = PeriodicTask("failing", 60, mock.Mock(side_effect=[RuntimeError, None]))
+        with mock.patch.dict(periodic_tasks.PERIODIC_TASKS, {task.name: task}, clear=True):
+            self.assertEqual(run_due_tasks(), [])
+            self.assertEqual(run_due_tasks(), ["failing"])
+
+    def test_clear_sessions(self):
+        expired = timezone.now() - timedelta(days=1)
+        Session.objects.create(session_key="expired", session_data="", expire_date=expired)
+        out = StringIO()
+        call_command("run_periodic_tasks", stdout=out)
+        self.assertIn("clear_sessions", out.getvalue())
+        self.assertFalse(Session.objects.filter(session_key="expired").exists())
@@ -0,0 +1,58 @@
+"""The profile page data is loaded in a fixed number of queries."""
+
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+
+from conftest import create_event
+from dds_registration.models import (
+    Membership,
+    Payment,
+    Registration,
+    RegistrationOption,
+    User,
+)
+from dds_registration.views.helpers.profile import get_profile_context
+
+
+class ProfileContextTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        today = date.today()
+        cls.user = User.objects.create_user(username="profiled", email="profiled@example.com", password="pw-test-12345")
+        others = [
+            User.objects.create_user(username=f"other{n}", email=f"other{n}@example.com", password="pw-test-12345")
+            for n in range(3)
+        ]
+        for n in range(3):
+            event = create_event(f"event{n}", title=f"Event {n}", max_participants=10 if n else 0)
+            option = RegistrationOption.objects.create(event=event, item="Standard", price=100)
+            payment = Payment.objects.create(status="ISSUED", data={"method": "INVOICE", "currency": "EUR"})
+            Registration.objects.create(event=event, user=cls.user, option=option, payment=payment, status="REGISTERED")
+            for other in others[:n]:
+                Registration.objects.create(event=event, user=other, option=option, status="REGISTERED")
+            Registration.objects.create(event=event, user=others[2], option=option, status="CANCELLED")
+        Membership.objects.create(user=cls.user, until=today.year)
+
+    def test_two_queries(self):
+        with self.assertNumQueries(2):
+            context = get_profile_context(self.user)
+            for row in context["active_regs"]:
+                (row["event"].title, row["payment"].status, row["option"].item, row["participants"])
+            context["membership"].payment
+
+    def test_participants_count_active_registrations(self):
+        context = get_profile_context(self.user)
+        self.assertEqual(
+            sorted((row["event"].code, row["participants"]) for row in context["active_regs"]),
+            [("event0", 1), ("event1", 2), ("event2", 3)],
+        )
+        self.assertTrue(context["is_member"])
+
+    def test_profile_page(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("profile"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "3/10")
+        self.assertContains(response, "Member from")
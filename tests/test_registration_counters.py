@@ -0,0 +1,94 @@
+"""Denormalized active registration counters on events and registration options."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from conftest import create_event
+from dds_registration.models import Event, Registration, RegistrationOption, User
+
+
+class RegistrationCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.events = [create_event(f"counted{n}", title=f"Counted {n}") for n in range(2)]
+        cls.options = [
+            RegistrationOption.objects.create(event=cls.events[0], item="Small", max_participants=1),
+            RegistrationOption.objects.create(event=cls.events[0], item="Large"),
+        ]
+        cls.users = [
+            User.objects.create_user(username=f"counted{n}", email=f"counted{n}@example.com", password="pw-test-12345")
+            for n in range(3)
+        ]
+
+    def counts(self):
+        return (
+            [Event.objects.get(pk=event.pk).active_registration_count for event in self.events],
+            [RegistrationOption.objects.get(pk=option.pk).active_registration_count for option in self.options],
+        )
+
+    def register(self, user, status="REGISTERED", option=None):
+        option = option or self.options[0]
+        return Registration.objects.create(event=option.event, user=user, option=option, status=status)
+
+    def test_create(self):
+        self.register(self.users[0])
+        self.register(self.users[1], option=self.options[1])
+        self.register(self.users[2], status="WITHDRAWN")
+        self.assertEqual(self.counts(), ([2, 0], [1, 1]))
+
+    def test_status_changes(self):
+        registration = self.register(self.users[0])
+        registration.status = "CANCELLED"
+        registration.save()
+        self.assertEqual(self.counts(), ([0, 0], [0, 0]))
+        registration.status = "PAYMENT_PENDING"
+        registration.save()
+        registration.status = "REGISTERED"
+        registration.save()
+        self.assertEqual(self.counts(), ([1, 0], [1, 0]))
+
+    def test_option_and_event_changes(self):
+        registration = self.register(self.users[0])
+        registration.option = self.options[1]
+        registration.save()
+        self.assertEqual(self.counts(), ([1, 0], [0, 1]))
+        registration.event = self.events[1]
+        registration.option = None
+        registration.save()
+        self.assertEqual(self.counts(), ([0, 1], [0, 0]))
+
+    def test_stale_instance(self):
+        registration = self.register(self.users[0])
+        stale = Registration.objects.get(pk=registration.pk)
+        registration.status = "WITHDRAWN"
+        registration.save()
+        stale.status = "WITHDRAWN"
+        stale.save()
+        self.assertEqual(self.counts(), ([0, 0], [0, 0]))
+
+    def test_delete(self):
+        self.register(self.users[0]).delete()
+        self.register(self.users[1], status="DECLINED").delete()
+        self.register(self.users[2], option=self.options[1])
+        self.users[2].delete()
+        self.assertEqual(self.counts(), ([0, 0], [0, 0]))
+
+    def test_rebuild(self):
+        self.register(self.users[0])
+        self.register(self.users[1], option=self.options[1])
+        Event.objects.update(active_registration_count=7)
+        RegistrationOption.objects.update(active_registration_count=-1)
+        call_command("rebuild_registration_counters", stdout=StringIO())
+        self.assertEqual(self.counts(), ([2, 0], [1, 1]))
+
+    def test_saving_a_stale_event_keeps_the_counters(self):
+        event = Event.objects.get(pk=self.events[0].pk)
+        option = RegistrationOption.objects.get(pk=self.options[0].pk)
+        self.register(self.users[0])
+        event.title = "Renamed"
+        event.save()
+        option.save()
+        self.assertEqual(self.counts(), ([1, 0], [1, 0]))
+        self.assertEqual(Event.objects.get(pk=event.pk).title, "Renamed")
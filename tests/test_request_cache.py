@@ -0,0 +1,43 @@
+"""Per-request memoization of membership lookups."""
+
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from dds_registration import models
+from dds_registration.core.helpers.request_cache import request_cache_scope
+from dds_registration.models import Membership, User
+
+
+class RequestCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="memoized", email="memoized@example.com")
+
+    def count_membership_lookups(self, action):
+        with mock.patch.object(models, "get_user_is_member", wraps=models.get_user_is_member) as lookup:
+            action()
+        return lookup.call_count
+
+    def test_one_lookup_per_request(self):
+        self.client.force_login(self.user)
+        for url in (reverse("index"), reverse("profile")):
+            with self.subTest(url=url):
+                self.assertEqual(self.count_membership_lookups(lambda: self.client.get(url)), 1)
+
+    def test_memoized_within_a_scope_only(self):
+        def twice():
+            return [self.user.is_member, self.user.is_member]
+
+        self.assertEqual(self.count_membership_lookups(twice), 2)
+        with request_cache_scope():
+            self.assertEqual(self.count_membership_lookups(twice), 1)
+
+    def test_membership_changes_are_seen(self):
+        with request_cache_scope(), self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(self.user.is_member)
+            membership = Membership.objects.create(user=self.user)
+            self.assertTrue(self.user.is_member)
+            membership.delete()
+            self.assertFalse(self.user.is_member)
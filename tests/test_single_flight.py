@@ -0,0 +1,69 @@
+"""Coalescing of simultaneous expensive computations."""
+
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from dds_registration.core.helpers.single_flight import single_flight
+
+
+def run_together(count, action):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(action())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class SingleFlightTests(SimpleTestCase):
+    def test_simultaneous_callers_share_the_result(self):
+        computed = []
+
+        def compute():
+            computed.append(1)
+            time.sleep(0.2)
+            return b"%pdf"
+
+        self.assertEqual(run_together(5, lambda: single_flight("pdf", compute)), [b"%pdf"] * 5)
+        self.assertEqual(len(computed), 1)
+
+    def test_later_callers_compute_again(self):
+        computed = []
+        for _ in range(2):
+            single_flight("listing", lambda: computed.append(1))
+        self.assertEqual(len(computed), 2)
+
+    def test_waiters_compute_when_the_first_call_fails(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            if len(calls) == 1:
+                raise ValueError
+            return "value"
+
+        def call():
+            try:
+                return single_flight("failing", compute)
+            except ValueError:
+                return "failed"
+
+        results = run_together(3, call)
+        self.assertEqual(sorted(results), ["failed", "value", "value"])
+
+    def test_result_from_another_worker(self):
+        # Another worker holds the lock, then leaves its result
+        cache.add("single-flight:shared:lock", 1, 30)
+
+        def other_worker():
+            time.sleep(0.2)
+            cache.set("single-flight:shared:result", "theirs", 5)
+            cache.delete("single-flight:shared:lock")
+
+        threading.Thread(target=other_worker).start()
+        self.assertEqual(single_flight("shared", lambda: "ours"), "theirs")
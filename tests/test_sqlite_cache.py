@@ -0,0 +1,94 @@
+"""Shared SQLite cache backend."""
+
+import multiprocessing
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from dds_registration.core.app.cache import SQLiteCache
+
+
+def count_in_process(path, times):
+    cache = SQLiteCache(path, {})
+    for _ in range(times):
+        cache.incr("counter")
+
+
+class SQLiteCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.path = str(Path(tempfile.mkdtemp(prefix="dds-cache-test-")) / "cache.sqlite3")
+        self.cache = SQLiteCache(self.path, {})
+
+    def test_operations(self):
+        cache = self.cache
+        cache.set("key", {"value": [1, 2]})
+        self.assertEqual(cache.get("key"), {"value": [1, 2]})
+        self.assertFalse(cache.add("key", "other"))
+        self.assertTrue(cache.add("new", 1))
+        self.assertEqual(cache.incr("new", 2), 3)
+        self.assertEqual(cache.decr("new"), 2)
+        with self.assertRaises(ValueError):
+            cache.incr("missing")
+        self.assertEqual(cache.get_many(["key", "new", "missing"]), {"key": {"value": [1, 2]}, "new": 2})
+        self.assertTrue(cache.delete("key"))
+        self.assertFalse(cache.has_key("key"))
+        cache.delete_many(["new"])
+        self.assertIsNone(cache.get("new"))
+
+    def test_expiry(self):
+        cache = self.cache
+        cache.set("short", 1, timeout=0.05)
+        cache.set("forever", 1, timeout=None)
+        self.assertTrue(cache.add("added", 1, timeout=0.05))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("forever"), 1)
+        self.assertTrue(cache.add("added", 2), "An expired entry can be added again")
+        self.assertTrue(cache.touch("forever", 0.05))
+        time.sleep(0.1)
+        self.assertFalse(cache.has_key("forever"))
+
+    def test_shared_between_processes(self):
+        self.cache.set("counter", 0)
+        processes = [
+            multiprocessing.get_context("fork").Process(target=count_in_process, args=(self.path, 50)) for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertEqual(self.cache.get("counter"), 200)
+
+    def test_least_recently_used_are_culled(self):
+        cache = SQLiteCache(
+            self.path,
+            {"OPTIONS": {"MAX_ENTRIES": 4, "CULL_FREQUENCY": 2, "CULL_INTERVAL": 1, "ACCESS_RESOLUTION": 0}},
+        )
+        for n in range(4):
+            cache.set(n, n)
+            time.sleep(0.01)
+        cache.get(0)
+        cache.set(4, 4)
+        self.assertEqual(sorted(cache.get_many(range(5))), [0, 3, 4])
+
+    def test_stampede(self):
+        computed = []
+
+        def compute():
+            computed.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_set("slow", compute))) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ["value"] * 5)
+        self.assertEqual(len(computed), 1)
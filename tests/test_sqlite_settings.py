@@ -0,0 +1,42 @@
+"""The SQLite connection settings (`SQLITE_OPTIONS`) applied to a database file."""
+
+import tempfile
+
+from django.conf import settings
+from django.db import connections
+from django.test import SimpleTestCase
+
+
+class SQLiteSettingsTests(SimpleTestCase):
+    databases = {"tuned"}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        database = {**settings.SQLITE_DATABASE, "NAME": f"{cls.directory.name}/tuned.sqlite3"}
+        connections.settings["tuned"] = connections.configure_settings({"default": database})["default"]
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections["tuned"].close()
+        del connections.settings["tuned"]
+        cls.directory.cleanup()
+
+    def pragma(self, name):
+        with connections["tuned"].cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas(self):
+        self.assertEqual(self.pragma("journal_mode"), "wal")
+        self.assertEqual(self.pragma("synchronous"), 1)  # NORMAL
+        self.assertEqual(self.pragma("cache_size"), -65536)
+        self.assertEqual(self.pragma("busy_timeout"), 20000)
+
+    def test_persistent_connections(self):
+        connections["tuned"].ensure_connection()
+        self.assertTrue(connections["tuned"].settings_dict["CONN_HEALTH_CHECKS"])
+        self.assertGreater(connections["tuned"].settings_dict["CONN_MAX_AGE"], 0)
+        self.assertEqual(connections["tuned"].transaction_mode, "IMMEDIATE")
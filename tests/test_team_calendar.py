@@ -1,9 +1,17 @@
-"""Access-control tests for the private team calendar view."""
+"""Access-control and caching tests for the private team calendar view."""
+
+import gzip
+import os
+from importlib import import_module
+from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
 
+# The module: `dds_registration.views` exports the view under the same name
+team_calendar = import_module("dds_registration.views.team_calendar")
+
 
 class TeamCalendarAccessTests(TestCase):
     def test_anonymous_is_redirected_to_login(self):
@@ -21,3 +29,52 @@ class TeamCalendarAccessTests(TestCase):
         response = self.client.get(reverse("team_calendar"))
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"DdS Team Calendar", response.content)
+
+
+class TeamCalendarServingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="calserved", email="calserved@example.com")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def get(self, **headers):
+        return self.client.get(reverse("team_calendar"), headers=headers)
+
+    def test_served_verbatim(self):
+        response = self.get()
+        self.assertEqual(response.content, team_calendar.CALENDAR_HTML_PATH.read_bytes())
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_gzip(self):
+        with mock.patch.object(team_calendar, "CALENDAR_ENCODINGS", ["gzip"]):
+            response = self.get(accept_encoding="gzip, deflate")
+            self.assertEqual(response["Content-Encoding"], "gzip")
+            self.assertEqual(gzip.decompress(response.content), team_calendar.CALENDAR_HTML_PATH.read_bytes())
+            self.assertNotEqual(response["ETag"], self.get()["ETag"])
+            self.assertFalse(self.get(accept_encoding="gzip;q=0").has_header("Content-Encoding"))
+
+    def test_not_modified(self):
+        etag = self.get()["ETag"]
+        response = self.get(if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(self.get(if_none_match='"other"').status_code, 200)
+
+    def test_loaded_once_and_reloaded_when_changed(self):
+        self.get()
+        with mock.patch.object(team_calendar, "CalendarDocument", wraps=team_calendar.CalendarDocument) as load:
+            self.get()
+            load.assert_not_called()
+            stat = team_calendar.CALENDAR_HTML_PATH.stat()
+            try:
+                os.utime(team_calendar.CALENDAR_HTML_PATH, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+                self.get()
+            finally:
+                os.utime(team_calendar.CALENDAR_HTML_PATH, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            load.assert_called_once()
@@ -0,0 +1,62 @@
+"""Per-user summary cache behind the profile page and membership checks."""
+
+from django.test import TestCase
+
+from conftest import create_event
+from dds_registration.core.helpers.request_cache import request_cache_scope
+from dds_registration.models import Membership, Payment, Registration, User
+from dds_registration.views.helpers.profile import get_profile_context
+
+
+class UserSummaryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.event = create_event("summarized", title="Summarized")
+        cls.user = User.objects.create_user(username="summarized", email="summarized@example.com")
+
+    def test_cache_hit(self):
+        get_profile_context(self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_profile_context(self.user)["active_regs"], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            Registration.objects.create(event=self.event, user=self.user, status="REGISTERED")
+        get_profile_context(self.user)
+        # Only the participant counts are read again
+        with self.assertNumQueries(1):
+            self.assertEqual(len(get_profile_context(self.user)["active_regs"]), 1)
+
+    def test_participants_are_read_fresh(self):
+        Registration.objects.create(event=self.event, user=self.user, status="REGISTERED")
+        get_profile_context(self.user)
+        other = User.objects.create_user(username="other", email="other@example.com")
+        with self.captureOnCommitCallbacks(execute=True):
+            Registration.objects.create(event=self.event, user=other, status="REGISTERED")
+        self.assertEqual(get_profile_context(self.user)["active_regs"][0]["participants"], 2)
+
+    def test_registration_changes(self):
+        get_profile_context(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            registration = Registration.objects.create(event=self.event, user=self.user, status="REGISTERED")
+        self.assertEqual(get_profile_context(self.user)["active_regs"][0]["participants"], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            registration.status = "WITHDRAWN"
+            registration.save()
+        self.assertEqual(get_profile_context(self.user)["active_regs"], [])
+
+    def test_payment_changes(self):
+        payment = Payment.objects.create(status="ISSUED", data={"user": {"id": self.user.id}})
+        Registration.objects.create(event=self.event, user=self.user, payment=payment, status="REGISTERED")
+        self.assertEqual(get_profile_context(self.user)["active_regs"][0]["payment"].status, "ISSUED")
+        with self.captureOnCommitCallbacks(execute=True):
+            payment.status = "PAID"
+            payment.save()
+        self.assertEqual(get_profile_context(self.user)["active_regs"][0]["payment"].status, "PAID")
+
+    def test_membership_changes(self):
+        self.assertFalse(self.user.is_member)
+        with self.captureOnCommitCallbacks(execute=True):
+            Membership.objects.create(user=self.user)
+        with request_cache_scope():
+            self.assertTrue(self.user.is_member)
+            with self.assertNumQueries(0):
+                self.assertTrue(get_profile_context(self.user)["is_member"])
@@ -0,0 +1,89 @@
+"""Admission queue in front of the registration form of busy events."""
+
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from conftest import create_event
+from dds_registration.models import Registration, User
+from dds_registration.views.helpers.waiting_room import (
+    WAITING_ROOM_ARRIVAL,
+    WaitingRoom,
+)
+
+
+class WaitingRoomTests(TestCase):
+    def setUp(self):
+        self.event = create_event("queued", waiting_room_size=2, free=True)
+        self.room = WaitingRoom(self.event)
+
+    def test_admits_in_order_up_to_the_size(self):
+        first, second, third = self.room.join(), self.room.join(), self.room.join()
+        self.assertEqual(self.room.poll(third), (False, 0))
+        self.assertEqual(self.room.poll(first), (True, 0))
+        self.assertEqual(self.room.poll(second), (True, 0))
+        self.room.leave(first)
+        self.assertEqual(self.room.poll(third), (True, 0))
+
+    def test_reports_people_ahead(self):
+        tickets = [self.room.join() for _ in range(5)]
+        self.assertEqual(self.room.poll(tickets[-1]), (False, 2))
+
+    def test_skips_abandoned_tickets(self):
+        first, second, abandoned, waiting = [self.room.join() for _ in range(4)]
+        self.room.poll(first)
+        cache.delete(f"{self.room.seen_prefix}{abandoned}")
+        self.room.leave(first)
+        self.room.leave(second)
+        self.assertEqual(self.room.poll(waiting), (True, 0))
+
+    def test_expired_leases_free_the_room(self):
+        first, second, third = self.room.join(), self.room.join(), self.room.join()
+        self.room.poll(first)
+        with mock.patch("time.time", return_value=time.time() + WAITING_ROOM_ARRIVAL + 1):
+            self.assertEqual(self.room.poll(third), (True, 0))
+
+
+class WaitingRoomViewTests(TestCase):
+    def setUp(self):
+        self.event = create_event("busy", waiting_room_size=1, free=True)
+        self.users = [User.objects.create_user(username=f"queued{n}", email=f"queued{n}@example.com") for n in range(2)]
+        self.clients = [Client(), Client()]
+        for client, user in zip(self.clients, self.users):
+            client.force_login(user)
+        self.registration_url = reverse("event_registration", args=(self.event.code,))
+        self.status_url = reverse("event_waiting_room_status", args=(self.event.code,))
+
+    def test_queue(self):
+        first, second = self.clients
+        self.assertEqual(first.get(self.registration_url).status_code, 200)
+
+        response = second.get(self.registration_url)
+        self.assertRedirects(
+            response, reverse("event_waiting_room", args=(self.event.code,)), fetch_redirect_response=False
+        )
+        page = second.get(response["Location"])
+        self.assertContains(page, "You are in the queue")
+        self.assertEqual(second.get(self.status_url).json(), {"admitted": False, "ahead": 0, "poll": 5})
+
+        # Once registered, the first registrant's place goes to the next one
+        Registration.objects.create(event=self.event, user=self.users[0], status="REGISTERED")
+        response = first.get(self.registration_url)
+        self.assertEqual(response.cookies[f"waiting_room_{self.event.code}"].value, "")
+        self.assertTrue(second.get(self.status_url).json()["admitted"])
+        self.assertEqual(second.get(self.registration_url).status_code, 200)
+
+    def test_forged_ticket_is_ignored(self):
+        self.clients[0].get(self.registration_url)
+        second = self.clients[1]
+        second.cookies[f"waiting_room_{self.event.code}"] = "1"
+        self.assertEqual(second.get(self.registration_url).status_code, 302)
+
+    def test_events_without_waiting_room(self):
+        event = create_event("quiet", free=True)
+        for client in self.clients:
+            self.assertEqual(client.get(reverse("event_registration", args=(event.code,))).status_code, 200)
+        self.assertEqual(self.clients[0].get(reverse("event_waiting_room", args=(event.code,))).status_code, 404)